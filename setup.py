@@ -71,12 +71,51 @@ class CreateSymlink(Command):
             self.outputs.append(link)
 
 
+class CompileSpecs(Command):
+    def __init__(self, dist, **kwargs):
+        Command.__init__(self, dist, **kwargs)
+        self.install_purelib = None
+        self.outputs = []
+
+    def finalize_options(self):
+        pass
+
+    def get_outputs(self):
+        return self.outputs
+
+    def initialize_options(self):
+        pass
+
+    def run(self):
+        # We compile in a separate process, from the install directory, so that we import the installed slim package
+        # and write the bundle next to the installed conf-spec files
+
+        configuration_spec_path = path.join(
+            self.install_purelib, "slim", "config", "conf-specs"
+        )
+        script = (
+            "import sys; "
+            "from slim.app import AppConfigurationSpecBundle; "
+            "AppConfigurationSpecBundle.compile(sys.argv[1])"
+        )
+        current_directory = os.getcwd()
+        os.chdir(self.install_purelib)
+        try:
+            self.spawn([sys.executable, "-c", script, configuration_spec_path])
+        finally:
+            os.chdir(current_directory)
+        self.outputs.append(path.join(configuration_spec_path, "conf-specs.bundle"))
+
+
 class Install(install):
     def __init__(self, dist):
         self._should_create_symlink = None
         install.__init__(self, dist)
 
     def run(self):
+        self.distribution.command_options["compile_specs"] = {
+            "install_purelib": ("install command", self.install_purelib),
+        }
         if self.should_create_symlink():
             self.distribution.command_options["create_symlink"] = {
                 "install_purelib": ("install command", self.install_purelib),
@@ -105,7 +144,10 @@ class Install(install):
             )
         return value
 
-    new_commands = [("create_symlink", should_create_symlink)]
+    new_commands = [
+        ("compile_specs", lambda self: True),
+        ("create_symlink", should_create_symlink),
+    ]
 
     # Lambda required in Python 3 to workaround "Names in class scope are not accessible"
     # https://stackoverflow.com/questions/13905741/accessing-class-variables-from-a-list-comprehension-in-the-class-definition
@@ -151,5 +193,9 @@ setup(
     },
     data_files=[("", ["LICENSE"])],
     install_requires=["semantic_version>=2.5.0", "future>=0.18.2"],
-    cmdclass={"install": Install, "create_symlink": CreateSymlink},
+    cmdclass={
+        "install": Install,
+        "compile_specs": CompileSpecs,
+        "create_symlink": CreateSymlink,
+    },
 )
@@ -8,7 +8,7 @@ import sys
 from argparse import RawDescriptionHelpFormatter
 
 from slim.command import SlimArgumentParser
-from slim.utils import SlimLogger
+from slim.utils import SlimLogger, slim_configuration
 from slim import program, version
 
 
@@ -23,6 +23,10 @@ def main(argv=None):
 
     args = argument_parser.parse_args(argv[1:])
 
+    # No command saves the conf or conf-spec files it loads and so there's no need to keep their layout or
+    # documentation
+    slim_configuration.lean_parsing = True
+
     SlimLogger.set_command_name(args.command_name)
     args.invoke_command(args)
 
@@ -45,6 +49,11 @@ def new_argument_parser():
         action="set_quiet",
         help="suppress all messages except error messages",
     )
+    parser.add_argument(
+        "--no-validation-cache",
+        action="set_no_validation_cache",
+        help="validate app source packages even when the outcome of validating them is cached",
+    )
 
     command_parsers = parser.add_subparsers(title=program + " commands")
     command_parsers.required = False
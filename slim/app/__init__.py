@@ -17,6 +17,8 @@ from ._configuration_spec import (
     AppConfigurationSpec,
     AppConfigurationStanzaDeclaration,
 )
+from ._configuration_spec_bundle import AppConfigurationSpecBundle
+from ._configuration_spec_registry import AppConfigurationSpecRegistry
 from ._configuration_validation_plugin import AppConfigurationValidationPlugin
 from ._configuration_validator import AppConfigurationValidator
 from ._deployment import (
@@ -29,6 +31,7 @@ from ._installation import (
     AppInstallationAction,
     AppInstallationDependency,
     AppInstallationGraph,
+    AppInstallationInterns,
 )
 from ._manifest import (
     AppCommonInformationModelInfo,
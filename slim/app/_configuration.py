@@ -1,17 +1,28 @@
 # coding=utf-8
 from __future__ import absolute_import, division, print_function, unicode_literals
+from array import array
 from builtins import object
 from collections import OrderedDict
 from glob import glob
 from itertools import chain
+from multiprocessing import Pool
 from os import path
 
 import io
+import logging
 
+from ._configuration_spec import AppConfigurationPlacement
+from ._configuration_spec_bundle import AppConfigurationSpecBundle
 from ._configuration_validator import AppConfigurationValidator
-from ._internal import FileBuffer, NamedObject, ObjectView
-from ..utils import SlimLogger, encode_string
-from ..utils.internal import string
+from ._internal import (
+    FileBuffer,
+    FilePosition,
+    NamedObject,
+    ObjectView,
+    PersistentCache,
+)
+from ..utils import SlimLogger, encode_string, slim_configuration
+from ..utils.internal import get_file_signature, hash_object, string
 
 
 #
@@ -47,6 +58,9 @@ The app_configuration_spec module defines this class hierarchy:
                                     ├-> position: FilePosition
                                     |
                                     └-> placement: AppConfigurationPlacement
+
+Files, stanzas, and settings are lightweight views over an `_AppConfigurationStore` that holds the content of all of
+the conf files in an app in columns of interned strings and machine integers.
 """  # pylint: disable=pointless-string-statement
 
 
@@ -54,7 +68,10 @@ class AppConfiguration(object):
     def __init__(self, app_root):
         """Create an AppConfiguration object that holds the results from parse conf."""
         self._app_root = app_root
+        self._filenames = None
         self._files = None
+        self._signatures = None
+        self._store = _AppConfigurationStore()
 
     # region Special methods
 
@@ -70,6 +87,7 @@ class AppConfiguration(object):
         return self._app_root
 
     def files(self):
+        self._load_all()
         files = self._files
         return (files[name] for name in files)
 
@@ -77,7 +95,7 @@ class AppConfiguration(object):
         if stanza is None and setting is not None:
             raise ValueError("Expected setting to be None because stanza is None")
         try:
-            file = self._files[file]
+            file = self._get_file(file)
         except KeyError:
             value = None
         else:
@@ -88,22 +106,33 @@ class AppConfiguration(object):
         self, file, stanza, setting, default=None
     ):  # pylint: disable=redefined-builtin
         try:
-            file = self._files[file]
+            file = self._get_file(file)
         except KeyError:
             value = _default_value(setting, default)[0]
         else:
             value = file.get_value(stanza, setting, default)
         return value
 
+    def get_loaded_names(self):
+        """Returns the names of the configuration files that have been loaded so far
+
+        :rtype: list
+
+        """
+        files = self._files
+        return [name for name in files if files[name] is not None]
+
     def has(self, file, stanza=None, setting=None):  # pylint: disable=redefined-builtin
         if stanza is None and setting is not None:
             raise ValueError("Expected setting to be None because stanza is None")
+        if stanza is None:
+            return file in self._files
         try:
-            file = self._files[file]
+            file = self._get_file(file)
         except KeyError:
             value = False
         else:
-            value = True if stanza is None else file.has(stanza, setting)
+            value = file.has(stanza, setting)
         return value
 
     # endregion
@@ -111,12 +140,70 @@ class AppConfiguration(object):
     # region Methods
 
     @classmethod
-    def load(cls, app_root):
+    def load(cls, app_root, lazy=False):
+        """Loads the configuration files in the `default` and `local` directories of an app
+
+        :param app_root: App root directory name.
+        :type app_root: string
+
+        :param lazy: :const:`True`, if each configuration file should be parsed and validated on first access. By
+        default all configuration files are parsed and validated before this method returns. Iterating over
+        :meth:`files`, calling :meth:`to_dict`, or calling :meth:`save` loads any configuration file that has not yet
+        been accessed.
+        :type lazy: bool
+
+        When more than one configuration file is loaded at once and `slim_configuration.parse_worker_count` is greater
+        than one, configuration files are parsed by a pool of worker processes. Messages are logged in the same order
+        as they would be, were the configuration files parsed one after another in the current process.
+
+        :return: App configuration.
+        :rtype: AppConfiguration
+
+        """
         # TODO: find the right place to validate that the app_root is a directory that contains an app  (here?)
         configuration = cls(app_root)
-        configuration._load()  # pylint: disable=protected-access
+        configuration._load(lazy)  # pylint: disable=protected-access
         return configuration
 
+    # pylint: disable=protected-access
+    # noinspection PyProtectedMember
+    def refresh(self, names=()):
+        """Drops the configuration files that changed on disk since they were loaded
+
+        A configuration file changes when any of its conf files in the `default` and `local` directories or its
+        app-local conf-spec file, `README/<name>.conf.spec`, is added, removed, or modified. Changes are detected by
+        file modification time and size. Added and changed configuration files are loaded on next access. The rows of
+        dropped configuration files remain in the store until the current app configuration is released.
+
+        :param names: Names of configuration files to drop whether or not they changed.
+        :type names: iterable
+
+        :return: Names of the configuration files that were added, changed, removed, or dropped on request.
+        :rtype: list
+
+        """
+        filenames = self._find_filenames()
+        signatures = self._get_signatures(filenames)
+        previous = self._signatures
+        names = set(names)
+
+        changed = [
+            name
+            for name in filenames
+            if name in names or previous.get(name) != signatures[name]
+        ]
+        changed.extend(name for name in previous if name not in signatures)
+
+        files = self._files
+        dropped = set(changed)
+
+        self._filenames = filenames
+        self._files = OrderedDict(
+            ((name, None if name in dropped else files.get(name)) for name in filenames)
+        )
+        self._signatures = signatures
+        return changed
+
     def save(self, file, indent=False):  # pylint: disable=redefined-builtin
         if isinstance(file, string):
             with io.open(file, encoding="utf-8", mode="w", newline="") as ostream:
@@ -125,6 +212,7 @@ class AppConfiguration(object):
         self._save(file, indent)
 
     def to_dict(self):
+        self._load_all()
         files = self._files
         value = OrderedDict(
             ((name, files[name]) for name in files)
@@ -135,7 +223,26 @@ class AppConfiguration(object):
 
     # region Protected
 
-    def _load(self):
+    def _get_file(self, name):
+        """Returns the named configuration file, loading it on first access
+
+        :raises KeyError: There is no configuration file with the given `name`.
+
+        """
+        files = self._files
+        configuration_file = files[name]
+        if configuration_file is None:
+            configuration_file = files[name] = AppConfigurationFile(name, self._store)
+            recording = SlimLogger.start_recording()
+            try:
+                with AppConfigurationValidator(name, self._app_root) as validator:
+                    for filename in self._filenames[name]:
+                        configuration_file.load(filename, validator)
+            finally:
+                configuration_file._messages = SlimLogger.stop_recording(recording)
+        return configuration_file
+
+    def _find_filenames(self):
 
         app_root = self._app_root
         basename = path.basename
@@ -160,16 +267,96 @@ class AppConfiguration(object):
                 filenames.append(filename)
             configurations[name] = filenames
 
-        files = OrderedDict()
+        return configurations
 
-        for name in configurations:
-            configuration_file = AppConfigurationFile(name)
-            with AppConfigurationValidator(name, app_root) as validator:
-                for filename in configurations[name]:
-                    configuration_file.load(filename, validator)
-            files[name] = configuration_file
+    def _get_signatures(self, filenames):
+        """Returns the modification time and size of the files that make up each of the named configuration files"""
+        readme = path.join(self._app_root, "README")
+        return {
+            name: tuple(
+                get_file_signature(filename)
+                for filename in chain(
+                    filenames[name], (path.join(readme, name + ".conf.spec"),)
+                )
+            )
+            for name in filenames
+        }
 
-        self._files = files
+    def _load(self, lazy):
+
+        configurations = self._find_filenames()
+
+        self._filenames = configurations
+        self._files = OrderedDict(((name, None) for name in configurations))
+        self._signatures = self._get_signatures(configurations)
+
+        if not lazy:
+            self._load_all()
+
+    def _load_all(self):
+
+        files = self._files
+        names = [name for name in files if files[name] is None]
+        worker_count = min(slim_configuration.parse_worker_count, len(names))
+
+        if worker_count > 1:
+            try:
+                self._load_parallel(names, worker_count)
+            except OSError as error:
+                SlimLogger.debug(
+                    "Parsing configuration files serially: ", error.strerror
+                )
+
+        for name in names:
+            self._get_file(name)
+
+    # pylint: disable=protected-access
+    # noinspection PyProtectedMember
+    def _load_parallel(self, names, worker_count):
+        """Loads the named configuration files using a pool of worker processes
+
+        Workers record the messages they log. Here we replay them, file by file, in the order given by `names`. A
+        configuration file that a worker could not load is loaded in the current process instead, in its turn.
+
+        """
+        # Any message about the conf-spec bundle is logged once by the current process, not once by each worker
+        AppConfigurationSpecBundle.get(slim_configuration.configuration_spec_path)
+
+        app_root = self._app_root
+        filenames = self._filenames
+        files = self._files
+        store = self._store
+
+        pool = Pool(worker_count, _initialize_worker)
+
+        try:
+            values = pool.imap(
+                _load_configuration_file,
+                [(name, app_root, filenames[name]) for name in names],
+            )
+            for name, value in zip(names, values):
+                if value is None:
+                    self._get_file(name)
+                    continue
+                messages, sections = value
+                configuration_file = AppConfigurationFile(name, store)
+                recording = SlimLogger.start_recording()
+                try:
+                    for level, args in messages:
+                        SlimLogger.message(level, *args)
+                    for filename, snapshot in sections:
+                        file_buffer = _AppConfigurationFileBuffer(filename, store)
+                        file_buffer._restore(snapshot)
+                        configuration_file._add(
+                            AppConfigurationFile.Section(file_buffer)
+                        )
+                finally:
+                    configuration_file._messages = SlimLogger.stop_recording(recording)
+                files[name] = configuration_file
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
 
     def _save(self, ostream, indent):
         iterencode = (
@@ -183,10 +370,12 @@ class AppConfiguration(object):
 
 
 class AppConfigurationFile(NamedObject):
-    def __init__(self, name):
+    def __init__(self, name, store=None):
         NamedObject.__init__(self, name)
+        self._messages = []
         self._sections = OrderedDict()
         self._stanzas = OrderedDict()
+        self._store = _AppConfigurationStore() if store is None else store
 
     # region Special methods
 
@@ -205,6 +394,19 @@ class AppConfigurationFile(NamedObject):
 
     # endregion
 
+    # region Properties
+
+    @property
+    def messages(self):
+        """Messages logged while an :class:`AppConfiguration` loaded the current configuration file
+
+        Each message is a tuple of the form `(level, args)` that can be replayed using :meth:`SlimLogger.message`.
+
+        """
+        return self._messages
+
+    # endregion
+
     # region Accessors
 
     def get(self, stanza, setting=None):
@@ -247,8 +449,20 @@ class AppConfigurationFile(NamedObject):
     # region Methods
 
     def load(self, filename, validator):
+        self._add(AppConfigurationFile.Section.load(filename, validator, self._store))
+
+    def to_dict(self):
+        sections = self._sections
+        return OrderedDict(
+            ((name, sections[name]) for name in sections)
+        )  # copying protects our internals
+
+    # endregion
+
+    # region Protected
+
+    def _add(self, section):
 
-        section = AppConfigurationFile.Section.load(filename, validator)
         stanzas = self._stanzas
 
         for section_stanza in section.stanzas():
@@ -260,13 +474,7 @@ class AppConfigurationFile(NamedObject):
                 stanzas[name] = stanza
             stanza.add(section_stanza)
 
-        self._sections[filename] = section
-
-    def to_dict(self):
-        sections = self._sections
-        return OrderedDict(
-            ((name, sections[name]) for name in sections)
-        )  # copying protects our internals
+        self._sections[section.name] = section
 
     # endregion
 
@@ -309,8 +517,8 @@ class AppConfigurationFile(NamedObject):
         # region Methods
 
         @classmethod
-        def load(cls, filename, validator):
-            file_buffer = _AppConfigurationFileBuffer(filename)
+        def load(cls, filename, validator, store=None):
+            file_buffer = _AppConfigurationFileBuffer(filename, store)
             file_buffer.load(validator=validator)
             return cls(file_buffer)
 
@@ -329,10 +537,17 @@ class AppConfigurationFile(NamedObject):
 
 
 class AppConfigurationSetting(NamedObject):
-    def __init__(self, name):
-        NamedObject.__init__(self, name)
-        self._sections = OrderedDict()
-        self._setting = None
+    """Presents the value of a setting across the sections of an :class:`AppConfigurationStanza`
+
+    The value of a setting is that of its last-in section.
+
+    """
+
+    __slots__ = ("_setting",)
+
+    def __init__(self, setting):
+        NamedObject.__init__(self, setting.name)
+        self._setting = setting
 
     # region Special methods
 
@@ -394,35 +609,29 @@ class AppConfigurationSetting(NamedObject):
 
     # region Methods
 
-    def add(self, section):
-        self._sections[
-            section.name
-        ] = self._setting = section  # last-in section holds the value of this setting
-
     def to_dict(self):
         return self._setting.to_dict()
 
     # endregion
 
     class Section(NamedObject):
-        def __init__(self, name, value, position, placement=None):
+        """Presents a row of the setting columns of an app configuration store"""
+
+        __slots__ = ("_store", "_row")
 
-            NamedObject.__init__(self, name)
-            self._placement = placement
-            self._position = position
-            self._value = "" if value is None else value.strip()
+        def __init__(self, store, row):
+            NamedObject.__init__(self, store.setting_names[row])
+            self._store = store
+            self._row = row
 
         # region Special methods
 
         def __repr__(self):
-            property_names = self._property_names
-            arguments = (
-                n + "=" + repr(getattr(self, property_names[n])) for n in property_names
-            )
+            arguments = (n + "=" + repr(getattr(self, n)) for n in self._property_names)
             return self.__class__.__name__ + "(" + ", ".join(arguments) + ")"
 
         def __str__(self):
-            return self._name + " = " + string(self._value).replace("\n", "\\\n")
+            return self._name + " = " + string(self.value).replace("\n", "\\\n")
 
         # endregion
 
@@ -430,15 +639,19 @@ class AppConfigurationSetting(NamedObject):
 
         @property
         def position(self):
-            return self._position
+            store, row = self._store, self._row
+            return FilePosition(
+                store.filenames[store.setting_files[row]], store.setting_lines[row]
+            )
 
         @property
         def placement(self):
-            return self._placement
+            store = self._store
+            return store.placements[store.setting_placements[self._row]]
 
         @property
         def value(self):
-            return self._value
+            return self._store.setting_values[self._row]
 
         # endregion
 
@@ -447,9 +660,9 @@ class AppConfigurationSetting(NamedObject):
         def to_dict(self):
             return OrderedDict(
                 (
-                    ("value", self._value),
-                    ("placement", self._placement),
-                    ("line", self._position.line),
+                    ("value", self.value),
+                    ("placement", self.placement),
+                    ("line", self._store.setting_lines[self._row]),
                 )
             )
 
@@ -457,9 +670,14 @@ class AppConfigurationSetting(NamedObject):
 
         # region Protected
 
-        _property_names = OrderedDict(
-            ((name, "_" + name) for name in ("name", "value", "placement", "position"))
-        )
+        _property_names = ("name", "value", "placement", "position")
+
+        def _set_placement(self, placement):
+            store = self._store
+            store.setting_placements[self._row] = store.get_placement_id(placement)
+
+        def _set_value(self, value):
+            self._store.setting_values[self._row] = value
 
         # endregion
         pass  # pylint: disable=unnecessary-pass
@@ -468,11 +686,15 @@ class AppConfigurationSetting(NamedObject):
 
 
 class AppConfigurationStanza(NamedObject):
+
+    __slots__ = ("_index", "_placement", "_rows", "_sections", "_store")
+
     def __init__(self, name):
         NamedObject.__init__(self, name)
-        self._sections = OrderedDict()
-        self._settings = OrderedDict()
-        self._placement = None
+        self._index = self._placement = self._store = None
+        # last-in setting rows in the order that setting names were first seen
+        self._rows = array(str("i"))
+        self._sections = []
 
     # region Special methods
 
@@ -482,7 +704,7 @@ class AppConfigurationStanza(NamedObject):
             + "(name="
             + repr(self._name)
             + ", settings="
-            + repr(self._settings)
+            + repr(OrderedDict((s.name, s) for s in self.settings()))
             + ")"
         )
 
@@ -501,24 +723,30 @@ class AppConfigurationStanza(NamedObject):
 
     # region Accessors
 
+    # pylint: disable=protected-access
+    # noinspection PyProtectedMember
     def add(self, section):
 
-        settings = self._settings
+        store = self._store = section._store
+        names = store.setting_names
+        rows = self._rows
+        index = {names[row]: i for i, row in enumerate(rows)}
 
-        for section_setting in section.settings():
+        for row in section._rows:
+            name = names[row]
             try:
-                setting = settings[section_setting.name]
+                rows[index[name]] = row
             except KeyError:
-                setting = AppConfigurationSetting(section_setting.name)
-                settings[setting.name] = setting
-            setting.add(section_setting)
+                index[name] = len(rows)
+                rows.append(row)
 
         assert self._placement is None or self._placement == section.placement
-        self._sections[section.position.file] = section
+        self._sections.append(section)
         self._placement = section.placement
+        self._index = None
 
     def get(self, setting):
-        get = self._settings.get
+        get = self._get
         if isinstance(setting, tuple):
             item = tuple((get(name) for name in setting))
         else:
@@ -528,49 +756,72 @@ class AppConfigurationStanza(NamedObject):
     def get_value(self, setting, default=None):
 
         default, is_tuple = _default_value(setting, default)
+        get = self._get
 
         if is_tuple is True:
             value = [None] * len(setting)
             for i, name in enumerate(setting):
-                try:
-                    value[i] = self._settings[name].value
-                except KeyError:
-                    value[i] = default[i]
+                item = get(name)
+                value[i] = default[i] if item is None else item.value
             value = tuple(value)
         else:
-            name = setting
-            try:
-                value = self._settings[name].value
-            except KeyError:
-                value = default
+            item = get(setting)
+            value = default if item is None else item.value
 
         return value
 
     def has(self, setting):
-        return setting in self._settings
+        return self._get(setting) is not None
 
     def settings(self):
-        settings = self._settings
-        return (settings[name] for name in settings)
+        store = self._store
+        return (
+            AppConfigurationSetting(AppConfigurationSetting.Section(store, row))
+            for row in self._rows
+        )
 
     # endregion
 
     # region Methods
 
     def to_dict(self):
-        settings = self._settings
         OrderedDict(
-            (name, settings[name]) for name in self._settings
+            (setting.name, setting) for setting in self.settings()
         )  # copying protects our internals
 
     # endregion
 
+    # region Protected
+
+    def _get(self, name):
+        # The name index is built on first lookup; hence stanzas that are never looked into cost only their rows
+        rows = self._rows
+        if len(rows) == 0:
+            return None
+        index = self._index
+        if index is None:
+            names = self._store.setting_names
+            index = self._index = {names[row]: row for row in rows}
+        row = index.get(name)
+        if row is None:
+            return None
+        return AppConfigurationSetting(
+            AppConfigurationSetting.Section(self._store, row)
+        )
+
+    # endregion
+
     class Section(NamedObject):
-        def __init__(self, name, placement, position):
-            NamedObject.__init__(self, name)
-            self._settings = OrderedDict()
-            self._placement = placement
-            self._position = position
+        """Presents a row of the stanza columns of an app configuration store and the settings it holds"""
+
+        __slots__ = ("_index", "_row", "_rows", "_store")
+
+        def __init__(self, store, row):
+            NamedObject.__init__(self, store.stanza_names[row])
+            self._store = store
+            self._row = row
+            self._rows = array(str("i"))
+            self._index = None
 
         # region Special methods
 
@@ -580,7 +831,7 @@ class AppConfigurationStanza(NamedObject):
                 + "(name="
                 + repr(self._name)
                 + ", position="
-                + repr(self._position)
+                + repr(self.position)
                 + ")"
             )
 
@@ -593,40 +844,79 @@ class AppConfigurationStanza(NamedObject):
 
         @property
         def placement(self):
-            return self._placement
+            store = self._store
+            return store.placements[store.stanza_placements[self._row]]
 
         @property
         def position(self):
-            return self._position
+            store, row = self._store, self._row
+            return FilePosition(
+                store.filenames[store.stanza_files[row]], store.stanza_lines[row]
+            )
 
         # endregion
 
         # region Methods
 
+        # pylint: disable=protected-access
+        # noinspection PyProtectedMember
         def add(self, setting):
-            self._settings[setting.name] = setting
+            self._add(setting._row)
 
         def get(self, name):
-            return self._settings.get(name)
+            row = self._find(name)
+            if row is None:
+                return None
+            return AppConfigurationSetting.Section(self._store, row)
 
         def get_value(self, name, default=None):
-            try:
-                setting = self._settings[name]
-            except KeyError:
-                value = default
-            else:
-                value = setting.name
-            return value
+            row = self._find(name)
+            return default if row is None else self._store.setting_names[row]
 
         def settings(self):
-            settings = self._settings
-            return (settings[name] for name in settings)
+            store = self._store
+            return (AppConfigurationSetting.Section(store, row) for row in self._rows)
 
         def to_dict(self):
             return OrderedDict(
                 (setting.name, setting) for setting in self.settings()
             )  # copying protects our internals
 
+        # endregion
+
+        # region Protected
+
+        def _add(self, row):
+            """Adds a setting row to the current stanza, replacing any setting row with the same name"""
+            rows = self._rows
+            index = self._get_index()
+            name = self._store.setting_names[row]
+            try:
+                rows[index[name]] = row
+            except KeyError:
+                index[name] = len(rows)
+                rows.append(row)
+
+        def _find(self, name):
+            i = self._get_index().get(name)
+            return None if i is None else self._rows[i]
+
+        def _get_index(self):
+            """Returns the index of the setting rows of the current stanza by setting name, building it on demand"""
+            index = self._index
+            if index is None:
+                names = self._store.setting_names
+                index = self._index = {names[r]: i for i, r in enumerate(self._rows)}
+            return index
+
+        def _trim(self):
+            """Releases the index used to replace namesake settings while the current stanza is loaded
+
+            Lookups rebuild it on demand.
+
+            """
+            self._index = None
+
         # endregion
         pass  # pylint: disable=unnecessary-pass
 
@@ -650,10 +940,60 @@ def _default_value(setting, default):
     return tuple(default), True
 
 
+def _initialize_worker():
+    # Workers record the messages they log for replay by the parent process; they do not log them
+    SlimLogger.set_level(logging.CRITICAL + 1)
+
+
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+def _load_configuration_file(task):
+    """Loads a configuration file in a worker process
+
+    :param task: Configuration file name, app root directory name, and the names of the conf files to load.
+    :type task: tuple
+
+    :return: The messages logged while constructing a validator for the configuration file and a snapshot of each of
+    its conf files or :const:`None`, if the configuration file could not be loaded.
+    :rtype: tuple
+
+    """
+    name, app_root, filenames = task
+
+    try:
+        recording = SlimLogger.start_recording()
+        try:
+            validator = AppConfigurationValidator(name, app_root)
+        finally:
+            SlimLogger.stop_recording(recording)
+
+        messages = [
+            (level, tuple(string(arg) for arg in args)) for level, args in recording
+        ]
+        sections = []
+
+        with validator:
+            for filename in filenames:
+                file_buffer = _AppConfigurationFileBuffer(filename)
+                recording = SlimLogger.start_recording()
+                try:
+                    file_buffer.load(validator=validator)
+                finally:
+                    SlimLogger.stop_recording(recording)
+                sections.append((filename, file_buffer._snapshot(recording)))
+
+    except (Exception, SystemExit):  # pylint: disable=broad-except
+        return None  # the parent process loads the configuration file and reports the failure
+
+    return messages, sections
+
+
 class _AppConfigurationFileBuffer(FileBuffer):
-    def __init__(self, filename):
-        FileBuffer.__init__(self, filename)
+    def __init__(self, filename, store=None, lean=None):
+        FileBuffer.__init__(self, filename, lean)
+        self._store = _AppConfigurationStore() if store is None else store
         self._stanzas = None
+        self._start = self._end = 0  # records of the current Buffer in its store
 
     # region Properties
 
@@ -663,8 +1003,53 @@ class _AppConfigurationFileBuffer(FileBuffer):
 
     # endregion
 
+    # region Methods
+
+    def load(self, **kwargs):
+        """Loads the conf file associated with the current Buffer, if possible from the parse cache
+
+        The parse cache is keyed by the content of the conf file, the digest of the configuration spec it is validated
+        against, and whether the current Buffer is lean. Messages logged while parsing are recorded with the parse results and replayed when they
+        are retrieved from the cache.
+
+        """
+        cache = PersistentCache.open("configurations")
+
+        if cache is None:
+            FileBuffer.load(self, **kwargs)
+            return
+
+        key = "\0".join(
+            (
+                self._format,
+                hash_object(self._filename),
+                kwargs["validator"].digest,
+                "lean" if self._lean else "full",
+            )
+        )
+        value = cache.get(key)
+
+        if value is not None:
+            self._restore(value)
+            return
+
+        recording = SlimLogger.start_recording()
+
+        try:
+            FileBuffer.load(self, **kwargs)
+        finally:
+            SlimLogger.stop_recording(recording)
+
+        cache.put(key, self._snapshot(recording))
+
+    # endregion
+
     # region Protected
 
+    _format = "1"  # increment when the structure produced by _AppConfigurationFileBuffer._snapshot changes
+
+    # pylint: disable=protected-access
+    # noinspection PyProtectedMember
     def _load(self, reader, **kwargs):
         """Loads or reloads the conf file associated with the current Buffer"""
         match_assignment_statement = self._match_assignment_statement
@@ -672,8 +1057,14 @@ class _AppConfigurationFileBuffer(FileBuffer):
         self._stanzas = stanzas = OrderedDict()
         validator = kwargs["validator"]
 
+        store = self._store
+        add_record = store.add_record
+        file_id = store.get_file_id(self._filename)
+        self._start = len(store.record_kinds)
+
         current_stanza = None
         validate_setting = None
+        lean = self._lean
 
         for line in reader:
             try:
@@ -681,11 +1072,19 @@ class _AppConfigurationFileBuffer(FileBuffer):
                 start = match.end()
                 if start >= len(line):
                     # blank line
-                    item = "\n"
-                    start = 0
+                    if not lean:
+                        add_record(
+                            store.TEXT, store.add_text("\n"), reader.line_number, 0
+                        )
                 elif line[start] in ";#":
                     # comment
-                    item = line[start:]
+                    if not lean:
+                        add_record(
+                            store.TEXT,
+                            store.add_text(line[start:]),
+                            reader.line_number,
+                            start,
+                        )
                 else:
                     line = reader.read_continuation(line)
                     if line[start] == "[":
@@ -693,13 +1092,18 @@ class _AppConfigurationFileBuffer(FileBuffer):
                         item = self._parse_stanza(line, start, reader, validator)
                         validate_setting = validator.get(item)
                         item = current_stanza = stanzas.setdefault(item.name, item)
+                        add_record(store.STANZA, item._row, reader.line_number, start)
                     else:
                         if current_stanza is None:
                             # settings before a stanza get put into the [default] stanza
                             current_stanza = AppConfigurationStanza.Section(
-                                "default",
-                                validator.get_placement("default"),
-                                reader.position,
+                                store,
+                                store.add_stanza(
+                                    "default",
+                                    validator.get_placement("default"),
+                                    file_id,
+                                    reader.line_number,
+                                ),
                             )
                             validate_setting = validator.get(current_stanza)
                             stanzas["default"] = current_stanza
@@ -710,18 +1114,28 @@ class _AppConfigurationFileBuffer(FileBuffer):
                             raise self._Error(
                                 "Expected a setting assignment, not " + text
                             )
+                        value = match.group(2)
                         item = AppConfigurationSetting.Section(
-                            name=match.group(1),
-                            value=match.group(2),
-                            position=reader.position,
-                            placement=current_stanza.placement,
+                            store,
+                            store.add_setting(
+                                match.group(1),
+                                "" if value is None else value.strip(),
+                                current_stanza.placement,
+                                file_id,
+                                reader.line_number,
+                            ),
                         )
                         current_stanza.add(item)
                         validate_setting(item)
-                self._append(item, reader.position, indentation=start)
+                        add_record(store.SETTING, item._row, reader.line_number, start)
             except self._Error as error:
                 SlimLogger.error(reader.position, ": ", error)
 
+        for stanza in stanzas.values():
+            stanza._trim()
+
+        self._end = len(store.record_kinds)
+
     def _parse_stanza(self, line, start, reader, validator):
 
         start += 1
@@ -738,7 +1152,266 @@ class _AppConfigurationFileBuffer(FileBuffer):
 
         name = line[start:end]
         placement = validator.get_placement(name)
-        return AppConfigurationStanza.Section(name, placement, reader.position)
+        store = self._store
+        return AppConfigurationStanza.Section(
+            store,
+            store.add_stanza(
+                name, placement, store.get_file_id(reader.filename), reader.line_number
+            ),
+        )
+
+    # pylint: disable=protected-access
+    # noinspection PyProtectedMember
+    def _restore(self, value):
+        """Restores the state of the current Buffer from a value produced by :meth:`_snapshot`"""
+        default_stanza, records, messages = value
+        self._stanzas = stanzas = OrderedDict()
+        current_stanza = None
+
+        store = self._store
+        add_record, add_setting, add_stanza = (
+            store.add_record,
+            store.add_setting,
+            store.add_stanza,
+        )
+        setting, stanza, text = store.SETTING, store.STANZA, store.TEXT
+        file_id = store.get_file_id(self._filename)
+        self._start = len(store.record_kinds)
+        placements = {}
+
+        def get_placement(workloads):
+            # a conf file typically has only a handful of distinct placements; normalizing each of them once is enough
+            try:
+                return placements[workloads]
+            except KeyError:
+                placement = placements[workloads] = AppConfigurationPlacement(workloads)
+                return placement
+
+        if default_stanza is not None:
+            # settings before a stanza were put into the [default] stanza
+            workloads, line = default_stanza
+            current_stanza = AppConfigurationStanza.Section(
+                store, add_stanza("default", get_placement(workloads), file_id, line)
+            )
+            stanzas["default"] = current_stanza
+
+        for record in records:
+            line, column, item = record[0], record[1], record[2]
+            if len(record) == 4:
+                # stanza
+                current_stanza = stanzas.get(item)
+                if current_stanza is None:
+                    current_stanza = stanzas[item] = AppConfigurationStanza.Section(
+                        store, add_stanza(item, get_placement(record[3]), file_id, line)
+                    )
+                add_record(stanza, current_stanza._row, line, column)
+            elif len(record) == 5:
+                # setting
+                row = add_setting(
+                    item, record[3], get_placement(record[4]), file_id, line
+                )
+                current_stanza._add(row)
+                add_record(setting, row, line, column)
+            else:
+                add_record(text, store.add_text(item), line, column)
+
+        for current_stanza in stanzas.values():
+            current_stanza._trim()
+
+        self._end = len(store.record_kinds)
+        filename = self._filename
+
+        for level, args in messages:
+            SlimLogger.message(
+                level,
+                *(
+                    FilePosition(filename, arg) if isinstance(arg, int) else arg
+                    for arg in args
+                )
+            )
+
+    def _save(self, ostream):
+        store = self._store
+        kinds, items, columns = (
+            store.record_kinds,
+            store.record_items,
+            store.record_columns,
+        )
+        for i in range(self._start, self._end):
+            kind, item = kinds[i], items[i]
+            if kind == store.TEXT:
+                indentation = columns[i]
+                if indentation > 0:
+                    ostream.write(" " * indentation)
+                ostream.write(store.texts[item])
+            else:
+                if kind == store.STANZA:
+                    item = AppConfigurationStanza.Section(store, item)
+                else:
+                    item = AppConfigurationSetting.Section(store, item)
+                ostream.write(string(item))
+                ostream.write("\n")
+
+    # pylint: disable=protected-access
+    # noinspection PyProtectedMember
+    def _snapshot(self, recording):
+        """Returns a picklable value from which the state of the current Buffer can be restored
+
+        Records are saved as tuples of the form `(line, column, text)` for blank lines and comments,
+        `(line, column, name, workloads)` for stanzas, and `(line, column, name, value, workloads)` for settings. A
+        `[default]` stanza created for settings that precede the first stanza header is saved separately because it
+        has no record of its own. Recorded messages are saved with positions in the current Buffer reduced to line
+        numbers.
+
+        """
+        filename = self._filename
+        store = self._store
+        kinds, items, lines, columns = (
+            store.record_kinds,
+            store.record_items,
+            store.record_lines,
+            store.record_columns,
+        )
+        placements = store.placements
+        default_stanza = None
+        headers = set()
+        records = []
+
+        for i in range(self._start, self._end):
+            kind, item, line, column = kinds[i], items[i], lines[i], columns[i]
+            if kind == store.TEXT:
+                records.append((line, column, store.texts[item]))
+            elif kind == store.STANZA:
+                headers.add(item)
+                records.append(
+                    (
+                        line,
+                        column,
+                        store.stanza_names[item],
+                        placements[store.stanza_placements[item]].workloads,
+                    )
+                )
+            else:
+                records.append(
+                    (
+                        line,
+                        column,
+                        store.setting_names[item],
+                        store.setting_values[item],
+                        placements[store.setting_placements[item]].workloads,
+                    )
+                )
+
+        for stanza in self._stanzas.values():
+            if stanza.name == "default" and stanza._row not in headers:
+                default_stanza = stanza.placement.workloads, stanza.position.line
+            break  # only the first stanza can be a [default] stanza without a header
+
+        messages = [
+            (
+                level,
+                tuple(
+                    arg.line
+                    if isinstance(arg, FilePosition) and arg.file == filename
+                    else string(arg)
+                    for arg in args
+                ),
+            )
+            for level, args in recording
+        ]
+
+        return default_stanza, records, messages
+
+    # endregion
+    pass  # pylint: disable=unnecessary-pass
+
+
+class _AppConfigurationStore(object):
+    """Holds the content of the conf files in an app in columns
+
+    Settings, stanzas, and the records from which conf files are saved are rows in parallel columns. Names, values,
+    comments, and filenames are interned and numbers are held in arrays of machine integers. The classes that make up
+    an :class:`AppConfiguration` are views over the rows of a store.
+
+    """
+
+    SETTING, STANZA, TEXT = 0, 1, 2  # record kinds
+
+    def __init__(self):
+
+        self._file_ids = {}
+        self._placement_ids = {}
+        self._strings = {}
+
+        self.filenames = []
+        self.placements = []
+
+        self.setting_names = []
+        self.setting_values = []
+        self.setting_files = array(str("i"))
+        self.setting_lines = array(str("i"))
+        self.setting_placements = array(str("i"))
+
+        self.stanza_names = []
+        self.stanza_files = array(str("i"))
+        self.stanza_lines = array(str("i"))
+        self.stanza_placements = array(str("i"))
+
+        self.record_kinds = array(str("b"))
+        self.record_items = array(str("i"))  # text index, stanza row, or setting row
+        self.record_lines = array(str("i"))
+        self.record_columns = array(str("i"))
+        self.texts = []
+
+    # region Methods
+
+    def add_record(self, kind, item, line, column):
+        self.record_kinds.append(kind)
+        self.record_items.append(item)
+        self.record_lines.append(line)
+        self.record_columns.append(column)
+
+    def add_setting(self, name, value, placement, file_id, line):
+        row = len(self.setting_names)
+        self.setting_names.append(self.intern(name))
+        self.setting_values.append(self.intern(value))
+        self.setting_files.append(file_id)
+        self.setting_lines.append(line)
+        self.setting_placements.append(self.get_placement_id(placement))
+        return row
+
+    def add_stanza(self, name, placement, file_id, line):
+        row = len(self.stanza_names)
+        self.stanza_names.append(self.intern(name))
+        self.stanza_files.append(file_id)
+        self.stanza_lines.append(line)
+        self.stanza_placements.append(self.get_placement_id(placement))
+        return row
+
+    def add_text(self, text):
+        index = len(self.texts)
+        self.texts.append(self.intern(text))
+        return index
+
+    def get_file_id(self, filename):
+        try:
+            return self._file_ids[filename]
+        except KeyError:
+            file_id = self._file_ids[filename] = len(self.filenames)
+            self.filenames.append(filename)
+            return file_id
+
+    def get_placement_id(self, placement):
+        # placements are interned by AppConfigurationPlacement; hence we can key them by identity
+        try:
+            return self._placement_ids[placement]
+        except KeyError:
+            placement_id = self._placement_ids[placement] = len(self.placements)
+            self.placements.append(placement)
+            return placement_id
+
+    def intern(self, value):
+        return self._strings.setdefault(value, value)
 
     # endregion
     pass  # pylint: disable=unnecessary-pass
@@ -10,7 +10,7 @@ The app_configuration_spec module defines this class hierarchy:
     |
     └-> stanzas: (name: string, AppConfigurationStanzaDeclaration(NamedObject))*
                                 |
-                                ├-> pattern: SRE_Pattern
+                                ├-> pattern: SegmentPattern | SRE_Pattern
                                 |
                                 ├-> documentation: AppConfigurationDocumentation*
                                 |
@@ -20,7 +20,7 @@ The app_configuration_spec module defines this class hierarchy:
                                 |
                                 └-> settings: (name: string, AppConfigurationSettingDeclaration(NamedObject)*
                                                              |
-                                                             ├-> pattern: SRE_Pattern
+                                                             ├-> pattern: SegmentPattern | SRE_Pattern
                                                              |
                                                              ├-> data_type: string
                                                              |
@@ -44,6 +44,8 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from builtins import object
 from collections import OrderedDict
+from copy import copy
+from hashlib import sha1
 from os import path
 
 import re
@@ -52,14 +54,14 @@ import sys
 from keyword import iskeyword
 
 from ._configuration_validation_plugin import AppConfigurationValidationPlugin
-from ._internal import FileBuffer, NamedObject
+from ._internal import FileBuffer, FilePosition, NamedObject, SegmentPattern
 from ..utils import SlimLogger, encode_string, escape_non_alphanumeric_chars
-from ..utils.internal import string
+from ..utils.internal import hash_object, string
 
 
 class AppConfigurationDocumentation(object):
     def __init__(
-        self, text, bulleted, indentation, line_spacing, position
+        self, text, bulleted, indentation, line_spacing, filename, line
     ):  # pylint: disable=too-many-arguments
 
         self._text = text
@@ -67,7 +69,9 @@ class AppConfigurationDocumentation(object):
         self._indentation = indentation
         self._line_spacing = line_spacing
 
-        self._position = position
+        # positions are materialized on demand; see AppConfigurationSettingDeclaration.Section
+        self._filename = filename
+        self._line = line
 
     def __str__(self):
         spaces = " " * self._indentation
@@ -80,7 +84,7 @@ class AppConfigurationDocumentation(object):
 
     @property
     def position(self):
-        return self._position
+        return FilePosition(self._filename, self._line)
 
     @property
     def text(self):
@@ -250,10 +254,18 @@ class AppConfigurationSettingDeclaration(NamedObject):
     def documentation(self):
         return self._declaration.documentation
 
+    @property
+    def is_literal(self):
+        return self._declaration.is_literal
+
     @property
     def pattern(self):
         return self._declaration.pattern
 
+    @property
+    def pattern_source(self):
+        return self._declaration.pattern_source
+
     @property
     def placement(self):
         return self._declaration.placement
@@ -269,19 +281,38 @@ class AppConfigurationSettingDeclaration(NamedObject):
     def add(self, section):
         self._sections[section.name] = self._declaration = section
 
+    def copy(self):
+        """Returns a copy of the current setting declaration that can be extended without modifying it"""
+        declaration = copy(self)
+        declaration._sections = OrderedDict(self._sections)
+        return declaration
+
     # endregion
 
     class Section(NamedObject):
-        def __init__(self, name, data_type, placement, position):
+        def __init__(
+            self, name, data_type, placement, filename, line=None, pattern=None
+        ):  # pylint: disable=too-many-arguments
 
             NamedObject.__init__(self, name)
 
+            if line is None:
+                # validation plugins written for earlier releases pass a FilePosition in place of filename and line
+                filename, line = filename
+
             self._data_type = data_type
             self._placement = placement
-            self._position = position
             self._documentation = []
 
-            self._pattern = self._compile_pattern(name)
+            # A spec file declares thousands of settings and we rarely report the position of one. We keep the filename
+            # shared by every item in a spec file and a line number instead of a FilePosition for each of them.
+            self._filename = filename
+            self._line = line
+
+            # A literal name--one with no `<replacement>`--is matched by name alone. Patterns are compiled on first use.
+            self._literal = self._search_replacement(name) is None
+            self._pattern = None
+            self._pattern_source = pattern
 
         # region Special methods
 
@@ -290,7 +321,7 @@ class AppConfigurationSettingDeclaration(NamedObject):
                 "name=" + repr(self._name),
                 "data_type=" + repr(self._data_type),
                 "placement=" + repr(self._placement),
-                "position=" + repr(self._position),
+                "position=" + repr(self.position),
             )
             return "AppConfigurationSetting.Section(" + ", ".join(arguments) + ")"
 
@@ -309,9 +340,25 @@ class AppConfigurationSettingDeclaration(NamedObject):
         def documentation(self):
             return self._documentation
 
+        @property
+        def is_literal(self):
+            return self._literal
+
         @property
         def pattern(self):
-            return self._pattern
+            pattern = self._pattern
+            if pattern is None:
+                pattern = self._pattern = self._compile_pattern(
+                    self._name, self.pattern_source
+                )
+            return pattern
+
+        @property
+        def pattern_source(self):
+            source = self._pattern_source
+            if source is None:
+                source = self._pattern_source = self._get_pattern_source(self._name)
+            return source
 
         @property
         def placement(self):
@@ -319,7 +366,7 @@ class AppConfigurationSettingDeclaration(NamedObject):
 
         @property
         def position(self):
-            return self._position
+            return FilePosition(self._filename, self._line)
 
         # endregion
 
@@ -329,7 +376,25 @@ class AppConfigurationSettingDeclaration(NamedObject):
         # Difference: stanza name patterns are a bit more complex on the _sub_replacement_pattern side and therefore
         # have different replace(match) functions
 
-        def _compile_pattern(self, name):
+        def _compile_pattern(self, name, source=None):
+            if source is None:
+                source = self._get_pattern_source(name)
+            pattern = SegmentPattern.compile(source)
+            if pattern is not None:
+                return pattern
+            try:
+                pattern = re.compile(source, re.M | re.U)
+                return pattern
+            except re.error as error:
+                SlimLogger.fatal(
+                    self.position,
+                    ": Could not compile regular expression for stanza header [",
+                    name,
+                    "]: ",
+                    error,
+                )
+
+        def _get_pattern_source(self, name):
             def replace(match):
                 group_name = to_valid_identifier(
                     match.expand(match.group(1)), match.start(1)
@@ -349,24 +414,12 @@ class AppConfigurationSettingDeclaration(NamedObject):
 
             # guards against compilation of embedded regular expressions
             escaped_text = escape_non_alphanumeric_chars(name)
-            try:
-                pattern = re.compile(
-                    self._sub_replacement_pattern(replace, escaped_text) + r"\Z",
-                    re.M | re.U,
-                )
-                return pattern
-            except re.error as error:
-                SlimLogger.fatal(
-                    self.position,
-                    ": Could not compile regular expression for stanza header [",
-                    name,
-                    "]: ",
-                    error,
-                )
+            return self._sub_replacement_pattern(replace, escaped_text) + r"\Z"
 
         # TODO: Ensure optional match strings in stanza names are consistent with SpecFiles.cpp
         # Is there just the one use case for optional matches: inputs.conf.spec?
 
+        _search_replacement = re.compile(r"<.*?>", re.M | re.U).search
         _sub_invalid_identifier_characters = re.compile(
             r"\\[_\W](?<!\\\\)|(?=\w)[^a-zA-Z0-9]", re.M | re.U
         ).sub
@@ -380,8 +433,12 @@ class AppConfigurationSpec(NamedObject):
     def __init__(self, name, app_root):
         NamedObject.__init__(self, name)
         self._app_root = app_root
+        self._base = None
         self._sections = OrderedDict()
         self._declarations = OrderedDict()
+        self._digest = None
+        self._index = None
+        self._setting_index = None
         self._validation_plugin = AppConfigurationValidationPlugin.get(name, app_root)
 
     # region Special methods
@@ -400,38 +457,108 @@ class AppConfigurationSpec(NamedObject):
 
     # endregion
 
+    # region Properties
+
+    @property
+    def digest(self):
+        """Digest of the spec files and validation plugin from which this spec was loaded
+
+        The digest of an overlaid spec is computed from the digest of its base spec and the spec files that overlay
+        it.
+
+        """
+        value = self._digest
+        if value is None:
+            base = self._base
+            if base is None:
+                object_id = sha1(self._validation_plugin.digest.encode("ascii"))
+                filenames = self._sections
+            else:
+                object_id = sha1(base.digest.encode("ascii"))
+                filenames = (f for f in self._sections if f not in base._sections)
+            for filename in filenames:
+                object_id.update(hash_object(filename).encode("ascii"))
+            value = self._digest = string(object_id.hexdigest())
+        return value
+
+    # endregion
+
     # region Methods
 
-    def load(self, filename):
+    def load(self, filename, lean=None):
+        """Loads a spec file into the current spec
 
-        section = AppConfigurationSpec.Section.load(filename, self._validation_plugin)
-        section_declarations = section.stanza_declarations
-        declarations = self._declarations
+        :param filename: Name of a spec file.
+        :type filename: string
 
-        for name in section_declarations:
-            section_declaration = section_declarations[name]
-            try:
-                declaration = declarations[name]
-            except KeyError:
-                declaration = AppConfigurationStanzaDeclaration(
-                    name, section_declaration.position
-                )
-                declarations[name] = declaration
-            declaration.add(section_declaration)
+        :param lean: :const:`True`, if the documentation in `filename` should be dropped. The default is
+        `slim_configuration.lean_parsing`.
+        :type lean: bool
 
-        self._sections[filename] = section
+        """
+        section = AppConfigurationSpec.Section.load(
+            filename, self._validation_plugin, lean
+        )
+        self._add(filename, section, copy_on_write=False)
+
+    # pylint: disable=protected-access
+    def overlay(self, filename):
+        """Returns a copy of the current spec overlaid by a spec file
+
+        The current spec is not modified: it serves as the immutable base of the copy. Sections and stanza and setting
+        declarations are shared with the base until `filename` extends them. Only those it extends are copied.
+
+        :param filename: Name of a spec file; typically an app-local `README/<name>.conf.spec` file.
+        :type filename: string
+
+        :return: A new spec with the stanza declarations of the current spec extended by those in `filename`.
+        :rtype: AppConfigurationSpec
+
+        """
+        section = AppConfigurationSpec.Section.load(filename, self._validation_plugin)
+        configuration_spec = copy(self)
+        configuration_spec._base = self
+        configuration_spec._sections = OrderedDict(self._sections)
+        configuration_spec._declarations = OrderedDict(self._declarations)
+        configuration_spec._add(filename, section, copy_on_write=True)
+        return configuration_spec
 
     def match(self, stanza):
-        declarations = self._declarations
-        matches = []
+        """Returns the list of stanza declarations that match a stanza name, in declaration order
 
-        for name in self._declarations:
-            declaration = declarations[name]
-            match = declaration.pattern.match(stanza)
-            if match is not None:
-                matches.append(declaration)
+        :param stanza: Stanza name.
+        :type stanza: string
 
-        return matches if len(matches) > 0 else None
+        :return: Stanza declarations matching `stanza` or :const:`None`, if there are no matching stanza declarations.
+        :rtype: list
+
+        """
+        index = self._index
+        if index is None:
+            index = self._index = _AppConfigurationStanzaIndex(
+                self._declarations.values()
+            )
+        return index.match(stanza)
+
+    def match_setting(self, setting):
+        """Returns the first setting declaration that matches a setting name across all stanza declarations
+
+        Stanza declarations are searched in declaration order. Within a stanza declaration an exact match takes
+        precedence over a pattern match. This is how settings in the `[default]` stanza are validated.
+
+        :param setting: Setting name.
+        :type setting: string
+
+        :return: The first setting declaration matching `setting` or :const:`None`, if there is no match.
+        :rtype: AppConfigurationSettingDeclaration
+
+        """
+        index = self._setting_index
+        if index is None:
+            index = self._setting_index = _AppConfigurationSettingIndex(
+                self._declarations.values()
+            )
+        return index.match(setting)
 
     def stanza_declarations(self):
         declarations = self._declarations
@@ -445,6 +572,35 @@ class AppConfigurationSpec(NamedObject):
 
     # endregion
 
+    # region Protected
+
+    def _add(self, filename, section, copy_on_write):
+        """Adds the stanza declarations in a section loaded from `filename` to the current spec
+
+        Stanza declarations shared with a base spec are copied before they're extended, if `copy_on_write` is
+        :const:`True`.
+
+        """
+        section_declarations = section.stanza_declarations
+        declarations = self._declarations
+
+        for name in section_declarations:
+            section_declaration = section_declarations[name]
+            declaration = declarations.get(name)
+            if declaration is None:
+                declaration = declarations[name] = AppConfigurationStanzaDeclaration(
+                    name
+                )
+            elif copy_on_write:
+                declarations[name] = declaration.overlay(section_declaration)
+                continue
+            declaration.add(section_declaration)
+
+        self._sections[filename] = section
+        self._digest = self._index = self._setting_index = None
+
+    # endregion
+
     class Section(NamedObject):
         def __init__(self, file_buffer):
             name = path.basename(file_buffer.filename)
@@ -465,8 +621,8 @@ class AppConfigurationSpec(NamedObject):
             return self._buffer.stanza_declarations[stanza]
 
         @classmethod
-        def load(cls, filename, validation_plugin):
-            file_buffer = _AppConfigurationSpecBuffer(filename, validation_plugin)
+        def load(cls, filename, validation_plugin, lean=None):
+            file_buffer = _AppConfigurationSpecBuffer(filename, validation_plugin, lean)
             file_buffer.load()
             return cls(file_buffer)
 
@@ -486,13 +642,15 @@ class AppConfigurationSpec(NamedObject):
 
 
 class AppConfigurationStanzaDeclaration(NamedObject):
-    def __init__(self, name, position):
+    def __init__(self, name, pattern=None):
         NamedObject.__init__(self, name)
         self._placement = None
         self._sections = OrderedDict()
         self._declarations = OrderedDict()
         self._patterned_declarations = None
-        self._pattern = self._compile_pattern(name, position)
+        # compilation is deferred until the pattern is first used; most stanza names are matched by name alone
+        self._pattern = None
+        self._pattern_source = pattern
 
     # region Special methods
 
@@ -515,7 +673,19 @@ class AppConfigurationStanzaDeclaration(NamedObject):
 
     @property
     def pattern(self):
-        return self._pattern
+        pattern = self._pattern
+        if pattern is None:
+            pattern = self._pattern = self._compile_pattern(
+                self._name, self.pattern_source
+            )
+        return pattern
+
+    @property
+    def pattern_source(self):
+        source = self._pattern_source
+        if source is None:
+            source = self._pattern_source = self._get_pattern_source(self._name)
+        return source
 
     @property
     def placement(self):
@@ -538,9 +708,30 @@ class AppConfigurationStanzaDeclaration(NamedObject):
                 declarations[name] = declaration
             declaration.add(section_declarations[name])
 
-        self._sections[section.position.file] = section
+        self._sections[section.filename] = section
         self._placement = section.placement.union(self._placement)
 
+    # pylint: disable=protected-access
+    def overlay(self, section):
+        """Returns a copy of the current stanza declaration extended by a section
+
+        The current stanza declaration is not modified. The copy shares its compiled pattern and the setting
+        declarations that `section` does not extend.
+
+        """
+        declaration = copy(self)
+        declaration._sections = OrderedDict(self._sections)
+        declaration._declarations = declarations = OrderedDict(self._declarations)
+        declaration._patterned_declarations = None
+
+        for name in section.setting_declarations:
+            setting_declaration = declarations.get(name)
+            if setting_declaration is not None:
+                declarations[name] = setting_declaration.copy()
+
+        declaration.add(section)
+        return declaration
+
     def match(self, setting):
 
         # match exact
@@ -553,14 +744,12 @@ class AppConfigurationStanzaDeclaration(NamedObject):
         except KeyError:
             pass
 
-        # match pattern
+        # match pattern; a literal setting declaration matches its name alone and so it can't match here
 
         declarations = self._patterned_declarations
 
         if declarations is None:
-            declarations = [
-                d for d in list(self._declarations.values()) if d.name != d.pattern
-            ]
+            declarations = [d for d in self._declarations.values() if not d.is_literal]
             self._patterned_declarations = declarations
 
         for declaration in declarations:
@@ -579,7 +768,28 @@ class AppConfigurationStanzaDeclaration(NamedObject):
 
     # region Protected
 
-    def _compile_pattern(self, name, position):
+    def _compile_pattern(self, name, source=None):
+        if source is None:
+            source = self._get_pattern_source(name)
+        # regular expressions are used only for alternations and optional replacements; see SegmentPattern
+        pattern = SegmentPattern.compile(source)
+        if pattern is not None:
+            return pattern
+        try:
+            pattern = re.compile(source, re.M | re.U)
+            return pattern
+        except re.error as error:
+            # we report the position of the first stanza header that declared the current stanza
+            section = next(iter(self._sections.values()))
+            SlimLogger.fatal(
+                section.position,
+                ": Could not compile regular expression for stanza header [",
+                name,
+                "]: ",
+                error,
+            )
+
+    def _get_pattern_source(self, name):
         def replace(match):
             group_name = to_valid_identifier(
                 match.expand(match.group(2)), match.start(2)
@@ -622,21 +832,7 @@ class AppConfigurationStanzaDeclaration(NamedObject):
                 continue
             names[index] = scheme.group(1) + "|" + scheme.group(0) + pattern
 
-        pattern = (
-            "(?:" + "|".join(names) + ")\\Z" if len(names) > 1 else names[0] + "\\Z"
-        )
-
-        try:
-            pattern = re.compile(pattern, re.M | re.U)
-            return pattern
-        except re.error as error:
-            SlimLogger.fatal(
-                position,
-                ": Could not compile regular expression for stanza header [",
-                name,
-                "]: ",
-                error,
-            )
+        return "(?:" + "|".join(names) + ")\\Z" if len(names) > 1 else names[0] + "\\Z"
 
     _match_scheme_name = re.compile(
         r"([0-9a-zA-Z][0-9a-zA-Z_-]*)://", re.M | re.U
@@ -651,18 +847,19 @@ class AppConfigurationStanzaDeclaration(NamedObject):
     # endregion
 
     class Section(NamedObject):
-        def __init__(self, name, position):
+        def __init__(self, name, filename, line):
 
             NamedObject.__init__(self, name)
             self._declarations = OrderedDict()
             self._documentation = []
             self._placement = None
-            self._position = position
+            self._filename = filename
+            self._line = line
 
         # region Special methods
 
         def __repr__(self):
-            name, position = repr(self._name), repr(self._position)
+            name, position = repr(self._name), repr(self.position)
             return (
                 "AppConfigurationStanzaDeclaration.Section(name="
                 + name
@@ -682,13 +879,17 @@ class AppConfigurationStanzaDeclaration(NamedObject):
         def documentation(self):
             return self._documentation
 
+        @property
+        def filename(self):
+            return self._filename
+
         @property
         def placement(self):
             return self._placement
 
         @property
         def position(self):
-            return self._position
+            return FilePosition(self._filename, self._line)
 
         @property
         def setting_declarations(self):
@@ -697,9 +898,146 @@ class AppConfigurationStanzaDeclaration(NamedObject):
         # endregion
 
 
+class _AppConfigurationSettingIndex(object):
+    """Finds the first setting declaration that matches a setting name across a sequence of stanza declarations
+
+    Setting names are entered into a hash table for exact matches. The first stanza declaration to declare a name wins.
+    Setting names with a `<replacement>` are also patterns that are entered into a table of literal prefixes: the text
+    that precedes their first `<replacement>`. Every setting name that a pattern matches starts with its literal prefix.
+    Hence only the patterns found by looking up each prefix of a setting name that is as long as a literal prefix in
+    the table are tried, in declaration order. An exact match takes precedence over a pattern match from the same or a
+    later stanza declaration.
+
+    :param declarations: Stanza declarations in declaration order.
+    :type declarations: iterable
+
+    """
+
+    def __init__(self, declarations):
+
+        self._names = names = {}
+        # (ordinal, setting declaration) pairs in declaration order
+        self._patterns = patterns = []
+        self._prefixes = prefixes = {}
+
+        for ordinal, stanza_declaration in enumerate(declarations):
+            for declaration in stanza_declaration.setting_declarations():
+                name = declaration.name
+                names.setdefault(name, (ordinal, declaration))
+                if declaration.is_literal:
+                    continue
+                prefixes.setdefault(name[: name.index("<")], []).append(len(patterns))
+                patterns.append((ordinal, declaration))
+
+        self._lengths = sorted(set(len(key) for key in prefixes))
+
+    # region Methods
+
+    def match(self, setting):
+        """Returns the first setting declaration that matches `setting` or :const:`None`"""
+        exact = self._names.get(setting)
+        prefixes = self._prefixes
+        candidates = []
+
+        for length in self._lengths:
+            if length > len(setting):
+                break
+            indexes = prefixes.get(setting[:length])
+            if indexes is not None:
+                candidates.extend(indexes)
+
+        patterns = self._patterns
+
+        for index in sorted(candidates):
+            ordinal, declaration = patterns[index]
+            if exact is not None and ordinal >= exact[0]:
+                break
+            if declaration.pattern.match(setting) is not None:
+                return declaration
+
+        return None if exact is None else exact[1]
+
+    # endregion
+    pass  # pylint: disable=unnecessary-pass
+
+
+class _AppConfigurationStanzaIndex(object):
+    """Narrows the stanza declarations that might match a stanza name before their patterns are tried
+
+    Each `|`-separated alternative of a stanza declaration name is either a literal or a pattern. A literal--an
+    alternative with no scheme and no `<replacement>`--is entered into a hash table. A pattern is entered into a table
+    of literal prefixes: its scheme name, if it has one, or else the text that precedes its first `<replacement>`.
+    Every stanza name that a pattern matches starts with its literal prefix. Hence a stanza name is matched by looking
+    it up in the literal table and looking up each of its prefixes that is as long as a literal prefix in the table
+    of literal prefixes. Only the patterns found this way are tried and a literal is a match without trying its
+    pattern.
+
+    :param declarations: Stanza declarations in declaration order.
+    :type declarations: iterable
+
+    """
+
+    def __init__(self, declarations):
+
+        self._declarations = declarations = list(declarations)
+        self._literals = literals = {}
+        self._prefixes = prefixes = {}
+
+        match_scheme_name = AppConfigurationStanzaDeclaration._match_scheme_name
+
+        for index, declaration in enumerate(declarations):
+            for text in declaration.name.split("|"):
+                scheme = match_scheme_name(text)
+                if scheme is not None:
+                    table, key = prefixes, scheme.group(1)
+                else:
+                    end = text.find("<")
+                    if end < 0:
+                        table, key = literals, text
+                    else:
+                        if end > 0 and text[end - 1] == "[":
+                            end -= 1  # a replacement may start with an optional '[' as in '[<name>]:'
+                        table, key = prefixes, text[:end]
+                indexes = table.setdefault(key, [])
+                if len(indexes) == 0 or indexes[-1] != index:
+                    indexes.append(index)
+
+        self._lengths = sorted(set(len(key) for key in prefixes))
+
+    # region Methods
+
+    def match(self, stanza):
+        """Returns the list of stanza declarations that match `stanza`, in declaration order, or :const:`None`"""
+        literals = self._literals.get(stanza, ())
+        candidates = set(literals)
+        prefixes = self._prefixes
+
+        for length in self._lengths:
+            if length > len(stanza):
+                break
+            indexes = prefixes.get(stanza[:length])
+            if indexes is not None:
+                candidates.update(indexes)
+
+        if len(candidates) == 0:
+            return None
+
+        declarations = self._declarations
+        matches = [
+            declarations[index]
+            for index in sorted(candidates)
+            if index in literals or declarations[index].pattern.match(stanza)
+        ]
+
+        return matches if len(matches) > 0 else None
+
+    # endregion
+    pass  # pylint: disable=unnecessary-pass
+
+
 class _AppConfigurationSpecBuffer(FileBuffer):
-    def __init__(self, filename, validation_plugin):
-        FileBuffer.__init__(self, filename)
+    def __init__(self, filename, validation_plugin, lean=None):
+        FileBuffer.__init__(self, filename, lean)
         self._stanza_declarations = None
         self._validation_plugin = validation_plugin
 
@@ -726,7 +1064,10 @@ class _AppConfigurationSpecBuffer(FileBuffer):
         """Reads the conf.spec file associated with the current Buffer"""
         # TODO: SPL-123949: Refactor AppConfigurationSpecBuffer._load to improve understandability
         # pylint: disable=too-many-branches, too-many-locals, too-many-statements
-        stanza = AppConfigurationStanzaDeclaration.Section("default", reader.position)
+        filename = self._filename
+        stanza = AppConfigurationStanzaDeclaration.Section(
+            "default", filename, reader.line_number
+        )
         setting_declaration_section = AppConfigurationSettingDeclaration.Section
         stanzas = self._stanza_declarations = OrderedDict()
         stanzas["default"] = current_item = stanza
@@ -783,7 +1124,8 @@ class _AppConfigurationSpecBuffer(FileBuffer):
                         if match is None:
                             # documentation for the current item which is either a stanza or a setting declaration
                             item = self._parse_documentation(line, start, reader)
-                            current_item.documentation.append(item)
+                            if item is not None:
+                                current_item.documentation.append(item)
                         else:
                             # setting declaration
                             if default_placement is None:
@@ -801,16 +1143,16 @@ class _AppConfigurationSpecBuffer(FileBuffer):
                                 # other stanza) and we've hit this setting before hitting a placement directive
                                 assert placement is None
                                 placement = aggregate_placement = default_placement
-                            name, data_type, position = (
-                                match.group(1),
-                                match.group(2),
-                                reader.position,
-                            )
+                            name, data_type = match.group(1), match.group(2)
                             item = setting_declaration_section(
-                                name, data_type[:-1], placement, position
+                                name,
+                                data_type[:-1],
+                                placement,
+                                filename,
+                                reader.line_number,
                             )
                             stanza.setting_declarations[item.name] = current_item = item
-                self._append(item, reader.position, indentation=start)
+                self._append(item, reader.line_number, indentation=start)
             except self._Error as error:
                 SlimLogger.error(reader.position, ": ", error)
 
@@ -835,7 +1177,7 @@ class _AppConfigurationSpecBuffer(FileBuffer):
             # The default stanza is the only stanza, hence all settings are global and there are no restrictions or
             # special handling based on stanza name (we'll match any stanza name)
             stanza = AppConfigurationStanzaDeclaration.Section(
-                self._any_stanza_name, reader.position
+                self._any_stanza_name, filename, reader.line_number
             )
             stanzas[stanza.name] = stanza
             self._end_stanza_declaration(
@@ -843,7 +1185,7 @@ class _AppConfigurationSpecBuffer(FileBuffer):
             )
             return
 
-        self._fix_up(reader.position)
+        self._fix_up(reader.line_number)
 
     # pylint: disable=protected-access
     def _end_stanza_declaration(
@@ -860,7 +1202,7 @@ class _AppConfigurationSpecBuffer(FileBuffer):
         )
         self._validation_plugin.fix_up(item, placement, position)
 
-    def _fix_up(self, position):
+    def _fix_up(self, line):
 
         # TODO: Incorporate this issue into module-level documentation
         # Issue:
@@ -881,7 +1223,7 @@ class _AppConfigurationSpecBuffer(FileBuffer):
             default_disabled = default_stanza.setting_declarations["disabled"]
         except KeyError:
             default_disabled = AppConfigurationSettingDeclaration.Section(
-                "disabled", "<bool>", None, position
+                "disabled", "<bool>", None, self._filename, line
             )
             default_stanza.setting_declarations["disabled"] = default_disabled
 
@@ -916,16 +1258,17 @@ class _AppConfigurationSpecBuffer(FileBuffer):
             )
 
     def _parse_documentation(self, line, start, reader):
-
+        """Parses a paragraph of documentation or, if the current Buffer is lean, skips over it and returns None"""
         bulleted = self._is_bulleted_paragraph(line[start : start + 2]) is not None
         indentation = start
         line_spacing = 0
-        position = reader.position
+        line_number = reader.line_number
 
         if bulleted:
             start += 2
 
         paragraph = line[start:].rstrip("\n")
+        lean = self._lean
 
         for linep in reader:
             linepp, line_spacing, start = self._read_blank(linep, reader)
@@ -934,11 +1277,14 @@ class _AppConfigurationSpecBuffer(FileBuffer):
                 if len(linepp) > 0:
                     reader.put_back(linepp)
                 break
-            if len(linepp) > 0:
+            if len(linepp) > 0 and not lean:
                 paragraph += "\n" + linepp.rstrip("\n")
 
+        if lean:
+            return None
+
         item = AppConfigurationDocumentation(
-            paragraph, bulleted, indentation, line_spacing, position
+            paragraph, bulleted, indentation, line_spacing, self._filename, line_number
         )
         return item
 
@@ -968,7 +1314,7 @@ class _AppConfigurationSpecBuffer(FileBuffer):
             declaration = stanzas[name]
         except KeyError:
             declaration = AppConfigurationStanzaDeclaration.Section(
-                name, reader.position
+                name, self._filename, reader.line_number
             )
             stanzas[name] = declaration
 
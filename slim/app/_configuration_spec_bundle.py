@@ -0,0 +1,343 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+"""app_configuration_spec_bundle module
+
+A conf-spec bundle is a precompiled form of the `*.conf.spec` files on a configuration spec path. It is produced by
+`slim config --compile-specs` or at install time and is written to the configuration spec path as `conf-specs.bundle`.
+Its layout is:
+
+.. code-block::
+    magic: b'slim-conf-specs\n'
+    format: b'<format-version>\n'
+    body: pickle(dict(
+        python: int,
+        specs: OrderedDict((basename: string, pickle(spec_file))*)
+    ))
+
+Each `spec_file` is a tuple of plain data from which an `AppConfigurationSpec.Section` and its merged stanza
+declarations are rebuilt without parsing text or compiling regular expressions:
+
+.. code-block::
+    spec_file: (digest: string, plugin_digest: string, stanza*)
+    stanza: (name, line, workloads, documentation*, pattern_source, setting*)
+    setting: (name, data_type, workloads, line, documentation*, pattern_source)
+    documentation: (text, bulleted, indentation, line_spacing, line)
+
+A spec file is served from the bundle only when its content digest and the digest of its validation plugin match the
+values recorded at compile time. Otherwise--and for app-local `README/*.conf.spec` overlays, which are never
+bundled--spec files are parsed from text.
+
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from builtins import object
+from collections import OrderedDict
+from glob import glob
+from os import path
+from tempfile import mkstemp
+
+import io
+import os
+import sys
+
+try:
+    # noinspection PyCompatibility
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from ._configuration_spec import (
+    AppConfigurationDocumentation,
+    AppConfigurationPlacement,
+    AppConfigurationSettingDeclaration,
+    AppConfigurationSpec,
+    AppConfigurationStanzaDeclaration,
+    _AppConfigurationSpecBuffer,
+)
+from ..utils import SlimLogger, encode_filename, slim_configuration
+from ..utils.internal import hash_object, replace_file
+
+
+class AppConfigurationSpecBundle(object):
+    """Serves precompiled conf-spec files from the bundle on a configuration spec path
+
+    :param configuration_spec_path: Directory containing the bundle and the conf-spec files it was compiled from.
+    :type configuration_spec_path: string
+
+    :param specs: Maps spec file basenames to pickled spec file data.
+    :type specs: OrderedDict
+
+    """
+
+    def __init__(self, configuration_spec_path, specs):
+        self._configuration_spec_path = configuration_spec_path
+        self._specs = specs
+
+    # region Properties
+
+    @property
+    def configuration_spec_path(self):
+        return self._configuration_spec_path
+
+    # endregion
+
+    # region Methods
+
+    @classmethod
+    def compile(cls, configuration_spec_path=None):
+        """Compiles the conf-spec files on `configuration_spec_path` into a bundle
+
+        :param configuration_spec_path: Directory containing the conf-spec files to compile. The default is
+        `slim_configuration.configuration_spec_path`.
+        :type configuration_spec_path: string
+
+        :return: Name of the bundle file written to `configuration_spec_path`.
+        :rtype: string
+
+        """
+        if configuration_spec_path is None:
+            configuration_spec_path = slim_configuration.configuration_spec_path
+
+        specs = OrderedDict()
+        end = -len(".conf.spec")
+
+        for filename in sorted(glob(path.join(configuration_spec_path, "*.conf.spec"))):
+            basename = path.basename(filename)
+            configuration_spec = AppConfigurationSpec(
+                basename[:end], configuration_spec_path
+            )
+            # bundles serve lean and full-fidelity loads alike and so they're compiled with documentation
+            configuration_spec.load(filename, lean=False)
+            specs[basename] = pickle.dumps(
+                _save_spec_file(filename, configuration_spec), cls._protocol
+            )
+
+        filename = path.join(configuration_spec_path, cls._basename)
+        file_no, temporary_filename = mkstemp(dir=configuration_spec_path)
+
+        try:
+            with io.open(file_no, "wb") as ostream:
+                ostream.write(cls._magic + cls._format + b"\n")
+                pickle.dump(
+                    {"python": sys.version_info[0], "specs": specs},
+                    ostream,
+                    cls._protocol,
+                )
+            os.chmod(temporary_filename, 0o644)
+            replace_file(temporary_filename, filename)
+        finally:
+            if path.exists(temporary_filename):
+                os.remove(temporary_filename)
+
+        cls._instances.pop(path.normcase(path.abspath(configuration_spec_path)), None)
+        return filename
+
+    @classmethod
+    def get(cls, configuration_spec_path):
+        """Returns the bundle on `configuration_spec_path` or :const:`None`, if there is no usable bundle
+
+        A bundle that was compiled by an incompatible version of this module or of Python is treated as if it did not
+        exist.
+
+        """
+        key = path.normcase(path.abspath(configuration_spec_path))
+
+        try:
+            return cls._instances[key]
+        except KeyError:
+            pass
+
+        bundle = None
+        filename = path.join(configuration_spec_path, cls._basename)
+
+        try:
+            with io.open(filename, "rb") as istream:
+                if istream.readline() == cls._magic and istream.readline() == (
+                    cls._format + b"\n"
+                ):
+                    body = pickle.load(istream)
+                    if body["python"] == sys.version_info[0]:
+                        bundle = cls(configuration_spec_path, body["specs"])
+        except (IOError, OSError):
+            pass
+        except (EOFError, KeyError, TypeError, ValueError, pickle.UnpicklingError):
+            SlimLogger.warning(
+                "Ignoring unreadable conf-spec bundle ", encode_filename(filename)
+            )
+
+        cls._instances[key] = bundle
+        return bundle
+
+    def load(self, configuration_spec, filename):
+        """Loads `filename` into `configuration_spec` from the current bundle, if possible
+
+        :param configuration_spec: An empty configuration spec.
+        :type configuration_spec: AppConfigurationSpec
+
+        :param filename: Name of a conf-spec file on the configuration spec path of the current bundle.
+        :type filename: string
+
+        :return: :const:`True`, if `filename` was loaded from the current bundle; otherwise, if `filename` must be
+        parsed, :const:`False`.
+        :rtype: bool
+
+        :raises OSError: `filename` is in the current bundle, but no longer exists.
+
+        """
+        # pylint: disable=protected-access
+        # noinspection PyProtectedMember
+        value = self._specs.get(path.basename(filename))
+
+        if value is None or len(configuration_spec._sections) > 0:
+            return False
+
+        digest, plugin_digest, stanzas = pickle.loads(value)
+        validation_plugin = configuration_spec._validation_plugin
+
+        if digest != hash_object(filename) or plugin_digest != validation_plugin.digest:
+            return False
+
+        file_buffer = _AppConfigurationSpecBuffer(filename, validation_plugin)
+        file_buffer._stanza_declarations, patterns = _load_stanzas(
+            file_buffer.filename, stanzas, file_buffer.lean
+        )
+        section = AppConfigurationSpec.Section(file_buffer)
+        declarations = configuration_spec._declarations
+
+        for name, section_declaration in file_buffer.stanza_declarations.items():
+            declaration = AppConfigurationStanzaDeclaration(name, patterns[name])
+            declaration.add(section_declaration)
+            declarations[name] = declaration
+
+        configuration_spec._sections[filename] = section
+        configuration_spec._digest = None
+        configuration_spec._index = configuration_spec._setting_index = None
+        return True
+
+    # endregion
+
+    # region Protected
+
+    _basename = "conf-specs.bundle"
+    _format = b"1"  # increment when the layout of spec_file changes
+    _instances = {}
+    _magic = b"slim-conf-specs\n"
+    _protocol = 2  # the highest protocol supported by all versions of Python we support
+
+    # endregion
+    pass  # pylint: disable=unnecessary-pass
+
+
+# region Protected
+
+
+def _get_workloads(placement):
+    return None if placement is None else placement.workloads
+
+
+def _get_placement(workloads):
+    return None if workloads is None else AppConfigurationPlacement(workloads)
+
+
+def _load_documentation(filename, values, lean):
+    if lean:
+        return []
+    return [
+        AppConfigurationDocumentation(
+            text, bulleted, indentation, line_spacing, filename, line
+        )
+        for text, bulleted, indentation, line_spacing, line in values
+    ]
+
+
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+def _load_stanzas(filename, values, lean):
+
+    stanzas = OrderedDict()
+    patterns = {}
+
+    for name, line, workloads, documentation, pattern, settings in values:
+        stanza = AppConfigurationStanzaDeclaration.Section(name, filename, line)
+        stanza._placement = _get_placement(workloads)
+        stanza._documentation = _load_documentation(filename, documentation, lean)
+        patterns[name] = pattern
+        declarations = stanza.setting_declarations
+        for (
+            setting_name,
+            data_type,
+            setting_workloads,
+            setting_line,
+            setting_documentation,
+            setting_pattern,
+        ) in settings:
+            setting = AppConfigurationSettingDeclaration.Section(
+                setting_name,
+                data_type,
+                _get_placement(setting_workloads),
+                filename,
+                setting_line,
+                setting_pattern,
+            )
+            setting._documentation = _load_documentation(
+                filename, setting_documentation, lean
+            )
+            declarations[setting_name] = setting
+        stanzas[name] = stanza
+
+    return stanzas, patterns
+
+
+def _save_documentation(documentation):
+    return [
+        (
+            item.text,
+            item._bulleted,
+            item._indentation,
+            item._line_spacing,
+            item._line,
+        )
+        for item in documentation
+    ]
+
+
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+def _save_spec_file(filename, configuration_spec):
+
+    declarations = configuration_spec._declarations
+    section = configuration_spec._sections[filename]
+    stanzas = []
+
+    for name, stanza in section.stanza_declarations.items():
+        stanzas.append(
+            (
+                name,
+                stanza._line,
+                _get_workloads(stanza.placement),
+                _save_documentation(stanza.documentation),
+                declarations[name].pattern_source,
+                [
+                    (
+                        setting.name,
+                        setting.data_type,
+                        _get_workloads(setting.placement),
+                        setting._line,
+                        _save_documentation(setting.documentation),
+                        setting.pattern_source,
+                    )
+                    for setting in stanza.setting_declarations.values()
+                ],
+            )
+        )
+
+    return (
+        hash_object(filename),
+        configuration_spec._validation_plugin.digest,
+        stanzas,
+    )
+
+
+# endregion
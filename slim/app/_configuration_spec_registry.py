@@ -0,0 +1,436 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+"""app_configuration_spec_registry module
+
+The registry holds the configuration specs loaded by the current process. Base specs--those loaded from the
+configuration spec path--and overlaid specs--those loaded from the configuration spec path and an app-local
+`README/<name>.conf.spec` file--are held in separate tables, each of which is bounded by
+`slim_configuration.spec_registry_size` and evicts the least recently used spec when it is full.
+
+Base specs are keyed by configuration spec path and configuration name. They're immutable once loaded. Overlaid
+specs are additionally keyed by the digest of their overlay. An overlaid spec is built from its base spec by
+parsing the overlay alone: it shares every stanza and setting declaration of the base spec that its overlay does
+not extend. An app that ships no overlay shares the base spec with every other such app and apps that ship the same
+overlay share an overlaid spec.
+
+Base specs may also be loaded for a Khulnasoft release. The specs for a release are loaded from its directory under
+`slim_configuration.release_spec_path`, which need hold only the spec files that differ from those on the
+configuration spec path. A spec file that a release directory does not hold is served from the configuration spec
+path. Base specs loaded from identical spec files are shared, whichever directory they're loaded from.
+
+Base specs are validated by the plugins on the configuration spec path, never by an app's plugins. An app that ships
+its own validation plugin--a `README/<name>.py` module or `README/<name>` package--gets a spec of its own, which is
+loaded from the base and overlay spec files using that plugin and held with the overlaid specs.
+
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from builtins import object
+from collections import namedtuple
+from glob import glob
+from hashlib import sha1
+from os import path
+from time import time
+from weakref import WeakValueDictionary
+
+import errno
+
+from ._configuration_spec import AppConfigurationSpec
+from ._configuration_spec_bundle import AppConfigurationSpecBundle
+from ._configuration_validation_plugin import AppConfigurationValidationPlugin
+from ._internal import LruCache
+from ..utils import SlimLogger, encode_filename, slim_configuration
+from ..utils.internal import hash_object, string
+
+
+class AppConfigurationSpecRegistry(object):
+    """Holds the configuration specs loaded by the current process
+
+    Hits, misses, and the time spent loading specs are counted so that the capacity of a registry can be tuned.
+
+    :param capacity: Maximum number of base specs and, separately, overlaid specs held by the registry.
+    :type capacity: int
+
+    """
+
+    def __init__(self, capacity):
+        self._base_specs = LruCache(capacity)
+        self._overlaid_specs = LruCache(capacity)
+        self._shared_specs = WeakValueDictionary()
+        self._digests = {}
+        self._load_count = 0
+        self._load_time = 0.0
+
+    # region Properties
+
+    @property
+    def capacity(self):
+        return self._base_specs.capacity
+
+    @capacity.setter
+    def capacity(self, value):
+        self._base_specs.capacity = self._overlaid_specs.capacity = value
+
+    # endregion
+
+    # region Methods
+
+    def clear(self):
+        self._base_specs.clear()
+        self._overlaid_specs.clear()
+        self._shared_specs.clear()
+        self._digests.clear()
+        self._load_count = 0
+        self._load_time = 0.0
+
+    def get(self, configuration, app_root, release=None):
+        """Returns the spec for validating the named configuration in the app at `app_root`
+
+        The spec is loaded on first use. A warning is logged, if there are no spec files for `configuration`.
+
+        :param configuration: Configuration name (e.g., 'app', 'inputs', 'props').
+        :type configuration: string
+
+        :param app_root: App root directory name.
+        :type app_root: string
+
+        :param release: Khulnasoft release version (e.g., '7.0.0'). The default is to validate against the specs on
+        `slim_configuration.configuration_spec_path`.
+        :type release: string
+
+        :return: The spec for `configuration` or :const:`None`, if there are no spec files for `configuration`.
+        :rtype: AppConfigurationSpec
+
+        """
+        configuration_spec_path = self.get_configuration_spec_path(
+            configuration, release
+        )
+        filename = path.join(app_root, "README", configuration + ".conf.spec")
+
+        if AppConfigurationValidationPlugin.is_local(configuration, app_root):
+            return self._get_local_spec(
+                configuration, app_root, configuration_spec_path, filename
+            )
+
+        try:
+            digest = hash_object(filename)
+        except (IOError, OSError) as error:
+            if error.errno not in (errno.ENOENT, errno.ENOTDIR):
+                self._fatal(filename, error)
+            # There is no app-local overlay
+            return self._get_base_spec(
+                configuration, app_root, configuration_spec_path, True
+            )
+
+        specs = self._overlaid_specs
+        key = configuration_spec_path, configuration, digest
+        configuration_spec = specs.get(key, _missing)
+
+        if configuration_spec is _missing:
+            base_spec = self._get_base_spec(
+                configuration, app_root, configuration_spec_path, False
+            )
+            start = time()
+            try:
+                if base_spec is None:
+                    configuration_spec = AppConfigurationSpec(configuration, app_root)
+                    configuration_spec.load(filename)
+                else:
+                    configuration_spec = base_spec.overlay(filename)
+            except (IOError, OSError) as error:
+                self._fatal(filename, error)
+            self._count_load(start)
+            specs.put(key, configuration_spec)
+
+        return configuration_spec
+
+    @staticmethod
+    def get_configuration_spec_path(configuration, release=None):
+        """Returns the directory from which the base spec for the named configuration is loaded for a release
+
+        :param configuration: Configuration name (e.g., 'app', 'inputs', 'props').
+        :type configuration: string
+
+        :param release: Khulnasoft release version (e.g., '7.0.0') or :const:`None`.
+        :type release: string
+
+        :return: The release's directory under `slim_configuration.release_spec_path`, if it holds a spec file for
+        `configuration`; otherwise `slim_configuration.configuration_spec_path`.
+        :rtype: string
+
+        """
+        if release is not None:
+            release_spec_path = path.join(slim_configuration.release_spec_path, release)
+            if path.isfile(path.join(release_spec_path, configuration + ".conf.spec")):
+                return release_spec_path
+        return slim_configuration.configuration_spec_path
+
+    def get_digest(self, configuration_spec_path=None):
+        """Returns a digest of the conf-spec files and validation plugins on `configuration_spec_path`
+
+        Like the base specs loaded from it, the content of a configuration spec path is taken to be fixed for the life
+        of the current process. Hence its digest is computed once.
+
+        :param configuration_spec_path: Directory containing the conf-spec files to digest. The default is
+        `slim_configuration.configuration_spec_path`.
+        :type configuration_spec_path: string
+
+        :rtype: string
+
+        """
+        if configuration_spec_path is None:
+            configuration_spec_path = slim_configuration.configuration_spec_path
+
+        digest = self._digests.get(configuration_spec_path)
+
+        if digest is None:
+            object_id = sha1()
+            for filename in sorted(
+                glob(path.join(configuration_spec_path, "*.conf.spec"))
+                + glob(path.join(configuration_spec_path, "*.py"))
+            ):
+                object_id.update(path.basename(filename).encode("utf-8") + b"\0")
+                object_id.update(hash_object(filename).encode("ascii") + b"\0")
+            digest = self._digests[configuration_spec_path] = string(
+                object_id.hexdigest()
+            )
+
+        return digest
+
+    def info(self):
+        """Returns the hit count, miss count, and size of each table in the current registry along with its capacity
+        and the number of specs it loaded and the time it took to load them
+
+        :rtype: AppConfigurationSpecRegistry.Info
+
+        """
+        base_specs = self._base_specs.info()
+        overlaid_specs = self._overlaid_specs.info()
+        return AppConfigurationSpecRegistry.Info(
+            base_specs.hits,
+            base_specs.misses,
+            base_specs.size,
+            overlaid_specs.hits,
+            overlaid_specs.misses,
+            overlaid_specs.size,
+            base_specs.capacity,
+            self._load_count,
+            self._load_time,
+        )
+
+    @classmethod
+    def instance(cls):
+        """Returns the registry shared by all validators in the current process
+
+        Its capacity is set by `slim_configuration.spec_registry_size`.
+
+        """
+        registry = cls._instance
+        if registry is None:
+            registry = cls._instance = cls(slim_configuration.spec_registry_size)
+        return registry
+
+    def preload(self, configuration_spec_path=None):
+        """Loads every base spec on `configuration_spec_path` that is not already in the current registry
+
+        Specs are loaded from the conf-spec bundle on `configuration_spec_path`, if it's up to date. Preloading more
+        specs than the current registry can hold evicts the specs that were loaded first.
+
+        :param configuration_spec_path: Directory containing the conf-spec files to load. The default is
+        `slim_configuration.configuration_spec_path`.
+        :type configuration_spec_path: string
+
+        :return: Number of specs loaded.
+        :rtype: int
+
+        """
+        if configuration_spec_path is None:
+            configuration_spec_path = slim_configuration.configuration_spec_path
+
+        specs = self._base_specs
+        end = -len(".conf.spec")
+        count = 0
+
+        for filename in sorted(glob(path.join(configuration_spec_path, "*.conf.spec"))):
+            configuration = path.basename(filename)[:end]
+            key = configuration_spec_path, configuration
+            if key in specs:
+                continue
+            specs.put(
+                key,
+                self._load_base_spec(
+                    configuration, configuration_spec_path, configuration_spec_path
+                ),
+            )
+            count += 1
+
+        return count
+
+    # endregion
+
+    # region Protected
+
+    _instance = None
+
+    def _count_load(self, start):
+        self._load_count += 1
+        self._load_time += time() - start
+
+    @staticmethod
+    def _fatal(filename, error):
+        SlimLogger.fatal(
+            "Could not load spec file ", encode_filename(filename), ": ", error.strerror
+        )
+
+    def _get_base_spec(self, configuration, app_root, configuration_spec_path, warn):
+        """Returns the base spec for the named configuration or :const:`None`, if there is no base spec
+
+        The app root is used only to report a missing spec. A warning is logged, if there is no base spec and `warn` is
+        :const:`True`. A missing base spec is remembered only when the warning is logged so that it's logged once.
+
+        """
+        specs = self._base_specs
+        key = configuration_spec_path, configuration
+        configuration_spec = specs.get(key, _missing)
+
+        if configuration_spec is _missing:
+            configuration_spec = self._load_base_spec(
+                configuration, configuration_spec_path, configuration_spec_path
+            )
+            if configuration_spec is not None or warn:
+                specs.put(key, configuration_spec)
+            if configuration_spec is None and warn:
+                SlimLogger.warning(
+                    "Could not find ",
+                    configuration,
+                    ".conf.spec on configuration_spec_path:\n  ",
+                    configuration_spec_path,
+                    "\n  ",
+                    path.join(app_root, "README"),
+                )
+
+        return configuration_spec
+
+    def _get_local_spec(
+        self, configuration, app_root, configuration_spec_path, filename
+    ):
+        """Returns the spec for the named configuration in an app that ships its own validation plugin
+
+        The spec is loaded from the base spec file on `configuration_spec_path` and the app-local overlay, `filename`,
+        using the app's plugin. It's keyed by the digests of the plugin and the overlay so that apps that ship the same
+        plugin and overlay share it.
+
+        :return: The spec for `configuration` or :const:`None`, if there are no spec files for `configuration`.
+        :rtype: AppConfigurationSpec
+
+        """
+        plugin = AppConfigurationValidationPlugin.get(configuration, app_root)
+        filenames = (
+            path.join(configuration_spec_path, configuration + ".conf.spec"),
+            filename,
+        )
+        digests = []
+
+        for name in filenames:
+            try:
+                digests.append(hash_object(name))
+            except (IOError, OSError) as error:
+                if error.errno not in (errno.ENOENT, errno.ENOTDIR):
+                    self._fatal(name, error)
+                digests.append(None)
+
+        specs = self._overlaid_specs
+        key = (configuration_spec_path, configuration, plugin.digest) + tuple(digests)
+        configuration_spec = specs.get(key, _missing)
+
+        if configuration_spec is _missing:
+            if digests == [None, None]:
+                configuration_spec = None
+                SlimLogger.warning(
+                    "Could not find ",
+                    configuration,
+                    ".conf.spec on configuration_spec_path:\n  ",
+                    configuration_spec_path,
+                    "\n  ",
+                    path.join(app_root, "README"),
+                )
+            else:
+                start = time()
+                configuration_spec = AppConfigurationSpec(configuration, app_root)
+                for name, digest in zip(filenames, digests):
+                    if digest is None:
+                        continue
+                    try:
+                        configuration_spec.load(name)
+                    except (IOError, OSError) as error:
+                        self._fatal(name, error)
+                self._count_load(start)
+            specs.put(key, configuration_spec)
+
+        return configuration_spec
+
+    def _load_base_spec(self, configuration, app_root, configuration_spec_path):
+        """Loads the base spec for the named configuration from `configuration_spec_path`
+
+        Base specs are not associated with an app. Callers pass `configuration_spec_path` as the `app_root` so that the
+        search for a validation plugin never looks in an app's `README` directory. The spec file is served from the
+        conf-spec bundle on `configuration_spec_path`, if it's up to date. A spec that was loaded from an identical
+        spec file with the same validation plugin is shared instead, if it's still in use.
+
+        :return: The base spec for `configuration` or :const:`None`, if there is no spec file for `configuration` on
+        `configuration_spec_path`.
+        :rtype: AppConfigurationSpec
+
+        """
+        filename = path.join(configuration_spec_path, configuration + ".conf.spec")
+
+        try:
+            digest = hash_object(filename)
+        except (IOError, OSError) as error:
+            if error.errno not in (errno.ENOENT, errno.ENOTDIR):
+                self._fatal(filename, error)
+            return None
+
+        plugin = AppConfigurationValidationPlugin.get(configuration, app_root)
+        key = configuration, digest, plugin.digest
+        configuration_spec = self._shared_specs.get(key)
+
+        if configuration_spec is not None:
+            return configuration_spec
+
+        start = time()
+        configuration_spec = AppConfigurationSpec(configuration, app_root)
+        bundle = AppConfigurationSpecBundle.get(configuration_spec_path)
+
+        try:
+            if not (bundle is not None and bundle.load(configuration_spec, filename)):
+                configuration_spec.load(filename)
+        except (IOError, OSError) as error:
+            self._fatal(filename, error)
+
+        self._count_load(start)
+        self._shared_specs[key] = configuration_spec
+        return configuration_spec
+
+    # endregion
+
+    Info = namedtuple(
+        "Info",
+        (
+            "base_hits",
+            "base_misses",
+            "base_size",
+            "overlaid_hits",
+            "overlaid_misses",
+            "overlaid_size",
+            "capacity",
+            "load_count",
+            "load_time",
+        ),
+    )
+
+
+# distinguishes specs that are not in a registry from configurations that have no spec
+_missing = object()
@@ -4,14 +4,54 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from builtins import object
-from imp import find_module, load_module
+from hashlib import sha1
 from inspect import getmembers, isclass
 from os import path
+import os
+import sys
+
+try:
+    # noinspection PyCompatibility
+    from importlib.util import module_from_spec, spec_from_file_location
+except ImportError:
+    # Python 2.7 offers no importlib.util; we fall back to imp
+    import imp
+
+    module_from_spec = spec_from_file_location = None
+
+try:
+    # noinspection PyCompatibility
+    from os import scandir
+except ImportError:
+    scandir = None
 
 from ..utils import SlimLogger, encode_filename, encode_series, slim_configuration
+from ..utils.internal import get_file_signature, hash_object, string
 
 
 class AppConfigurationValidationPlugin(object):
+    @property
+    def digest(self):
+        """Digest of the module that defines this plugin or an empty string, if this is the default plugin
+
+        The digest is cached with the modification time and size of the module file.
+
+        """
+        plugin_type = type(self)
+        if plugin_type is AppConfigurationValidationPlugin:
+            return ""
+        signature = get_file_signature(sys.modules[plugin_type.__module__].__file__)
+        try:
+            cached_signature, digest = _plugin_digests[signature[0]]
+        except KeyError:
+            pass
+        else:
+            if cached_signature == signature:
+                return digest
+        digest = hash_object(signature[0])
+        _plugin_digests[signature[0]] = signature, digest
+        return digest
+
     def fix_up(self, stanza, placement, position):
         declarations = stanza.setting_declarations
         try:
@@ -22,7 +62,7 @@ class AppConfigurationValidationPlugin(object):
             )  # nopep8, pylint: disable=import-outside-toplevel
 
             disabled = AppConfigurationSettingDeclaration.Section(
-                "disabled", "<bool>", placement, position
+                "disabled", "<bool>", placement, position.file, position.line
             )
             declarations["disabled"] = disabled
         else:
@@ -36,6 +76,12 @@ class AppConfigurationValidationPlugin(object):
         plugin is found, the default plugin represented by this class is returned. The default plugin ensures that
         the `disabled` setting is added to each stanza in the named `configuration`.
 
+        A plugin is a module named for the configuration object it validates: `<configuration>.py` or a package
+        directory named `<configuration>`. Each plugin directory is scanned once and rescanned only when its
+        modification time changes. Plugins are loaded once per directory and configuration object, and so an app's
+        plugin is never used for another app's configuration. A plugin is loaded again when the modification time or
+        size of its module file changes.
+
         :param configuration: Configuration object name.
         :type configuration: string
 
@@ -48,85 +94,97 @@ class AppConfigurationValidationPlugin(object):
         """
         cls = AppConfigurationValidationPlugin  # pylint: disable=inconsistent-return-statements
 
-        try:
-            plugin = cls._instances[configuration]  # pylint: disable=protected-access
+        for directory in (
+            path.join(app_root, "README"),
+            slim_configuration.configuration_spec_path,
+        ):
+            filename = _get_plugin_filenames(directory).get(configuration)
+            if filename is not None:
+                break
+        else:
+            return cls._default  # pylint: disable=protected-access
 
-        except KeyError:
-            plugin_path = [
-                path.join(app_root, "README"),
-                slim_configuration.configuration_spec_path,
-            ]
+        key = directory, configuration
+        signature = get_file_signature(filename)
+        signed_plugin = cls._instances.get(key)  # pylint: disable=protected-access
+
+        if signed_plugin is not None and signed_plugin[0] == signature:
+            plugin = signed_plugin[1]
+
+        else:
+            plugin_name = (
+                "slim.app.configuration_validation_plugin."
+                + configuration
+                + "_"
+                + sha1(directory.encode("utf-8")).hexdigest()[:12]
+            )
 
             try:
-                result = find_module(configuration, plugin_path)
+                plugin_module = _load_module(plugin_name, filename)
+            except ImportError as error:
+                SlimLogger.fatal(
+                    "Could not load ",
+                    plugin_name,
+                    " from ",
+                    encode_filename(filename),
+                    ": ",
+                    error,
+                )
+                return  # SlimLogger.fatal does not return, but this quiets pylint
 
-            except ImportError:
-                plugin = cls._default  # pylint: disable=protected-access
+            def predicate(member):
+                return (
+                    isclass(member)
+                    and issubclass(member, cls)
+                    and member.__module__ == plugin_name
+                )
+
+            plugins = getmembers(plugin_module, predicate)
+
+            if len(plugins) == 0:
+                SlimLogger.fatal(
+                    "Expected to find an AppConfigurationValidation-derived class in ",
+                    plugin_name,
+                    " at ",
+                    encode_filename(filename),
+                )
+                return  # SlimLogger.fatal does not return, but this quiets pylint
 
-            else:
-                plugin_name = (
-                    "slim.app.configuration_validation_plugin." + configuration
+            if len(plugins) >= 2:
+                SlimLogger.fatal(
+                    "Expected to find a single AppConfigurationValidation-derived class in ",
+                    plugin_name,
+                    " at ",
+                    encode_filename(filename),
+                    ", not ",
+                    len(plugins),
+                    ": ",
+                    encode_series(plugin[0] for plugin in plugins),
                 )
-                (
-                    file,
-                    path_name,
-                    description,
-                ) = result  # pylint: disable=redefined-builtin
-
-                with file:
-                    try:
-                        plugin_module = load_module(
-                            plugin_name, file, path_name, description
-                        )
-                    except ImportError as error:
-                        SlimLogger.fatal(
-                            "Could not load ",
-                            plugin_name,
-                            " from ",
-                            encode_filename(path_name),
-                            ": ",
-                            error,
-                        )
-                        return  # SlimLogger.fatal does not return, but this quiets pylint
-
-                def predicate(member):
-                    return (
-                        isclass(member)
-                        and issubclass(member, cls)
-                        and member.__module__ == plugin_name
-                    )
-
-                plugins = getmembers(plugin_module, predicate)
-
-                if len(plugins) == 0:
-                    SlimLogger.fatal(
-                        "Expected to find an AppConfigurationValidation-derived class in ",
-                        plugin_name,
-                        " at ",
-                        encode_filename(path_name),
-                    )
-                    return  # SlimLogger.fatal does not return, but this quiets pylint
-
-                if len(plugins) >= 2:
-                    SlimLogger.fatal(
-                        "Expected to find a single AppConfigurationValidation-derived class in ",
-                        plugin_name,
-                        " at ",
-                        encode_filename(path_name),
-                        ", not ",
-                        len(plugins),
-                        ": ",
-                        encode_series(plugin[0] for plugin in plugins),
-                    )
-                    return  # SlimLogger.fatal does not return, but this quiets pylint
-
-                plugin_class = plugins[0][1]
-                plugin = plugin_class()
-
-            AppConfigurationValidationPlugin._instances[configuration] = plugin
+                return  # SlimLogger.fatal does not return, but this quiets pylint
+
+            plugin_class = plugins[0][1]
+            plugin = plugin_class()
+            cls._instances[key] = signature, plugin  # pylint: disable=protected-access
 
         return plugin
 
+    @staticmethod
+    def is_local(configuration, app_root):
+        """Returns :const:`True`, if `{app_root}/README` defines a validation plugin for the named configuration object
+
+        :param configuration: Configuration object name.
+        :type configuration: string
+
+        :param app_root: App root directory name.
+        :type app_root: string
+
+        :rtype: bool
+
+        """
+        return configuration in _get_plugin_filenames(path.join(app_root, "README"))
+
+    # maps (directory, configuration) to (plugin file signature, plugin)
     _instances = dict()
     _default = None
 
@@ -134,3 +192,94 @@ class AppConfigurationValidationPlugin(object):
 AppConfigurationValidationPlugin._default = (
     AppConfigurationValidationPlugin()
 )  # pylint: disable=protected-access
+
+
+# region Protected
+
+_plugin_digests = {}
+_plugin_directories = {}
+
+
+def _get_plugin_filenames(directory):
+    """Returns a mapping from configuration object names to the plugin files in `directory`
+
+    The mapping is cached with the modification time of `directory`; a directory that does not exist maps no names.
+
+    """
+    try:
+        modification_time = os.stat(directory).st_mtime
+    except OSError:
+        modification_time = None
+
+    try:
+        cached_modification_time, filenames = _plugin_directories[directory]
+    except KeyError:
+        pass
+    else:
+        if cached_modification_time == modification_time:
+            return filenames
+
+    filenames = {}
+
+    if modification_time is not None:
+        for name, is_directory in _list_directory(directory):
+            if is_directory:
+                filename = path.join(directory, name, "__init__.py")
+                if path.isfile(filename):
+                    # a package takes precedence over a module of the same name
+                    filenames[name] = filename
+            elif name.endswith(".py"):
+                filenames.setdefault(name[: -len(".py")], path.join(directory, name))
+
+    _plugin_directories[directory] = modification_time, filenames
+    return filenames
+
+
+def _list_directory(directory):
+    """Lists the names in `directory` along with a value indicating whether each name is that of a directory"""
+    try:
+        if scandir is None:
+            return [
+                (name, path.isdir(path.join(directory, name)))
+                for name in os.listdir(directory)
+            ]
+        return [(entry.name, entry.is_dir()) for entry in scandir(directory)]
+    except OSError:
+        return []
+
+
+def _load_module(name, filename):
+    """Loads the module or package in `filename` under the given `name`"""
+    is_package = path.basename(filename) == "__init__.py"
+
+    if spec_from_file_location is None:
+        # Python 2.7 loads into the module already in sys.modules, if any; a plugin that changed is loaded afresh
+        sys.modules.pop(name, None)
+        if is_package:
+            return imp.load_module(
+                name, None, path.dirname(filename), ("", "", imp.PKG_DIRECTORY)
+            )
+        return imp.load_source(name, filename)
+
+    spec = spec_from_file_location(
+        name,
+        filename,
+        submodule_search_locations=[path.dirname(filename)] if is_package else None,
+    )
+
+    if spec is None:
+        raise ImportError("Not a Python module: " + string(filename))
+
+    module = module_from_spec(spec)
+    sys.modules[name] = module
+
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+
+    return module
+
+
+# endregion
@@ -4,14 +4,11 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from builtins import object
-from os import path
-from weakref import WeakValueDictionary
 
-import errno
-
-from ._configuration_spec import AppConfigurationPlacement, AppConfigurationSpec
-from ._internal import OrderedSet
-from ..utils import SlimLogger, encode_filename, slim_configuration
+from ._configuration_spec import AppConfigurationPlacement
+from ._configuration_spec_registry import AppConfigurationSpecRegistry
+from ._internal import LruCache, OrderedSet
+from ..utils import SlimLogger, slim_configuration
 
 
 class AppConfigurationValidator(object):
@@ -23,52 +20,21 @@ class AppConfigurationValidator(object):
     :param app_root:
     :type app_root: string
 
-    """
+    :param release: Khulnasoft release version (e.g., '7.0.0') or :const:`None`, if settings should be validated
+    against the specs on the configuration_spec_path.
+    :type release: string
 
-    # pylint: disable=protected-access
-    # noinspection PyProtectedMember
-    def __init__(self, configuration, app_root):
-        cls = self.__class__
-        try:
-            configuration_spec = cls._configuration_specs[configuration]
-        except KeyError:
-            # Load spec from the filesystem, looking first on the configuration_spec_path, then on <app_root>/README
-            configuration_spec_dirs = (
-                slim_configuration.configuration_spec_path,
-                path.join(app_root, "README"),
-            )
-            configuration_spec = AppConfigurationSpec(configuration, app_root)
-            basename = configuration + ".conf.spec"
-            count = 0
-
-            for configuration_spec_dir in configuration_spec_dirs:
-                filename = path.join(configuration_spec_dir, basename)
-                try:
-                    configuration_spec.load(filename)
-                except (IOError, OSError) as error:
-                    if error.errno not in (errno.ENOENT, errno.ENOTDIR):
-                        SlimLogger.fatal(
-                            "Could not load spec file ",
-                            encode_filename(filename),
-                            ": ",
-                            error.strerror,
-                        )
-                else:
-                    count += 1
-
-            if count == 0:
-                SlimLogger.warning(
-                    "Could not find ",
-                    basename,
-                    " on configuration_spec_path:\n  ",
-                    "\n  ".join(configuration_spec_dirs),
-                )
-                cls._configuration_specs[
-                    configuration
-                ] = configuration_spec = cls._NoConfigurationSpec
-            else:
-                cls._configuration_specs[configuration] = configuration_spec
+    """
 
+    def __init__(self, configuration, app_root, release=None):
+        # Specs are loaded from the configuration_spec_path--or the release's directory on the release_spec_path--and
+        # overlaid by <app_root>/README, as needed, and held by the spec registry shared by all validators in the
+        # current process
+        configuration_spec = AppConfigurationSpecRegistry.instance().get(
+            configuration, app_root, release
+        )
+        if configuration_spec is None:
+            configuration_spec = self.__class__._NoConfigurationSpec
         self._configuration_spec = configuration_spec
 
     # region Special methods
@@ -83,6 +49,22 @@ class AppConfigurationValidator(object):
 
     # endregion
 
+    # region Properties
+
+    @property
+    def digest(self):
+        """Digest of the configuration spec used by this validator
+
+        The value is an empty string, if there is no configuration spec.
+
+        """
+        configuration_spec = self._configuration_spec
+        if configuration_spec is self.__class__._NoConfigurationSpec:
+            return ""
+        return configuration_spec.digest
+
+    # endregion
+
     # region Methods
 
     # pylint: disable=protected-access
@@ -117,25 +99,116 @@ class AppConfigurationValidator(object):
         :rtype: AppConfigurationPlacement
 
         """
-        configuration_spec = self._configuration_spec
         cls = self.__class__
 
-        if configuration_spec is not cls._NoConfigurationSpec:
-            declarations = configuration_spec.match(stanza)
+        if self._configuration_spec is not cls._NoConfigurationSpec:
+            declarations, placement = self._resolve(stanza)
             if declarations is not None:
-                placement = None
-                for declaration in declarations:
-                    placement = declaration.placement.union(placement)
                 return placement
 
         return AppConfigurationPlacement.all_workloads
 
+    def is_defined(self, stanza, setting=None):
+        """Returns a value indicating whether the configuration spec defines a stanza or a setting in a stanza
+
+        Unlike the functions returned by :meth:`get`, this method logs nothing and leaves the placement of `setting`
+        alone.
+
+        :param stanza: Stanza name.
+        :type stanza: string
+
+        :param setting: App configuration setting object or :const:`None`, if the value should indicate whether
+        `stanza` is defined.
+        :type setting: AppConfigurationSetting
+
+        :return: :const:`True`, if the configuration spec defines `stanza` or `setting`; :const:`False`, if it does
+        not; or :const:`None`, if there is no configuration spec or `setting` is in a stanza it does not define.
+        :rtype: bool
+
+        """
+        configuration_spec = self._configuration_spec
+
+        if configuration_spec is self.__class__._NoConfigurationSpec:
+            return None
+
+        if stanza == "default":
+            if setting is None:
+                return True
+            return configuration_spec.match_setting(setting.name) is not None
+
+        stanza_declarations = self._resolve(stanza)[0]
+
+        if setting is None:
+            return stanza_declarations is not None
+
+        if stanza_declarations is None:
+            return None
+
+        return any(
+            declaration.match(setting) is not None
+            for declaration in stanza_declarations
+        )
+
+    @classmethod
+    def stanza_memo_info(cls):
+        """Gets the hit count, miss count, capacity, and size of the memo of resolved stanza names
+
+        The memo is shared by all validators in the current process. Its capacity is set by
+        `slim_configuration.validation_memo_size`.
+
+        :rtype: LruCache.Info
+
+        """
+        return cls._get_stanza_memo().info()
+
     # endregion
 
     # region Protected
 
-    _configuration_specs = WeakValueDictionary()
     _NoConfigurationSpec = type(str("NoConfigurationSpec"), (), {})
+    _stanza_memo = None
+
+    @classmethod
+    def _get_stanza_memo(cls):
+        memo = cls._stanza_memo
+        if memo is None:
+            memo = cls._stanza_memo = LruCache(slim_configuration.validation_memo_size)
+        return memo
+
+    def _resolve(self, stanza):
+        """Resolves the stanza declarations and placement of the named configuration stanza
+
+        Resolutions are memoized by spec digest and stanza name. Identical stanza names--`[default]`,
+        `[monitor://...]`, `[script://...]`, and the like--are resolved once in the current process no matter how
+        many conf files or apps they appear in.
+
+        :param stanza: Stanza name.
+        :type stanza: string
+
+        :return: A pair: the stanza declarations matching `stanza` followed by those matching `default`, without
+        duplicates, or :const:`None`, if no stanza declaration matches `stanza`; and the union of the placements of
+        the stanza declarations matching `stanza`.
+        :rtype: tuple
+
+        """
+        configuration_spec = self._configuration_spec
+        memo = self._get_stanza_memo()
+        key = (configuration_spec.digest, stanza)
+        value = memo.get(key)
+
+        if value is None:
+            declarations = configuration_spec.match(stanza)
+            placement = None
+            if declarations is not None:
+                for declaration in declarations:
+                    placement = declaration.placement.union(placement)
+                declarations = tuple(
+                    OrderedSet(declarations + configuration_spec.match("default"))
+                )
+            value = declarations, placement
+            memo.put(key, value)
+
+        return value
 
     # TODO: Extract functions from common code segments in the following validation functions
 
@@ -150,18 +223,18 @@ class AppConfigurationValidator(object):
 
         def validate(setting):
 
-            for stanza_declaration in configuration_spec.stanza_declarations():
-                setting_declaration = stanza_declaration.match(setting)
-                if setting_declaration is not None:
-                    setting._placement = setting_declaration.placement
-                    return True
+            setting_declaration = configuration_spec.match_setting(setting.name)
+
+            if setting_declaration is not None:
+                setting._set_placement(setting_declaration.placement)
+                return True
 
             SlimLogger.warning(
                 setting.position,
                 ": Undefined setting in stanza [default]: ",
                 setting.name,
             )
-            setting._placement = AppConfigurationPlacement.all_workloads
+            setting._set_placement(AppConfigurationPlacement.all_workloads)
             return False
 
         return validate
@@ -177,7 +250,7 @@ class AppConfigurationValidator(object):
 
         """
         configuration_spec = self._configuration_spec
-        stanza_declarations = configuration_spec.match(stanza.name)
+        stanza_declarations, placement = self._resolve(stanza.name)
 
         if stanza_declarations is None:
             SlimLogger.warning(
@@ -188,16 +261,12 @@ class AppConfigurationValidator(object):
             )
             return AppConfigurationValidator._validate
 
-        stanza_declarations = OrderedSet(
-            stanza_declarations + configuration_spec.match("default")
-        )
-
         def validate(setting):
 
             for stanza_declaration in stanza_declarations:
                 setting_declaration = stanza_declaration.match(setting)
                 if setting_declaration is not None:
-                    setting._placement = setting_declaration.placement
+                    setting._set_placement(setting_declaration.placement)
                     return True
 
             SlimLogger.warning(
@@ -210,7 +279,7 @@ class AppConfigurationValidator(object):
                 setting.name,
             )
 
-            setting._placement = AppConfigurationPlacement.all_workloads
+            setting._set_placement(AppConfigurationPlacement.all_workloads)
             return False
 
         return validate
@@ -223,7 +292,7 @@ class AppConfigurationValidator(object):
         :return: const:`True`
 
         """
-        setting._placement = AppConfigurationPlacement.all_workloads
+        setting._set_placement(AppConfigurationPlacement.all_workloads)
         return True
 
     # endregion
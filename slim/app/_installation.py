@@ -87,6 +87,25 @@ _iterencode = _encoder.iterencode
 
 
 class AppInstallation(object):
+
+    # An installation graph holds one of these per app per server class. To keep them small, each is slot-based, shares
+    # its version and version range with other installations, and stores an empty tuple in place of each collection
+    # that is empty. An empty collection is replaced by an OrderedDict on first access by way of its property.
+
+    __slots__ = (
+        "_dependencies",
+        "_dependents",
+        "_deployment_package",
+        "_input_groups",
+        "_is_external",
+        "_is_root",
+        "_optional_dependencies",
+        "_server_class",
+        "_source",
+        "_version",
+        "_version_range",
+    )
+
     def __init__(self, server_class, app_info):
         def source():
             try:
@@ -110,7 +129,7 @@ class AppInstallation(object):
                 if isinstance(value, Version):
                     return value
                 try:
-                    return Version.coerce(string(value))
+                    return interns.coerce_version(string(value))
                 except ValueError:
                     SlimLogger.error("Expected version string, not ", value)
             return (
@@ -118,20 +137,24 @@ class AppInstallation(object):
             )  # cracks the source package and extracts its version number
 
         input_groups = app_info.inputGroups
+        interns = server_class.interns
+        intern = interns.intern
 
-        self._input_groups = OrderedDict(
-            (name, set(input_groups[name])) for name in input_groups
+        self._input_groups = _new_collection(
+            (intern(name), set(input_groups[name])) for name in input_groups
         )
-        self._dependencies = OrderedDict(
-            (app_id, None) for app_id in app_info.dependencies
+        self._dependencies = _new_collection(
+            (intern(app_id), None) for app_id in app_info.dependencies
         )
         if hasattr(app_info, "optional_dependencies"):
-            self._optional_dependencies = OrderedDict(
-                (app_id, None) for app_id in app_info.optional_dependencies
+            self._optional_dependencies = _new_collection(
+                (intern(app_id), None) for app_id in app_info.optional_dependencies
             )
         else:
-            self._optional_dependencies = {}
-        self._dependents = OrderedDict((app_id, None) for app_id in app_info.dependents)
+            self._optional_dependencies = ()
+        self._dependents = _new_collection(
+            (intern(app_id), None) for app_id in app_info.dependents
+        )
         self._is_external = app_info.get("is_external", False)
         self._is_root = app_info.get("is_root", False)
         self._source = source()
@@ -139,7 +162,7 @@ class AppInstallation(object):
 
         self._server_class = server_class
         self._deployment_package = None
-        self._version_range = []
+        self._version_range = ()
 
     # region Special methods
 
@@ -155,15 +178,24 @@ class AppInstallation(object):
 
     @property
     def dependencies(self):
-        return self._dependencies
+        value = self._dependencies
+        if isinstance(value, tuple):
+            value = self._dependencies = OrderedDict()
+        return value
 
     @property
     def optional_dependencies(self):
-        return self._optional_dependencies
+        value = self._optional_dependencies
+        if isinstance(value, tuple):
+            value = self._optional_dependencies = OrderedDict()
+        return value
 
     @property
     def dependents(self):
-        return self._dependents
+        value = self._dependents
+        if isinstance(value, tuple):
+            value = self._dependents = OrderedDict()
+        return value
 
     @property
     def deployment_package(self):
@@ -171,7 +203,10 @@ class AppInstallation(object):
 
     @property
     def input_groups(self):
-        return self._input_groups
+        value = self._input_groups
+        if isinstance(value, tuple):
+            value = self._input_groups = OrderedDict()
+        return value
 
     @input_groups.setter
     def input_groups(self, value):
@@ -288,7 +323,7 @@ class AppInstallation(object):
 
     def merge_input_groups(self, other):
 
-        input_groups = self._input_groups
+        input_groups = self.input_groups
 
         for name, other_aids in other.input_groups.items():
             self_aids = input_groups.get(name)
@@ -310,7 +345,9 @@ class AppInstallation(object):
         for dependent in self.dependents.values():
             version_range.append(string(dependent.dependencies[app_id].version_range))
 
-        self._version_range = semantic_version.Spec(*version_range)
+        self._version_range = self._server_class.interns.get_version_range(
+            version_range
+        )
 
     def resolve_dependencies(self, graph):
 
@@ -353,7 +390,9 @@ class AppInstallation(object):
                     version_range.append(string(dependency.version_range))
                 dependents[name] = installation
 
-        self._version_range = semantic_version.Spec(*version_range)
+        self._version_range = self._server_class.interns.get_version_range(
+            version_range
+        )
 
         if not self._version_range.match(self._version):
             SlimLogger.error(
@@ -366,18 +405,21 @@ class AppInstallation(object):
             )
 
     def to_dict(self):
+        input_groups = self._input_groups
         return OrderedDict(
             (
-                ("dependencies", list(self.dependencies.keys())),
-                ("optional_dependencies", list(self.optional_dependencies.keys())),
-                ("dependents", list(self.dependents.keys())),
+                ("dependencies", list(self._dependencies)),
+                ("optional_dependencies", list(self._optional_dependencies)),
+                ("dependents", list(self._dependents)),
                 ("is_external", self._is_external),
                 ("is_root", self._is_root),
                 (
                     "inputGroups",
                     OrderedDict(
                         (fg, sorted(aids))
-                        for fg, aids in sorted(self.input_groups.items())
+                        for fg, aids in sorted(
+                            input_groups.items() if len(input_groups) > 0 else ()
+                        )
                         if len(aids) > 0
                     ),
                 ),
@@ -543,7 +585,8 @@ class AppInstallationGraph(Mapping):
                     _encode(info),
                 )
                 continue  # Keep going to discover and report other errors of this type
-            graph[name] = installation
+            # keyed by the app id held by the installation's source, which is shared with other installations
+            graph[installation.id] = installation
 
         self._resolve()
 
@@ -749,9 +792,12 @@ class AppInstallationGraph(Mapping):
                 return False
             visited.add(app_id)
             graph_path.add(app_id)
-            for dependency_id, dependency in installation.dependencies.items():
+            # pylint: disable=protected-access
+            dependencies = installation._dependencies
+            for dependency_id in dependencies:
                 if dependency_id in graph_path:
                     return True
+                dependency = dependencies[dependency_id]
                 if dependency is None:
                     continue  # unresolved dependency
                 if visit(dependency_id, dependency.installation):
@@ -1039,3 +1085,69 @@ class AppInstallationGraph(Mapping):
 
     # endregion
     pass  # pylint: disable=unnecessary-pass
+
+
+class AppInstallationInterns(object):
+    """Shares the app ids, input group names, versions, and version ranges of the installations in an installation graph
+
+    The server classes of a collection share one instance, which lives as long as the collection does and so is
+    released with it. A server class created on its own has an instance of its own.
+
+    """
+
+    __slots__ = ("_names", "_version_ranges", "_versions")
+
+    def __init__(self):
+        self._names = {}
+        self._version_ranges = {}
+        self._versions = {}
+
+    # region Special methods
+
+    def __len__(self):
+        return len(self._names) + len(self._version_ranges) + len(self._versions)
+
+    # endregion
+
+    # region Methods
+
+    def coerce_version(self, value):
+        """Returns the version coerced from `value` and shares it with all other installations of that version"""
+        versions = self._versions
+        try:
+            return versions[value]
+        except KeyError:
+            version = versions[value] = Version.coerce(value)
+            return version
+
+    def get_version_range(self, specs):
+        """Returns the version range for `specs` and shares it with all other installations required to be in that
+        range"""
+        key = tuple(specs)
+        version_ranges = self._version_ranges
+        try:
+            return version_ranges[key]
+        except KeyError:
+            # an app with no dependents may be any version, but semantic_version 2.7 and later reject an empty Spec
+            version_range = version_ranges[key] = semantic_version.Spec(
+                *(key or ("*",))
+            )
+            return version_range
+
+    def intern(self, name):
+        return self._names.setdefault(name, name)
+
+    # endregion
+    pass  # pylint: disable=unnecessary-pass
+
+
+# region Protected
+
+
+def _new_collection(items):
+    """Returns an OrderedDict over `items` or the empty tuple, if there are no `items`"""
+    items = tuple(items)
+    return OrderedDict(items) if len(items) > 0 else ()
+
+
+# endregion
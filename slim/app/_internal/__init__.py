@@ -6,9 +6,13 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from .file_buffer import FileBuffer
 from .file_position import FilePosition
 from .file_reader import FileReader
+from .installation_snapshot import InstallationGraphSnapshot
+from .lru_cache import LruCache
 from .named_object import NamedObject
 from .object_view import ObjectView
 from .ordered_set import OrderedSet
+from .persistent_cache import PersistentCache
+from .segment_pattern import SegmentPattern
 
 from .json_data import (
     JsonArray,
@@ -15,13 +15,31 @@ from future.utils import with_metaclass
 
 
 from .file_reader import FileReader
+from ...utils import slim_configuration
 from ...utils.internal import string
 
 
 class FileBuffer(with_metaclass(ABCMeta, object)):
-    def __init__(self, filename):
+    """Base class for buffers over the lines of a text file
+
+    A buffer keeps a record of every line it loads, including blank lines and comments, so that it can be saved
+    without loss. A lean buffer keeps no such records and derived classes may drop content that is only needed to save
+    a file. Lean buffers are for read-only use; they cannot be saved.
+
+    :param filename: Name of the file to buffer.
+    :type filename: string
+
+    :param lean: :const:`True`, if the buffer should be lean. The default is `slim_configuration.lean_parsing`.
+    :type lean: bool
+
+    """
+
+    def __init__(self, filename, lean=None):
+        if lean is None:
+            lean = slim_configuration.lean_parsing
         self._filename = path.abspath(filename)
-        self._records = []
+        self._lean = lean
+        self._records = None if lean else []
 
     # region Properties
 
@@ -29,6 +47,10 @@ class FileBuffer(with_metaclass(ABCMeta, object)):
     def filename(self):
         return self._filename
 
+    @property
+    def lean(self):
+        return self._lean
+
     # endregion
 
     # region Methods
@@ -70,6 +92,11 @@ class FileBuffer(with_metaclass(ABCMeta, object)):
     # pylint: disable=redefined-builtin
     def save(self, file=None):
 
+        if self._lean:
+            raise ValueError(
+                "Cannot save a file buffer loaded in lean mode: " + self._filename
+            )
+
         if file is None:
             file = self._filename
 
@@ -92,10 +119,11 @@ class FileBuffer(with_metaclass(ABCMeta, object)):
         ("utf-32", (BOM_UTF32_LE, BOM_UTF32_BE)),
     )
 
-    def _append(self, item, position, indentation):
-        """Appends an item with the given indentation to the current Buffer"""
+    def _append(self, item, line, indentation):
+        """Appends an item read from the given line number with the given indentation to the current Buffer"""
         records = self._records
-        records.append(FileBuffer._Record(item, position, indentation))
+        if records is not None:
+            records.append(FileBuffer._Record(item, line, indentation))
 
     def _dump(self, ostream):
         pass  # TODO: implement FileBuffer._dump
@@ -130,7 +158,7 @@ class FileBuffer(with_metaclass(ABCMeta, object)):
         pass
 
     # noinspection PyClassHasNoInit
-    class _Record(namedtuple("_Record", ("item", "position", "column"))):
+    class _Record(namedtuple("_Record", ("item", "line", "column"))):
         __slots__ = ()  # no extra slots required for this derived type
 
         def __str__(self):
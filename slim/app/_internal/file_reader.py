@@ -3,17 +3,26 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 from collections import Iterator  # pylint: disable=no-name-in-module
+import re
 
 from ...utils.internal import string
 from .file_position import FilePosition
 
 
 class FileReader(Iterator):
+    """Reads the lines of a text stream
+
+    The stream is read in full and split into lines in a single pass when the reader is constructed. Lines keep their
+    trailing newline and are served from a list. The lines of a continuation are joined in one step.
+
+    """
+
     def __init__(self, istream, filename):
         self._filename = filename
-        self._istream = istream
+        self._lines = self._split_lines(istream.read())
         self._line_number = 0
         self._line = None
+        self._position = None
 
     def __iter__(self):
         get = self.__next__
@@ -31,29 +40,48 @@ class FileReader(Iterator):
 
     @property
     def position(self):
-        return FilePosition(self._filename, self._line_number)
+        position = self._position
+        if position is None or position.line != self._line_number:
+            position = self._position = FilePosition(self._filename, self._line_number)
+        return position
 
     def __next__(self):
         line = self._line
         if line:
             self._line = None
             return line
-        line = next(self._istream)
-        self._line_number += 1
+        line_number = self._line_number
+        try:
+            line = self._lines[line_number]
+        except IndexError:
+            raise StopIteration()
+        self._line_number = line_number + 1
         return line
 
     # this is done because we have no control of the base class
     next = __next__
 
     def read_continuation(self, line):
-        readline = self.__next__
-        while line.endswith("\\\n"):
-            try:
-                continuation = readline()
-            except StopIteration:
-                break
-            line = line[:-2] + "\n" + continuation
-        return line
+        if self._line:
+            # a line was put back; read the continuation one line at a time
+            readline = self.__next__
+            while line.endswith("\\\n"):
+                try:
+                    continuation = readline()
+                except StopIteration:
+                    break
+                line = line[:-2] + "\n" + continuation
+            return line
+        lines = self._lines
+        line_number, count = self._line_number, len(lines)
+        parts = [line]
+        while line.endswith("\\\n") and line_number < count:
+            parts[-1] = line[:-2]
+            line = lines[line_number]
+            parts.append(line)
+            line_number += 1
+        self._line_number = line_number
+        return parts[0] if len(parts) == 1 else "\n".join(parts)
 
     @property
     def filename(self):
@@ -66,3 +94,20 @@ class FileReader(Iterator):
     def put_back(self, line):
         assert self._line is None
         self._line = line
+
+    # region Protected
+
+    @staticmethod
+    def _split_lines(text):
+        # str.splitlines is the fastest way to split text, but it also breaks lines at form feeds, vertical tabs, and
+        # the like; we only use it when the text contains no line boundaries other than newline characters
+        if FileReader._search_line_boundary(text) is None:
+            return text.splitlines(True)
+        return FileReader._find_lines(text)
+
+    _find_lines = re.compile(r"[^\n]*\n|[^\n]+", re.U).findall
+    _search_line_boundary = re.compile(
+        "[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]", re.U
+    ).search
+
+    # endregion
@@ -0,0 +1,459 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from builtins import object
+from collections import Mapping, OrderedDict  # pylint: disable=no-name-in-module
+from json import JSONDecoder, JSONEncoder
+from os import path
+from tempfile import mkstemp
+import io
+import mmap
+import os
+import struct
+
+from ...utils.internal import replace_file, string
+
+
+class InstallationGraphSnapshot(object):
+    """Presents a read-only, memory-mapped view over an installation graph saved as a binary snapshot
+
+    A snapshot is an alternative to the JSON form of an installation graph that can be read without decoding it. It
+    consists of a header, an index of server classes, a string table, and one record per server class. All integers
+    are unsigned 32-bit little-endian values.
+
+    The header is the `magic` number, format version, server class count, string table offset, and string count. Each
+    entry in the index is a server class name, record offset, and record size. The string table is an array of string
+    count + 1 offsets followed by the UTF-8 encoded strings they delimit. App ids, package names, version numbers,
+    input group names, workload names, and server class names are each stored once in the string table and referenced
+    by index.
+
+    A record begins with its kind. A server class shaped as :meth:`AppServerClass.to_dict` shapes them is a structured
+    record: workload names, app count, then arrays of app id, source package, version, and flags (`is_root` and
+    `is_external`) indexed by app, and finally the dependencies, optional dependencies, dependents, and input groups of
+    each app. Any other server class is saved as a JSON text record. Hence conversion between JSON and snapshot is
+    lossless: the value of every server class--including the order of its keys--is preserved.
+
+    Use :meth:`InstallationGraphSnapshot.open` to create instances and :meth:`InstallationGraphSnapshot.save` to save
+    an installation graph as a snapshot.
+
+    """
+
+    magic = b"\x89SLIMIG\n"
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        version, count, string_table, string_count = struct.unpack_from(
+            "<4I", buffer, len(self.magic)
+        )
+        if version != self._version:
+            raise ValueError(
+                "Expected snapshot format version "
+                + string(self._version)
+                + ", not "
+                + string(version)
+            )
+        index = struct.unpack_from(
+            "<" + string(3 * count) + "I", buffer, self._header_size
+        )
+        self._string_offsets = struct.unpack_from(
+            "<" + string(string_count + 1) + "I", buffer, string_table
+        )
+        self._string_data = string_table + 4 * (string_count + 1)
+        self._strings = [None] * string_count
+        self._decoded_count = 0
+        self._records = [
+            InstallationGraphSnapshot.Record(self, *index[i : i + 3])
+            for i in range(0, len(index), 3)
+        ]
+
+    # region Special methods
+
+    def __iter__(self):
+        return self._records.__iter__()
+
+    def __len__(self):
+        return self._records.__len__()
+
+    # endregion
+
+    # region Methods
+
+    @classmethod
+    def open(cls, file):  # pylint: disable=redefined-builtin
+        """Returns a snapshot mapped from `file` or :const:`None`, if `file` does not hold a snapshot
+
+        :param file: Name of a file or a file object backed by a file descriptor.
+        :type file: string or file
+
+        :raises ValueError: `file` holds a snapshot that cannot be read.
+
+        :rtype: InstallationGraphSnapshot
+
+        """
+        try:
+            if isinstance(file, string):
+                with io.open(file, "rb") as istream:
+                    buffer = mmap.mmap(istream.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, IOError, OSError, ValueError):
+            return None  # not a file, not a regular file, or an empty one
+
+        if buffer[: len(cls.magic)] != cls.magic:
+            buffer.close()
+            return None
+
+        try:
+            return cls(buffer)
+        except struct.error as error:
+            buffer.close()
+            raise ValueError("Truncated snapshot: " + string(error))
+
+    @classmethod
+    def save(cls, filename, server_classes):
+        """Saves an installation graph to `filename` as a snapshot
+
+        The snapshot is written to a temporary file which then replaces `filename`, and so a snapshot that's mapped
+        from `filename` remains readable.
+
+        :param filename: Name of the file to save.
+        :type filename: string
+
+        :param server_classes: Name and value of each server class in the installation graph.
+        :type server_classes: typing.Iterable[typing.Tuple[string, OrderedDict]]
+
+        """
+        strings = OrderedDict()
+
+        def intern(value):
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            return index
+
+        names = []
+        records = []
+
+        for name, value in server_classes:
+            names.append(intern(name))
+            records.append(_pack_record(value, intern))
+
+        encoded_strings = [value.encode("utf-8") for value in strings]
+        string_offsets = [0]
+        for value in encoded_strings:
+            string_offsets.append(string_offsets[-1] + len(value))
+
+        string_table = cls._header_size + 12 * len(records)
+        offset = string_table + 4 * len(string_offsets) + string_offsets[-1]
+        index = []
+
+        for name, record in zip(names, records):
+            index += (name, offset, len(record))
+            offset += len(record)
+
+        file_no, temporary_filename = mkstemp(dir=path.dirname(filename) or ".")
+        try:
+            umask = os.umask(0)
+            os.umask(umask)
+            # mkstemp creates files that only the owner can read
+            os.chmod(temporary_filename, 0o666 & ~umask)
+            with io.open(file_no, "wb") as ostream:
+                ostream.write(cls.magic)
+                ostream.write(
+                    struct.pack(
+                        "<4I", cls._version, len(records), string_table, len(strings)
+                    )
+                )
+                ostream.write(_pack_integers(index))
+                ostream.write(_pack_integers(string_offsets))
+                for value in encoded_strings:
+                    ostream.write(value)
+                for record in records:
+                    ostream.write(record)
+            replace_file(temporary_filename, filename)
+        finally:
+            if path.exists(temporary_filename):
+                os.remove(temporary_filename)
+
+    # endregion
+
+    # region Protected
+
+    _header_size = len(magic) + 16
+    _version = 1
+
+    def _get_string(self, index):
+        value = self._strings[index]
+        if value is None:
+            start, end = self._string_offsets[index : index + 2]
+            data = self._string_data
+            value = self._buffer[data + start : data + end].decode("utf-8")
+            self._strings[index] = value
+        return value
+
+    def _get_strings(self):
+        """Returns the string table, decoding any strings that have not yet been decoded
+
+        Strings are decoded on demand: server class names as they are read and all others when the first
+        server class record is decoded.
+
+        """
+        strings = self._strings
+        if self._decoded_count < len(strings):
+            get_string = self._get_string
+            for index, value in enumerate(strings):
+                if value is None:
+                    get_string(index)
+            self._decoded_count = len(strings)
+        return strings
+
+    # endregion
+
+    class Record(object):
+        """Presents the record of a single server class in a snapshot
+
+        Nothing but the name of the server class is decoded until it's requested.
+
+        """
+
+        __slots__ = ("_name", "_offset", "_size", "_snapshot")
+
+        def __init__(self, snapshot, name, offset, size):
+            self._snapshot = snapshot
+            self._name = name
+            self._offset = offset
+            self._size = size
+
+        # region Properties
+
+        @property
+        def name(self):
+            return self._snapshot._get_string(self._name)
+
+        # endregion
+
+        # region Methods
+
+        def get_packages(self):
+            """Returns a mapping from the id of each app installed on the server class to the name of its source package
+
+            Package names are the base names of the sources recorded, as they are for a server class loaded from JSON.
+            :const:`None` is returned, if the server class is saved as a JSON text record.
+
+            :rtype: OrderedDict
+
+            """
+            integers = self._unpack()
+            if integers is None:
+                return None
+            strings = self._snapshot._get_strings()
+            try:
+                start = 3 + integers[1]
+                count = integers[start - 1]
+                return OrderedDict(
+                    (strings[app_id], path.basename(strings[source]))
+                    for app_id, source in zip(
+                        integers[start : start + count],
+                        integers[start + count : start + 2 * count],
+                    )
+                )
+            except IndexError:
+                raise ValueError("Malformed snapshot record")
+
+        def get_value(self):
+            """Returns the value of the server class as decoded from its JSON form
+
+            :rtype: OrderedDict
+
+            """
+            integers = self._unpack()
+            if integers is None:
+                return _decode(self._get_text())
+            try:
+                return _unpack_record(integers, self._snapshot._get_strings())
+            except IndexError:
+                raise ValueError("Malformed snapshot record")
+
+        def to_json(self):
+            """Returns the JSON text of the server class
+
+            :rtype: string
+
+            """
+            if self._unpack() is None:
+                return self._get_text()
+            return string(_encode(self.get_value()))
+
+        # endregion
+
+        # region Protected
+
+        def _get_text(self):
+            offset = self._offset + 4
+            return self._snapshot._buffer[offset : self._offset + self._size].decode(
+                "utf-8"
+            )
+
+        def _unpack(self):
+            """Returns the integers in a structured record or :const:`None`, if this is a JSON text record"""
+            buffer, offset = self._snapshot._buffer, self._offset
+            try:
+                kind = struct.unpack_from("<I", buffer, offset)[0]
+                if kind == _json_record:
+                    return None
+                if kind != _structured_record or self._size % 4 != 0:
+                    raise ValueError("Unknown record kind: " + string(kind))
+                return struct.unpack_from(
+                    "<" + string(self._size // 4) + "I", buffer, offset
+                )
+            except struct.error as error:
+                raise ValueError("Truncated snapshot: " + string(error))
+
+        # endregion
+        pass  # pylint: disable=unnecessary-pass
+
+    pass  # pylint: disable=unnecessary-pass
+
+
+# region Protected
+
+_app_field_names = (
+    "dependencies",
+    "optional_dependencies",
+    "dependents",
+    "is_external",
+    "is_root",
+    "inputGroups",
+    "source",
+    "version",
+)
+
+_decode = JSONDecoder(object_pairs_hook=OrderedDict).decode
+_encode = JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_json_record = 1
+_structured_record = 0
+
+
+def _is_string_list(value):
+    return isinstance(value, list) and all(isinstance(item, string) for item in value)
+
+
+def _is_structured(value):
+    """Returns :const:`True`, if the server class `value` can be saved as a structured record without loss"""
+    if not isinstance(value, Mapping) or list(value) != ["workload", "apps"]:
+        return False
+    apps = value["apps"]
+    if not (_is_string_list(value["workload"]) and isinstance(apps, Mapping)):
+        return False
+    for info in apps.values():
+        if not (
+            isinstance(info, Mapping)
+            and tuple(info) == _app_field_names
+            and _is_string_list(info["dependencies"])
+            and _is_string_list(info["optional_dependencies"])
+            and _is_string_list(info["dependents"])
+            and isinstance(info["is_external"], bool)
+            and isinstance(info["is_root"], bool)
+            and isinstance(info["inputGroups"], Mapping)
+            and all(_is_string_list(item) for item in info["inputGroups"].values())
+            and isinstance(info["source"], string)
+            and isinstance(info["version"], string)
+        ):
+            return False
+    return True
+
+
+def _pack_integers(integers):
+    return struct.pack("<" + string(len(integers)) + "I", *integers)
+
+
+def _pack_record(value, intern):
+    """Returns the bytes of a structured record for the server class `value` or a JSON text record, if `value` is
+    not shaped for a structured record"""
+
+    if not _is_structured(value):
+        return _pack_integers((_json_record,)) + string(_encode(value)).encode("utf-8")
+
+    workload = value["workload"]
+    apps = value["apps"]
+    infos = list(apps.values())
+
+    integers = [_structured_record, len(workload)]
+    integers += (intern(name) for name in workload)
+    integers.append(len(apps))
+    integers += (intern(app_id) for app_id in apps)
+    integers += (intern(info["source"]) for info in infos)
+    integers += (intern(info["version"]) for info in infos)
+    integers += (int(info["is_root"]) | int(info["is_external"]) << 1 for info in infos)
+
+    for info in infos:
+        for name in "dependencies", "optional_dependencies", "dependents":
+            app_ids = info[name]
+            integers.append(len(app_ids))
+            integers += (intern(app_id) for app_id in app_ids)
+        input_groups = info["inputGroups"]
+        integers.append(len(input_groups))
+        for name, app_ids in input_groups.items():
+            integers += (intern(name), len(app_ids))
+            integers += (intern(app_id) for app_id in app_ids)
+
+    return _pack_integers(integers)
+
+
+def _unpack_record(integers, strings):
+    """Returns the server class value saved in a structured record given the integers that make it up"""
+
+    position = 2 + integers[1]
+    workload = [strings[index] for index in integers[2:position]]
+    count = integers[position]
+    position += 1
+
+    columns = [
+        integers[position + i * count : position + (i + 1) * count] for i in range(4)
+    ]
+    position += 4 * count
+    apps = OrderedDict()
+
+    for app_id, source, version, flags in zip(*columns):
+        lists = []
+        for _ in range(3):  # dependencies, optional dependencies, and dependents
+            length = integers[position]
+            if length == 0:
+                lists.append([])
+                position += 1
+            else:
+                end = position + 1 + length
+                lists.append([strings[index] for index in integers[position + 1 : end]])
+                position = end
+        input_groups = OrderedDict()
+        group_count = integers[position]
+        position += 1
+        for _ in range(group_count):
+            name = strings[integers[position]]
+            end = position + 2 + integers[position + 1]
+            input_groups[name] = [
+                strings[index] for index in integers[position + 2 : end]
+            ]
+            position = end
+        apps[strings[app_id]] = OrderedDict(
+            (
+                ("dependencies", lists[0]),
+                ("optional_dependencies", lists[1]),
+                ("dependents", lists[2]),
+                ("is_external", flags & 2 != 0),
+                ("is_root", flags & 1 != 0),
+                ("inputGroups", input_groups),
+                ("source", strings[source]),
+                ("version", strings[version]),
+            )
+        )
+
+    if position != len(integers):
+        raise ValueError("Malformed snapshot record")
+
+    return OrderedDict((("workload", workload), ("apps", apps)))
+
+
+# endregion
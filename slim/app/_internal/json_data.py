@@ -29,7 +29,12 @@ except ImportError:
 
 
 class JsonSchema(object):
-    """
+    """Validates and converts JSON values against a definition
+
+    The definition is compiled on first use into a function specialized for it that checks and converts a value in a
+    single walk. Valid values--the common case--are converted without interpreting the definition. When the walk finds
+    an error, it undoes the changes it made to the value and the value is validated and converted by interpreting the
+    definition, so that errors are reported as they always have been.
 
     :param name:
     :type name: string
@@ -39,20 +44,34 @@ class JsonSchema(object):
 
     """
 
-    __slots__ = ("name", "definition")
+    __slots__ = ("name", "definition", "_convert")
 
     # noinspection PyPropertyAccess
     def __init__(self, name, definition):
         assert isinstance(definition, JsonValue)
         self.name = name
         self.definition = definition
+        self._convert = None
 
     def convert_from(self, value, onerror=None):
         if onerror is None:
             onerror = self._onerror
-        name = self.name
-        self.definition.validate(name, value, onerror)
-        return self.definition.convert_from(name, value, onerror)
+        convert = self._convert
+        if convert is None:
+            convert = self._convert = self.definition.compile_convert()
+        undo = []
+        try:
+            return convert(value, undo)
+        except Exception:  # pylint: disable=broad-except
+            # changes are recorded after they're made--innermost first--and so they're undone outermost first
+            for container, key, item in reversed(undo):
+                if item is _missing:
+                    del container[key]
+                else:
+                    container[key] = item
+        definition, name = self.definition, self.name
+        definition.validate(name, value, onerror)
+        return definition.convert_from(name, value, onerror)
 
     def to_html(self):
         return e.TABLE(
@@ -108,6 +127,44 @@ class JsonValue(object):
 
     # pylint: enable=too-many-arguments
 
+    def compile_check(self):
+        """Returns a function that takes a value and returns the value :meth:`validate` would return, without
+        reporting errors
+
+        :rtype: function
+
+        """
+        check = self.data_type.compile_check()
+        if self.required is True:
+            return lambda value: value is not None and check(value)
+        return lambda value: value is None or check(value)
+
+    def compile_convert(self):
+        """Returns a function of `value` and `undo` that converts a valid value as :meth:`convert_from` would
+
+        The function raises an exception, if `value` is not valid. It records each change it makes to `value` in `undo`
+        as a tuple of container, key, and prior item; an item of `_missing` means that the key was absent.
+
+        :rtype: function
+
+        """
+        default = self.default
+        convert = self.data_type.compile_convert(self.converter)
+
+        if self.required is True:
+
+            def convert_from(value, undo):
+                if value is None:
+                    raise _InvalidValue()
+                return convert(value, undo)
+
+            return convert_from
+
+        def convert_from(value, undo):  # pylint: disable=function-redefined
+            return default if value is None else convert(value, undo)
+
+        return convert_from
+
     def convert_from(self, name, value, onerror):
         if value is None:
             if self.required is True:
@@ -195,6 +252,28 @@ class JsonDataType(with_metaclass(ABCMeta, object)):
     def name(self):
         pass
 
+    def compile_check(self):
+        """Returns a function that takes a value and returns the value :meth:`validate` would return, without
+        reporting errors
+
+        Data types that override :meth:`validate` must override this method too.
+
+        :rtype: function
+
+        """
+        return self.is_instance
+
+    def compile_convert(self, converter):
+        """Returns a function of `value` and `undo` that checks and converts a value as described by
+        :meth:`JsonValue.compile_convert`
+
+        Data types that override :meth:`convert_from` must override this method too.
+
+        :rtype: function
+
+        """
+        return _compile_convert(self, self.is_instance, converter, None)
+
     # pylint: disable=too-many-arguments
     def convert_from(self, name, value, converter, default, onerror):
         if not self.validate(name, value, onerror):
@@ -232,6 +311,49 @@ class JsonArray(JsonDataType):
     def name(self):
         return "Array of " + self._definition.data_type.name
 
+    def compile_check(self):
+        is_instance, check_element = self.is_instance, self._definition.compile_check()
+
+        def check(value):
+            if not is_instance(value):
+                return False
+            for element in value:
+                if not check_element(element):
+                    return False
+            return True
+
+        return check
+
+    def compile_convert(self, converter):
+        is_instance = self.is_instance
+        is_element = self._definition.data_type.is_instance
+        convert_element = self._definition.compile_convert()
+        convert = None if converter is None else converter.convert_from
+        data_type = self
+
+        # An element is validated element by element--like any other array--and then converted as an array of one (see
+        # validate and is_instance). Hence we check it as an array before we convert it as an element.
+        check = self.compile_check()
+
+        def convert_from(value, undo):
+            if not is_instance(value):
+                raise _InvalidValue()
+            if is_element(value):
+                if not check(value):
+                    raise _InvalidValue()
+                value = [convert_element(value, undo)]
+            elif isinstance(value, MutableSequence):
+                for i, element in enumerate(value):
+                    value[i] = convert_element(element, undo)
+                    undo.append((value, i, element))
+            else:
+                value = type(value)(
+                    [convert_element(element, undo) for element in value]
+                )
+            return value if convert is None else convert(data_type, value)
+
+        return convert_from
+
     # pylint: disable=too-many-arguments
     def convert_from(self, name, value, converter, default, onerror):
 
@@ -341,6 +463,79 @@ class JsonObject(JsonDataType):
     def name(self):
         return "Object"
 
+    def compile_check(self):
+        extra, fields = self._any, self._fields
+        is_instance = self.is_instance
+
+        if extra is None and fields is None:
+            return is_instance
+
+        check_extra = None if extra is None else extra.compile_check()
+        checks = (
+            ()
+            if fields is None
+            else tuple((name, fields[name].compile_check()) for name in fields)
+        )
+        fields = {} if fields is None else fields
+
+        def check(value):
+            if not is_instance(value):
+                return False
+            get = value.get
+            for field_name, check_field in checks:
+                if not check_field(get(field_name)):
+                    return False
+            for field_name in value:
+                if field_name not in fields:
+                    if check_extra is None or not check_extra(get(field_name)):
+                        return False
+            return True
+
+        return check
+
+    def compile_convert(self, converter):
+        extra, fields = self._any, self._fields
+        is_instance = self.is_instance
+
+        if extra is None and fields is None:
+            return _compile_convert(self, is_instance, converter, None)
+
+        convert = None if converter is None else converter.convert_from
+        data_type = self
+
+        convert_extra = None if extra is None else extra.compile_convert()
+        converters = (
+            ()
+            if fields is None
+            else tuple((name, fields[name].compile_convert()) for name in fields)
+        )
+        fields = {} if fields is None else fields
+        field_count = len(fields)
+
+        def convert_from(value, undo):
+            if not is_instance(value):
+                raise _InvalidValue()
+            get = value.get
+            for field_name, convert_field in converters:
+                item = get(field_name, _missing)
+                value[field_name] = convert_field(
+                    None if item is _missing else item, undo
+                )
+                undo.append((value, field_name, item))
+            if convert_extra is None:
+                # every field is now present; so any more are undefined (illegal) field names
+                if len(value) != field_count:
+                    raise _InvalidValue()
+            else:
+                for field_name in value:
+                    if field_name not in fields:
+                        item = get(field_name)
+                        value[field_name] = convert_extra(item, undo)
+                        undo.append((value, field_name, item))
+            return value if convert is None else convert(data_type, value)
+
+        return convert_from
+
     # pylint: disable=too-many-arguments
     def convert_from(self, name, value, converter, default, onerror):
 
@@ -474,6 +669,9 @@ class JsonString(JsonDataType):
     def name(self):
         return "String"
 
+    def compile_convert(self, converter):
+        return _compile_convert(self, self.is_instance, converter, string)
+
     # pylint: disable=too-many-arguments
     def convert_from(self, name, value, converter, default, onerror):
         if not self.validate(name, value, onerror):
@@ -593,3 +791,54 @@ class JsonVersionSpecConverter(JsonDataTypeConverter):
         return string(value)
 
     any_version = semantic_version.Spec("*")
+
+
+# region Protected
+
+
+def _compile_convert(data_type, is_instance, converter, coerce):
+    """Returns a function that checks and converts a value as described by :meth:`JsonValue.compile_convert` for a
+    data type that checks the type alone
+
+    :param coerce: Function applied to values, if there is no `converter` or :const:`None`.
+    :type coerce: function
+
+    """
+    if converter is None:
+        if coerce is None:
+
+            def convert_from(value, undo):  # pylint: disable=unused-argument
+                if not is_instance(value):
+                    raise _InvalidValue()
+                return value
+
+            return convert_from
+
+        # pylint: disable=function-redefined,unused-argument
+        def convert_from(value, undo):
+            if not is_instance(value):
+                raise _InvalidValue()
+            return coerce(value)
+
+        return convert_from
+
+    convert = converter.convert_from
+
+    def convert_from(value, undo):  # pylint: disable=function-redefined,unused-argument
+        if not is_instance(value):
+            raise _InvalidValue()
+        return convert(data_type, value)
+
+    return convert_from
+
+
+class _InvalidValue(Exception):
+    """Raised by compiled conversions when a value is not valid"""
+
+    pass  # pylint: disable=unnecessary-pass
+
+
+_missing = object()
+
+
+# endregion
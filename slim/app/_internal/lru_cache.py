@@ -0,0 +1,102 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from builtins import object
+from collections import namedtuple, OrderedDict
+
+
+class LruCache(object):
+    """Holds a bounded number of values, evicting the least recently used value when it is full
+
+    Hits and misses are counted so that the capacity of a cache can be tuned.
+
+    :param capacity: Maximum number of values held by the cache. A value less than one disables the cache.
+    :type capacity: int
+
+    """
+
+    def __init__(self, capacity):
+        self._capacity = capacity
+        self._values = OrderedDict()
+        self._hits = self._misses = 0
+
+    # region Special methods
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __len__(self):
+        return len(self._values)
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value):
+        self._capacity = value
+        self._trim()
+
+    # endregion
+
+    # region Methods
+
+    def clear(self):
+        self._values.clear()
+        self._hits = self._misses = 0
+
+    def get(self, key, default=None):
+        """Returns the value associated with `key` and marks it as the most recently used value
+
+        :return: The value associated with `key` or `default`, if there is no such value.
+
+        """
+        values = self._values
+        try:
+            value = values.pop(key)
+        except KeyError:
+            self._misses += 1
+            return default
+        values[key] = value
+        self._hits += 1
+        return value
+
+    def info(self):
+        """Returns the hit count, miss count, capacity, and size of the current cache
+
+        :rtype: LruCache.Info
+
+        """
+        return LruCache.Info(
+            self._hits, self._misses, self._capacity, len(self._values)
+        )
+
+    def pop(self, key, default=None):
+        return self._values.pop(key, default)
+
+    def put(self, key, value):
+        """Associates `value` with `key`, evicting the least recently used value, if the current cache is full"""
+        values = self._values
+        values.pop(key, None)
+        values[key] = value
+        self._trim()
+
+    # endregion
+
+    # region Protected
+
+    def _trim(self):
+        values = self._values
+        capacity = max(self._capacity, 0)
+        while len(values) > capacity:
+            values.popitem(last=False)
+
+    # endregion
+
+    Info = namedtuple("Info", ("hits", "misses", "capacity", "size"))
@@ -105,6 +105,16 @@ class ObjectView(MutableMapping):
     def __str__(self):
         return ObjectView.encode(self)
 
+    def __reduce__(self):
+        # Pickles the OrderedDict underlying the current ObjectView--not a copy of it as a dict--and ensures that the
+        # empty ObjectView is unpickled as ObjectView.empty so that identity tests against it continue to work
+        if self is ObjectView.empty:
+            return _get_empty_object_view, ()
+        return _new_object_view, (type(self),), self.__dict__
+
+    def __setstate__(self, state):
+        self.__dict__ = state
+
     # region ... MutableMapping interface
 
     def __delitem__(self, name):
@@ -113,6 +123,10 @@ class ObjectView(MutableMapping):
     def __getitem__(self, name):
         return self.__dict__.__getitem__(name)
 
+    def get(self, name, default=None):
+        # Mapping.get goes through __getitem__ and catches KeyError; schema conversion calls this for every field
+        return self.__dict__.get(name, default)
+
     def __contains__(self, name):
         return self.__dict__.__contains__(name)
 
@@ -301,3 +315,17 @@ ObjectView._json_type_map = {  # pylint: disable=protected-access
 }
 
 ObjectView.empty = ObjectView(())
+
+
+# region Protected
+
+
+def _get_empty_object_view():
+    return ObjectView.empty
+
+
+def _new_object_view(object_view_type):
+    return object_view_type.__new__(object_view_type)
+
+
+# endregion
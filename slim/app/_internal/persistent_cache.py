@@ -0,0 +1,197 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from builtins import object
+from hashlib import sha1
+from os import path
+from tempfile import mkstemp
+import errno
+import io
+import os
+
+try:
+    # noinspection PyCompatibility
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from ...utils import slim_configuration
+from ...utils.internal import replace_file
+
+
+class PersistentCache(object):
+    """Stores picklable values in files named by a digest of their keys
+
+    A persistent cache is a directory under `slim_configuration.cache_directory_path`. Values are written atomically
+    and any value that cannot be read back is treated as a cache miss. Errors writing to the cache are ignored so that
+    an unwritable cache directory does no more than slow things down.
+
+    The modification time of an entry is updated each time it's read. When the number of entries exceeds
+    `max_entries`, the least recently used entries are removed until the cache is a tenth below its limit. Removing
+    the cache directory--or any file in it--is always safe: it just empties the cache.
+
+    :param directory: Path to the cache directory.
+    :type directory: string
+
+    :param max_entries: Maximum number of entries in the cache. A value less than one means that the cache is
+    unbounded.
+    :type max_entries: int
+
+    """
+
+    def __init__(self, directory, max_entries=0):
+        self._directory = directory
+        self._max_entries = max_entries
+        self._entry_count = None  # counted on first put
+
+    # region Properties
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @property
+    def max_entries(self):
+        return self._max_entries
+
+    # endregion
+
+    # region Methods
+
+    def get(self, key):
+        """Returns the value associated with `key` or :const:`None`, if there is no such value"""
+        filename = self._get_filename(key)
+        try:
+            with io.open(filename, "rb") as istream:
+                value = pickle.load(istream)
+            os.utime(filename, None)  # marks the entry as recently used
+            return value
+        except (IOError, OSError, EOFError, pickle.UnpicklingError):
+            return None
+        except (
+            AttributeError,
+            ImportError,
+            IndexError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ):
+            return (
+                None  # the value was written by an incompatible version of this module
+            )
+
+    @classmethod
+    def open(cls, name):
+        """Returns the named persistent cache or :const:`None`, if caching is disabled
+
+        :param name: Cache name.
+        :type name: string
+
+        :return: The named persistent cache or :const:`None`, if caching is disabled.
+        :rtype: PersistentCache
+
+        """
+        cache_directory_path = slim_configuration.cache_directory_path
+
+        if cache_directory_path is None:
+            return None
+
+        directory = path.join(cache_directory_path, name)
+
+        max_entries = slim_configuration.cache_max_entries
+
+        try:
+            cache = cls._instances[directory]
+        except KeyError:
+            cache = cls._instances[directory] = cls(directory, max_entries)
+        else:
+            cache._max_entries = max_entries  # pylint: disable=protected-access
+
+        return cache
+
+    def put(self, key, value):
+        """Associates `value` with `key`, replacing any existing value"""
+        directory = self._directory
+        try:
+            try:
+                os.makedirs(directory)
+            except OSError as error:
+                if error.errno != errno.EEXIST:
+                    raise
+            file_no, temporary_filename = mkstemp(dir=directory)
+            try:
+                with io.open(file_no, "wb") as ostream:
+                    pickle.dump(value, ostream, self._protocol)
+                replace_file(temporary_filename, self._get_filename(key))
+            finally:
+                if path.exists(temporary_filename):
+                    os.remove(temporary_filename)
+        except (IOError, OSError, pickle.PicklingError):
+            return
+
+        if self._max_entries < 1:
+            return
+
+        if self._entry_count is None:
+            self._entry_count = len(self._list_entries())
+        else:
+            # an overestimate, if the value replaced an existing one
+            self._entry_count += 1
+
+        if self._entry_count > self._max_entries:
+            self._prune()
+
+    # endregion
+
+    # region Protected
+
+    _instances = {}
+    _protocol = 2  # the highest protocol supported by all versions of Python we support
+
+    def _get_filename(self, key):
+        return path.join(self._directory, sha1(key.encode("utf-8")).hexdigest())
+
+    def _list_entries(self):
+        """Lists the name and modification time of each entry in the cache"""
+        directory = self._directory
+        entries = []
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return entries
+        for name in names:
+            if len(name) != _entry_name_length or name.startswith("tmp"):
+                continue  # not an entry, but possibly the temporary file of a put in progress
+            try:
+                entries.append((path.getmtime(path.join(directory, name)), name))
+            except OSError:
+                pass  # removed by another process
+        return entries
+
+    def _prune(self):
+        """Removes the least recently used entries until the cache is a tenth below its limit"""
+        entries = self._list_entries()
+        limit = self._max_entries - self._max_entries // 10
+        count = len(entries)
+        if count > limit:
+            entries.sort()
+            for _, name in entries[: count - limit]:
+                try:
+                    os.remove(path.join(self._directory, name))
+                except OSError:
+                    pass  # removed by another process
+                count -= 1
+        self._entry_count = count
+
+    # endregion
+    pass  # pylint: disable=unnecessary-pass
+
+
+# region Protected
+
+_entry_name_length = len(sha1().hexdigest())
+
+
+# endregion
@@ -0,0 +1,203 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from builtins import object
+import re
+
+
+class SegmentPattern(object):
+    """Matches names against the patterns derived from conf-spec names in time linear in the length of a name
+
+    A conf-spec name like `alert.<action>.param.<name>` is compiled to a regular expression of the form
+    `L0(?P<g1>.*?)L1...(?P<gk>.*?)Lk\\Z`, where each `Li` is an escaped literal. Matched by :mod:`re`, such an
+    expression backtracks: the time it takes to reject a long name grows with the length of the name raised to the
+    number of groups. A segment pattern matches the same names with the same group captures by searching for each
+    literal in turn. `L0` must start a name and `Lk` must end it. Each literal in between is found at its leftmost
+    position after the literal that precedes it and before `Lk`. That's where the lazy groups of the regular
+    expression put it, because a lazy group's match can always be extended to give the rest of the expression more
+    room--except across a line break, which `.` does not match. Names with line breaks are matched by :mod:`re`.
+
+    Use :meth:`SegmentPattern.compile` to create instances.
+
+    """
+
+    def __init__(self, source, literals, group_names):
+        self._source = source
+        self._literals = literals
+        self._group_names = group_names
+        self._group_indexes = {name: index for index, name in enumerate(group_names)}
+        self._regex = None
+
+    # region Properties
+
+    @property
+    def groupindex(self):
+        return {name: index + 1 for index, name in enumerate(self._group_names)}
+
+    @property
+    def groups(self):
+        return len(self._group_names)
+
+    @property
+    def pattern(self):
+        return self._source
+
+    # endregion
+
+    # region Methods
+
+    @classmethod
+    def compile(cls, source):
+        """Returns a segment pattern for `source` or :const:`None`, if `source` is not a sequence of escaped literals
+        and lazy named groups anchored by `\\Z`
+
+        :param source: Regular expression source.
+        :type source: string
+
+        :rtype: SegmentPattern
+
+        """
+        if not source.endswith("\\Z"):
+            return None
+
+        literals = []
+        group_names = []
+        literal = []
+        end = len(source) - 2
+        start = 0
+
+        while start < end:
+            token = cls._match_token(source, start, end)
+            if token is None:
+                return None
+            group_name, character, escaped_character = token.groups()
+            if group_name is not None:
+                if group_name in group_names:
+                    return None  # re reports the redefinition
+                literals.append("".join(literal))
+                group_names.append(group_name)
+                literal = []
+            elif character is not None:
+                literal.append(character)
+            else:
+                literal.append(
+                    "\0" if escaped_character == "000" else escaped_character
+                )
+            start = token.end()
+
+        literals.append("".join(literal))
+        return cls(source, literals, group_names)
+
+    def match(self, name):
+        """Returns a match object, if `name` matches the current pattern; otherwise :const:`None`
+
+        :param name: Stanza or setting name.
+        :type name: string
+
+        :rtype: SegmentPattern.Match
+
+        """
+        if "\n" in name:
+            regex = self._regex
+            if regex is None:
+                regex = self._regex = re.compile(self._source, re.M | re.U)
+            return regex.match(name)
+
+        literals = self._literals
+
+        if len(literals) == 1:
+            return SegmentPattern.Match(self, name, ()) if name == literals[0] else None
+
+        first, last = literals[0], literals[-1]
+        end = len(name) - len(last)
+
+        if end < len(first) or not (name.startswith(first) and name.endswith(last)):
+            return None
+
+        find = name.find
+        position = len(first)
+        spans = []
+
+        for literal in literals[1:-1]:
+            index = find(literal, position, end)
+            if index < 0:
+                return None
+            spans.append((position, index))
+            position = index + len(literal)
+
+        spans.append((position, end))
+        return SegmentPattern.Match(self, name, spans)
+
+    # endregion
+
+    # region Protected
+
+    _match_token = re.compile(
+        r"\(\?P<(\w+)>\.\*\?\)|([^\W_])|\\(000|.)", re.S | re.U
+    ).match
+
+    # endregion
+
+    class Match(object):
+        """Presents the subset of the interface of an :mod:`re` match object that applies to a segment pattern match"""
+
+        __slots__ = ("_pattern", "_spans", "string")
+
+        def __init__(self, pattern, string, spans):
+            self._pattern = pattern
+            self._spans = spans
+            self.string = string
+
+        # region Properties
+
+        @property
+        def lastindex(self):
+            return len(self._spans) if len(self._spans) > 0 else None
+
+        @property
+        def re(self):
+            return self._pattern
+
+        # endregion
+
+        # region Methods
+
+        def end(self, group=0):
+            return self.span(group)[1]
+
+        def group(self, *groups):
+            if len(groups) == 0:
+                return self.string
+            if len(groups) == 1:
+                start, end = self.span(groups[0])
+                return self.string[start:end]
+            return tuple(self.group(group) for group in groups)
+
+        def groupdict(self):
+            return dict(zip(self._pattern._group_names, self.groups()))
+
+        def groups(self):
+            string = self.string
+            return tuple(string[start:end] for start, end in self._spans)
+
+        def span(self, group=0):
+            if group == 0:
+                return 0, len(self.string)
+            if not isinstance(group, int):
+                try:
+                    group = self._pattern._group_indexes[group] + 1
+                except KeyError:
+                    raise IndexError("no such group")
+            if not 0 < group <= len(self._spans):
+                raise IndexError("no such group")
+            return self._spans[group - 1]
+
+        def start(self, group=0):
+            return self.span(group)[0]
+
+        # endregion
+        pass  # pylint: disable=unnecessary-pass
+
+    pass  # pylint: disable=unnecessary-pass
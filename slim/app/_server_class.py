@@ -13,12 +13,14 @@ from collections import (
     MutableMapping,
     OrderedDict,
 )  # pylint: disable=no-name-in-module
-from json import JSONEncoder
+from json import JSONDecoder, JSONEncoder
+from json.decoder import scanstring
 from tempfile import mkstemp
 from os import path
 import os
 
 import io
+import re
 import shutil
 import tarfile
 
@@ -32,8 +34,8 @@ from ..utils import (
 from ..utils.internal import string
 
 from ._deployment import AppDependencyGraph, AppDeploymentSpecification
-from ._installation import AppInstallationGraph
-from ._internal import ObjectView
+from ._installation import AppInstallationGraph, AppInstallationInterns
+from ._internal import InstallationGraphSnapshot, ObjectView
 from ._source import AppSource
 
 
@@ -69,14 +71,19 @@ _encoder = _AppJsonEncoder()
 _encode = _encoder.encode
 _iterencode = _encoder.iterencode
 
+_decode = JSONDecoder(object_pairs_hook=OrderedDict).decode
+
 
 class AppServerClass(object):
-    def __init__(self, name, object_view, repository, repository_path):
+    # pylint: disable=too-many-arguments
+    def __init__(self, name, object_view, repository, repository_path, interns=None):
 
         self._name = string(name)
         self._repository = repository
         self._repository_path = repository_path
+        self._interns = AppInstallationInterns() if interns is None else interns
         self._workload = frozenset(object_view.workload)
+        self._text = self._packages = None
 
         self.reload(object_view.apps)
 
@@ -86,7 +93,7 @@ class AppServerClass(object):
         return "AppServerClass(" + repr(self._name) + ")"
 
     def __str__(self):
-        return _encode(self.to_dict())
+        return self.to_json()
 
     # endregion
 
@@ -94,14 +101,32 @@ class AppServerClass(object):
 
     @property
     def apps(self):
+        if self._text is not None:
+            self._materialize()
         return self._apps
 
+    @property
+    def interns(self):
+        """Values shared by the installations of the current server class and those of its collection
+
+        :rtype: AppInstallationInterns
+
+        """
+        return self._interns
+
+    @property
+    def is_materialized(self):
+        """:const:`True`, if the workload and installation graph of the current server class have been decoded"""
+        return self._text is None
+
     @property
     def name(self):
         return self._name
 
     @property
     def workload(self):
+        if self._text is not None:
+            self._materialize()
         return self._workload
 
     # endregion
@@ -158,6 +183,9 @@ class AppServerClass(object):
 
     def describe_app(self, app_id):
 
+        if not self.is_installed(app_id):
+            return None  # The app is not installed on this server class
+
         apps = self.apps
         installation = apps.get(app_id)
 
@@ -178,11 +206,60 @@ class AppServerClass(object):
         repository = server_classes.repository
         repository_path = server_classes.repository_path
 
-        server_class = AppServerClass(name, info, repository, repository_path)
+        server_class = AppServerClass(
+            name, info, repository, repository_path, server_classes.interns
+        )
         server_classes[name] = server_class
 
         return server_class
 
+    # pylint: disable=protected-access, too-many-arguments
+    @classmethod
+    def from_text(cls, name, text, packages, repository, repository_path, interns=None):
+        """Creates a server class that decodes its workload and installation graph from `text` on first access
+
+        :param name: Server class name.
+        :type name: string
+
+        :param text: JSON text of the server class as it appears in an installation graph or its snapshot record.
+        :type text: string or InstallationGraphSnapshot.Record
+
+        :param packages: Maps the id of each app installed on the server class to the name of its source package.
+        :type packages: OrderedDict
+
+        :param interns: Values shared with the other server classes of a collection.
+        :type interns: AppInstallationInterns
+
+        :rtype: AppServerClass
+
+        """
+        server_class = cls.__new__(cls)
+        server_class._name = string(name)
+        server_class._repository = repository
+        server_class._repository_path = repository_path
+        server_class._interns = AppInstallationInterns() if interns is None else interns
+        server_class._workload = server_class._apps = None
+        server_class._text = text
+        server_class._packages = packages
+        return server_class
+
+    # pylint: enable=protected-access, too-many-arguments
+
+    def get_packages(self):
+        """Returns a mapping from the id of each app installed on the current server class to its source package name
+
+        The mapping for a server class that has not been materialized is the one recorded when it was loaded.
+
+        :rtype: OrderedDict
+
+        """
+        if self._text is not None:
+            return self._packages
+        return OrderedDict(
+            (app_id, path.basename(installation.source.package))
+            for app_id, installation in self._apps.items()
+        )
+
     def get_source(self, package):
 
         try:
@@ -203,7 +280,27 @@ class AppServerClass(object):
 
         return source
 
+    def is_installed(self, app_id):
+        """Returns :const:`True`, if the app identified by `app_id` is installed on the current server class
+
+        This test does not materialize the server class.
+
+        :param app_id: App id.
+        :type app_id: string
+
+        :rtype: bool
+
+        """
+        if self._text is not None:
+            return app_id in self._packages
+        return app_id in self._apps
+
     def to_dict(self):
+        text = self._text
+        if text is not None:
+            if isinstance(text, InstallationGraphSnapshot.Record):
+                return text.get_value()
+            return _decode(text)
         return OrderedDict(
             (
                 ("workload", sorted(self.workload, reverse=True)),
@@ -211,7 +308,25 @@ class AppServerClass(object):
             )
         )
 
+    def to_json(self):
+        """Returns the JSON text of the current server class
+
+        A server class that has not been materialized returns the text it was loaded from, verbatim, or the text of
+        the snapshot record it was loaded from.
+
+        :rtype: string
+
+        """
+        text = self._text
+        if text is not None:
+            if isinstance(text, InstallationGraphSnapshot.Record):
+                return text.to_json()
+            return text
+        return string(_encode(self.to_dict()))
+
     def reload(self, apps):
+        if self._text is not None:
+            self._materialize()
         self._apps = AppInstallationGraph(self, apps)
 
     def remove_app(self, app_id):
@@ -243,17 +358,28 @@ class AppServerClass(object):
     ):
         self.apps.update(app_installation_graph, disable_automatic_resolution)
 
+    # endregion
+
+    # region Protected
+
+    def _materialize(self):
+        object_view = ObjectView(self.to_json())
+        self._text = self._packages = None
+        self._workload = frozenset(object_view.workload)
+        self.reload(object_view.apps)
+
     # endregion
     pass  # pylint: disable=unnecessary-pass
 
 
 class AppServerClassCollection(MutableMapping):
-    def __init__(self, repository, repository_path, server_classes=None):
+    def __init__(self, repository, repository_path, server_classes=None, interns=None):
         self._collection = (
             OrderedDict() if server_classes is None else OrderedDict(server_classes)
         )
         self._repository = repository
         self._repository_path = repository_path
+        self._interns = AppInstallationInterns() if interns is None else interns
         self._validate = True
 
         self._installed_packages = OrderedDict()
@@ -261,10 +387,7 @@ class AppServerClassCollection(MutableMapping):
         # Compile a list of installed apps and the source package in the repository
         # This is used to account for dependencies defined without a packaged dependency
         for server_class in list(self._collection.values()):
-            for installed_app in list(server_class.apps.values()):
-                self._installed_packages[installed_app.id] = os.path.basename(
-                    installed_app.source.package
-                )
+            self._installed_packages.update(server_class.get_packages())
 
     # region Special methods
 
@@ -290,6 +413,15 @@ class AppServerClassCollection(MutableMapping):
 
     # region Properties
 
+    @property
+    def interns(self):
+        """Values shared by the installations of all server classes in the current collection
+
+        :rtype: AppInstallationInterns
+
+        """
+        return self._interns
+
     @property
     def repository(self):
         return self._repository
@@ -339,8 +471,25 @@ class AppServerClassCollection(MutableMapping):
 
         # Read installation graph
 
+        # An installation graph is either JSON text or a binary snapshot that's memory-mapped rather than read
+
         filename = file if isinstance(file, string) else file.name
-        server_classes = OrderedDict()
+
+        try:
+            snapshot = InstallationGraphSnapshot.open(file)
+        except ValueError as error:
+            SlimLogger.error(
+                "Cannot load installation graph from ",
+                encode_filename(filename),
+                " file: ",
+                error,
+            )
+            return None
+
+        if snapshot is not None:
+            if file is not filename:
+                file.close()
+            return cls._load_snapshot(snapshot, filename, repository, repository_path)
 
         try:
             if file is filename:
@@ -358,28 +507,33 @@ class AppServerClassCollection(MutableMapping):
             )
             return None
 
-        object_view = ObjectView(text)
-
         # Create server class collection
+        # Each server class records where its text lies in the installation graph and the packages it references. Its
+        # workload and installation graph are decoded when first accessed and, if never accessed, it's saved verbatim.
 
-        for name in object_view:
-            info = object_view[name]
-            if name in server_classes:
-                SlimLogger.warning(
-                    "Replacing definition of duplicate server class name in installation graph: ",
-                    name,
-                )
-            server_classes[name] = AppServerClass(
-                name, info, repository, repository_path
+        try:
+            entries = [
+                (name, text[start:end], _get_packages(info))
+                for name, start, end, info in _scan_installation_graph(text)
+            ]
+        except ValueError as error:
+            SlimLogger.error(
+                "Cannot load installation graph from ",
+                encode_filename(filename),
+                " file: ",
+                error,
             )
+            return None
 
-        return AppServerClassCollection(repository, repository_path, server_classes)
+        return cls._create(entries, repository, repository_path)
 
     def reload(self):
         """Reload the installation graph. If validation was previously disabled and we are no longer in a valid state,
         this operation will fail in the same way an initial load() operation may fail.
         """
         for server_class in list(self._collection.values()):
+            if not server_class.is_materialized:
+                continue  # the server class is unchanged since it was loaded
             object_view_apps = ObjectView(string(_encode(server_class.apps.to_dict())))
             server_class.reload(object_view_apps)
 
@@ -509,7 +663,7 @@ class AppServerClassCollection(MutableMapping):
 
         for name in collection:
             server_class = collection[name]
-            if server_class.apps.get(app_source.id) is None:
+            if not server_class.is_installed(app_source.id):
                 if "*" in target_workloads or name in target_workloads:
                     SlimLogger.warning(
                         "App ",
@@ -570,7 +724,19 @@ class AppServerClassCollection(MutableMapping):
 
         return deployment_packages
 
-    def save(self, filename=None):
+    def save(self, filename=None, snapshot=False):
+        """Saves the installation graph to the payload and, if `filename` is specified, to a file
+
+        :param filename: Name of the file to save or :const:`None`, if the installation graph should be saved to the
+        payload only.
+        :type filename: string
+
+        :param snapshot: :const:`True`, if the file should be saved as a snapshot rather than JSON text.
+        :type snapshot: bool
+
+        :return: :const:`None`.
+
+        """
         graph_json = OrderedDict(
             (
                 (
@@ -582,8 +748,20 @@ class AppServerClassCollection(MutableMapping):
         slim_configuration.payload.set_installation_graph(graph_json)
 
         if filename is not None:
-            with io.open(filename, encoding="utf-8", mode="w", newline="") as ostream:
-                ostream.write(string(_encode(graph_json)))
+            if snapshot:
+                InstallationGraphSnapshot.save(filename, graph_json.items())
+            else:
+                with io.open(
+                    filename, encoding="utf-8", mode="w", newline=""
+                ) as ostream:
+                    ostream.write(
+                        "{"
+                        + ",".join(
+                            string(_encode(name)) + ":" + server_class.to_json()
+                            for name, server_class in self._collection.items()
+                        )
+                        + "}"
+                    )
             output_dir = os.path.dirname(filename)
 
             if SlimLogger.is_debug_enabled():
@@ -597,7 +775,7 @@ class AppServerClassCollection(MutableMapping):
         app_found = False
         for name in server_classes:
             collection = self._collection[name]
-            if app_id in collection.apps:
+            if collection.is_installed(app_id):
                 app_found = True
                 self._collection[name].remove_app(app_id)
         if not app_found:
@@ -646,7 +824,7 @@ class AppServerClassCollection(MutableMapping):
                 old_list = [
                     name
                     for name in self._collection
-                    if self._collection[name].apps.get(app_source.id) is not None
+                    if self._collection[name].is_installed(app_source.id)
                 ]
                 new_list = [
                     deployment_specification.name
@@ -688,6 +866,69 @@ class AppServerClassCollection(MutableMapping):
                 + " is unknown or not-yet-implemented"
             )
 
+    # endregion
+
+    # region Protected
+
+    @classmethod
+    def _create(cls, entries, repository, repository_path):
+        """Creates a server class collection from the name, text, and packages of each server class in `entries`
+
+        A server class with packages is materialized when first accessed. Any other server class is decoded now so
+        that its errors are reported as they always have been.
+
+        """
+        server_classes = OrderedDict()
+        interns = AppInstallationInterns()  # released with the collection
+
+        for name, info, packages in entries:
+            if name in server_classes:
+                SlimLogger.warning(
+                    "Replacing definition of duplicate server class name in installation graph: ",
+                    name,
+                )
+            server_classes[name] = (
+                AppServerClass(
+                    name, ObjectView(info), repository, repository_path, interns
+                )
+                if packages is None
+                else AppServerClass.from_text(
+                    name, info, packages, repository, repository_path, interns
+                )
+            )
+
+        return cls(repository, repository_path, server_classes, interns)
+
+    @classmethod
+    def _load_snapshot(cls, snapshot, filename, repository, repository_path):
+        """Creates a server class collection from an installation graph snapshot
+
+        Only the names and packages of server classes saved as structured records are decoded. Server classes saved as
+        JSON text records are loaded as they would be from an installation graph file.
+
+        """
+        entries = []
+
+        try:
+            for record in snapshot:
+                packages = record.get_packages()
+                if packages is None:
+                    info = record.to_json()
+                    packages = _get_packages(_decode(info))
+                else:
+                    info = record
+                entries.append((record.name, info, packages))
+        except ValueError as error:
+            SlimLogger.error(
+                "Cannot load installation graph from ",
+                encode_filename(filename),
+                " file: ",
+                error,
+            )
+            return None
+
+        return cls._create(entries, repository, repository_path)
+
     # endregion
     pass  # pylint: disable=unnecessary-pass
 
@@ -755,3 +996,73 @@ class AppServerClassUpdate(object):
         )
 
         return add
+
+
+# region Protected
+
+_decode_value = JSONDecoder().raw_decode
+_whitespace = re.compile(r"[ \t\n\r]*").match
+
+
+def _get_packages(info):
+    """Returns a mapping from app ids to source package names for a server class decoded without object views
+
+    :const:`None` is returned, if `info` is not shaped like a server class. Such server classes are decoded on load so
+    that their errors are reported as they always have been.
+
+    """
+    try:
+        apps = info["apps"]
+        return OrderedDict(
+            (app_id, path.basename(apps[app_id]["source"])) for app_id in apps
+        )
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+
+def _scan_installation_graph(text):
+    """Yields the name, start offset, end offset, and decoded value of each server class in an installation graph
+
+    Values are decoded to dictionaries and lists, not object views, and their offsets delimit their text.
+
+    :raises ValueError: `text` is not a well-formed JSON object.
+
+    """
+    index = _whitespace(text, 0).end()
+
+    if not text.startswith("{", index):
+        raise ValueError("Expected a JSON object at offset " + string(index))
+
+    index = _whitespace(text, index + 1).end()
+
+    if text.startswith("}", index):
+        index += 1
+    else:
+        while True:
+            if not text.startswith('"', index):
+                raise ValueError(
+                    "Expected a server class name at offset " + string(index)
+                )
+            name, index = scanstring(text, index + 1)
+            index = _whitespace(text, index).end()
+            if not text.startswith(":", index):
+                raise ValueError("Expected ':' at offset " + string(index))
+            start = _whitespace(text, index + 1).end()
+            value, end = _decode_value(text, start)
+            yield name, start, end, value
+            index = _whitespace(text, end).end()
+            if text.startswith(",", index):
+                index = _whitespace(text, index + 1).end()
+                continue
+            if text.startswith("}", index):
+                index += 1
+                break
+            raise ValueError("Expected ',' or '}' at offset " + string(index))
+
+    index = _whitespace(text, index).end()
+
+    if index != len(text):
+        raise ValueError("Extra data at offset " + string(index))
+
+
+# endregion
@@ -5,6 +5,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from abc import ABCMeta
 from collections import OrderedDict
+from hashlib import sha1
 
 from os import path
 import os
@@ -19,11 +20,12 @@ from semantic_version import Version, Spec
 
 from slim.utils.public import SlimTargetOSWildcard
 from ..utils import *
-from ..utils.internal import string
+from ..utils.internal import get_file_signature, hash_object, string
 
 from ._configuration import AppConfiguration
+from ._configuration_spec_registry import AppConfigurationSpecRegistry
 from ._deployment import AppDeploymentSpecification
-from ._internal import ObjectView
+from ._internal import ObjectView, PersistentCache
 from ._manifest import AppManifest, AppDeploymentConverter
 
 
@@ -51,18 +53,33 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
         "_container",
         "_dependencies",
         "_dependency_sources",
+        "_description",
         "_directory",
         "_id",
+        "_lazy_configuration",
+        "_loaded_names",
         "_manifest",
         "_package_prefix",
+        "_packaged_dependencies",
         "_qualified_id",
+        "_restored",
+        "_signature",
         "_version",
     )
 
-    def __init__(self, package, local_conf=None):
+    def __init__(self, package, local_conf=None, lazy_configuration=False):
         """Get an AppSource object given a source package/directory, maybe from the cache.
 
         Local configuration can be provided to update the app source. Caller is required to check for logged errors.
+        Set `lazy_configuration` to :const:`True` to parse and validate each configuration file on first access, rather
+        than all configuration files up front.
+
+        Source packages are immutable. Hence the outcome of validating one--the messages logged, its manifest, id,
+        qualified id, version, and package prefix--is cached by package content, toolkit version, the content of
+        the configuration spec path, and the content of the system data files. When the outcome is in the validation
+        cache, it is replayed and the package is not extracted until its directory or configuration is needed or, if it
+        packages its dependencies, its dependency sources are needed. Source directories and source packages with local
+        configuration are validated every time. See `slim_configuration.validation_cache`.
 
         """
         # pylint: disable=non-parent-init-called
@@ -82,16 +99,21 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
         self._id = (
             self._manifest
         ) = self._package_prefix = self._qualified_id = self._version = None
-        self._description = None
+        self._description = self._signature = None
+        self._lazy_configuration = lazy_configuration
+        self._loaded_names = self._packaged_dependencies = None
+        self._restored = False
 
         if not path.exists(self.package):
             SlimLogger.error("Package not found: ", self.package)
             return  # do not try to validate a package that does not exist
 
-        self._validate_input_groups()
-        self._validate_identity()
-        self._validate_tasks()
-        self._validate_deployments()
+        cache = self._open_validation_cache()
+
+        if cache is None:
+            self.validate()
+        else:
+            self._validate_using_cache(cache)
 
     # region Special methods
 
@@ -113,7 +135,28 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
             if self.local_conf is not None:
                 with tarfile.open(self.local_conf) as local_conf:
                     local_conf.extractall(app_root)
-            value = self._configuration = AppConfiguration.load(app_root)
+            if not self._restored:
+                value = AppConfiguration.load(app_root, lazy=self._lazy_configuration)
+            else:
+                # The messages logged while loading this configuration were replayed from the validation cache. A lazy
+                # configuration reloads the files that were loaded when the outcome was cached; the others log their
+                # messages on first access, as they would have.
+                recording = SlimLogger.start_recording(hold=True)
+                try:
+                    loaded_names = self._loaded_names
+                    if loaded_names is None:
+                        value = AppConfiguration.load(app_root)
+                    else:
+                        value = AppConfiguration.load(app_root, lazy=True)
+                        for name in loaded_names:
+                            value.get(name)
+                    if loaded_names is None or "app" in loaded_names:
+                        # validation coerced the app versions in place, as we must, so that values are the same whether
+                        # or not they came from the validation cache
+                        _coerce_app_versions(value.get("app"))
+                finally:
+                    SlimLogger.stop_recording(recording)
+            self._configuration = value
         return value
 
     @property
@@ -126,6 +169,11 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
 
     @property
     def dependency_sources(self):
+        if self._dependency_sources is None and self._packaged_dependencies is False:
+            # A restored source package that does not package its dependencies need not be extracted to find them
+            self._dependency_sources = self.populate_dependency_sources(
+                path.abspath(slim_configuration.repository_path)
+            )
         return self._get_field_value("_dependency_sources")
 
     @property
@@ -261,6 +309,64 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
         # type: (typing.TextIO) -> None
         self.manifest.print_description(ostream)
 
+    def refresh(self):
+        """Reloads the parts of an app source directory that changed on disk since they were loaded
+
+        The app manifest is reloaded when `app.manifest` or any of the dependency packages it lists changes.
+        Configuration files are reloaded as described by :meth:`AppConfiguration.refresh`. Validation updates the
+        manifest and the `app` configuration in place. Hence, when the manifest or the `app` or `inputs` configuration
+        changes, all three are reloaded and the app source must be validated again by calling :meth:`validate`.
+
+        :return: A pair: :const:`True`, if the app source must be validated again, and the names of the configuration
+        files that changed.
+        :rtype: tuple
+
+        """
+        manifest_changed = (
+            self._signature is not None and self._signature != self._get_signature()
+        )
+        configuration = self._configuration
+
+        if configuration is None:
+            names = []
+        else:
+            names = configuration.refresh(("app", "inputs") if manifest_changed else ())
+
+        if not (manifest_changed or "app" in names or "inputs" in names):
+            return False, names
+
+        if not manifest_changed:
+            # the app configuration was updated in place by validation and must be reloaded with the inputs
+            # configuration, whichever of the two changed
+            names += [
+                name
+                for name in configuration.refresh(("app", "inputs"))
+                if name not in names
+            ]
+
+        if self._dependency_sources is not None:
+            sources = slim_configuration.cache.get_sources
+            for package in self._dependency_sources:
+                sources.pop(package, None)
+
+        self._dependency_sources = self._description = self._id = None
+        self._manifest = self._package_prefix = self._qualified_id = None
+        self._signature = self._version = None
+
+        return True, names
+
+    def validate(self):
+        """Validates the current app source
+
+        Messages are logged for problems found in the app manifest and in the `app` and `inputs` configuration files.
+        Callers are required to check for logged errors.
+
+        """
+        self._validate_input_groups()
+        self._validate_identity()
+        self._validate_tasks()
+        self._validate_deployments()
+
     def validate_deployment_specification(self, deployment_specification):
 
         input_groups = self.manifest.get("inputGroups")
@@ -321,21 +427,8 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
 
     def _extract_source(self):
 
-        package_name = path.basename(self.package)
         file_type = AppSource._file_type
-
-        if package_name.endswith(".tar.gz"):
-            package_name = package_name[: -len(".tar.gz")]
-        elif (
-            package_name.endswith(".tgz")
-            or package_name.endswith(".tar")
-            or package_name.endswith(".spl")
-        ):
-            package_name = package_name[: -len(".spl")]
-
-        app_container = path.join(
-            slim_configuration.cache.cache_path, package_name + ".source"
-        )
+        app_container = self._get_container_path()
         app_root = ""
 
         with tarfile.open(self.package) as package:
@@ -393,6 +486,53 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
         except KeyError:
             return "file of type " + string(type_code)
 
+    def _get_container_path(self):
+        """Gets the name of the directory into which the current source package is extracted"""
+        package_name = path.basename(self.package)
+
+        if package_name.endswith(".tar.gz"):
+            package_name = package_name[: -len(".tar.gz")]
+        elif (
+            package_name.endswith(".tgz")
+            or package_name.endswith(".tar")
+            or package_name.endswith(".spl")
+        ):
+            package_name = package_name[: -len(".spl")]
+
+        return path.join(slim_configuration.cache.cache_path, package_name + ".source")
+
+    def _get_dependencies_dir(self):
+        app_dependencies_dir = path.abspath(
+            path.join(self.container, SlimConstants.DEPENDENCIES_DIR)
+        )
+        if not path.exists(app_dependencies_dir):
+            app_dependencies_dir = path.abspath(slim_configuration.repository_path)
+        return app_dependencies_dir
+
+    def _get_validation_key(self):
+        """Gets the key under which the outcome of validating the current source package is cached
+
+        The key covers everything the outcome depends on: the package content, the toolkit version, the conf-spec files
+        and validation plugins on the configuration spec path, the system data files that manifests are checked
+        against, and the options that name them.
+
+        """
+        return "\0".join(
+            (
+                AppSource._validation_format,
+                hash_object(self.package),
+                _get_toolkit_version(),
+                AppConfigurationSpecRegistry.instance().get_digest(),
+                _get_digest(
+                    hash_object(path.join(slim_configuration.system_config, name))
+                    for name in _system_data_names
+                ),
+                _get_digest(
+                    getattr(slim_configuration, name) for name in _validation_options
+                ),
+            )
+        )
+
     def _get_field_value(self, name):
         """Common get function for top-level fields: _container, _dependency_sources, _directory.
 
@@ -403,6 +543,38 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
         value = getattr(self, name)
 
         if value is None:
+            if not self._load():
+                return None
+            self._populate()
+            value = getattr(self, name)
+
+        return value
+
+    def _get_signature(self):
+        """Gets a value that changes whenever the app manifest or any of the dependency packages it lists changes"""
+        filenames = [path.join(self._directory, "app.manifest")]
+        dependencies = self._manifest.dependencies
+
+        if dependencies is not None:
+            app_dependencies_dir = self._get_dependencies_dir()
+            for name in dependencies:
+                package = dependencies[name].package
+                if package:
+                    filenames.append(path.join(app_dependencies_dir, package))
+
+        return tuple(get_file_signature(filename) for filename in filenames)
+
+    def _load(self):
+        """Extracts the current source package, if it's not yet extracted, and loads or generates its manifest
+
+        Source directories are not extracted and the manifest of a source restored from the validation cache is not
+        reloaded.
+
+        :return: :const:`False`, if the current source package could not be extracted; otherwise :const:`True`.
+        :rtype: bool
+
+        """
+        if self._directory is None:
 
             app_root = self.package
 
@@ -413,7 +585,9 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
                     self._extract_source()
                 except SlimError as error:
                     SlimLogger.error(error)
-                    return None
+                    return False
+
+        if self._manifest is None:
 
             # Load or generate app manifest
 
@@ -428,7 +602,7 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
                     + "..."
                 )
                 app_configuration = self._configuration = AppConfiguration.load(
-                    self.directory
+                    self.directory, lazy=self._lazy_configuration
                 )
                 app_manifest = AppManifest.generate(
                     app_configuration, io.open(filename, "wb"), add_defaults=False
@@ -436,21 +610,94 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
 
             self._manifest = app_manifest
 
-            # Construct collection of app dependency sources (after we have the other values set)
+        return True
 
-            app_dependencies_dir = path.abspath(
-                path.join(self.container, SlimConstants.DEPENDENCIES_DIR)
-            )
+    def _open_validation_cache(self):
+        """Opens the validation cache or returns :const:`None`, if the outcome of validating the current source
+        should not be cached"""
+        if (
+            self.local_conf is not None
+            or not slim_configuration.validation_cache
+            or path.isdir(self.package)
+        ):
+            return None
+        return PersistentCache.open("sources")
 
-            if not path.exists(app_dependencies_dir):
-                app_dependencies_dir = path.abspath(slim_configuration.repository_path)
+    def _populate(self):
+        """Constructs the collection of app dependency sources after the other fields are set"""
+        self._dependency_sources = self.populate_dependency_sources(
+            self._get_dependencies_dir()
+        )
+        self._signature = self._get_signature()
 
-            self._dependency_sources = self.populate_dependency_sources(
-                app_dependencies_dir
-            )
-            value = getattr(self, name)
+    def _restore(self, value):
+        """Restores the manifest and the values derived from it of the current source from a value produced by
+        :meth:`_snapshot` and replays the messages logged while validating it
 
-        return value
+        The package location, extraction directory, and package name in messages are updated to reflect those of the
+        current source.
+
+        """
+        (
+            app_manifest,
+            loaded,
+            app_id,
+            qualified_id,
+            version,
+            package_prefix,
+            packaged_dependencies,
+            loaded_names,
+            messages,
+        ) = value
+        app_manifest.loaded = loaded
+        self._manifest, self._id, self._version = app_manifest, app_id, version
+        self._qualified_id, self._package_prefix = qualified_id, package_prefix
+        self._packaged_dependencies = packaged_dependencies
+        self._loaded_names = loaded_names
+        self._restored = True
+
+        names = (
+            self.package,
+            self._get_container_path(),
+            path.basename(self.package),
+        )
+
+        for level, args in messages:
+            SlimLogger.message(level, *(_join_names(arg, names) for arg in args))
+
+    def _snapshot(self, recording):
+        """Returns a picklable value from which the validation outcome of the current source can be restored
+
+        Recorded messages are saved as strings split at the package location, extraction directory, and package name
+        they hold. See :func:`_split_names`. The names of the configuration files loaded so far are saved for a source
+        with lazy configuration.
+
+        """
+        app_manifest = self._manifest
+        names = self.package, self._container, path.basename(self.package)
+        messages = [
+            (level, tuple(_split_names(string(arg), names) for arg in args))
+            for level, args in recording
+        ]
+        if app_manifest.info is None:
+            qualified_id = package_prefix = None  # reported by _validate_identity
+        else:
+            qualified_id, package_prefix = self.qualified_id, self.package_prefix
+        configuration = self._configuration
+        return (
+            app_manifest,
+            app_manifest.loaded,
+            self._id,
+            qualified_id,
+            self._version,
+            package_prefix,
+            path.isdir(path.join(self._container, SlimConstants.DEPENDENCIES_DIR)),
+            configuration.get_loaded_names() if self._lazy_configuration else None,
+            messages,
+        )
+
+    # increment when the structure produced by AppSource._snapshot changes
+    _validation_format = "3"
 
     # pylint: disable=too-many-branches
     def _validate_input_groups(self):
@@ -556,24 +803,18 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
             if triple is None:
                 return None, None, None
             group, name, version = triple
-            if version is not None:
-                try:
-                    # noinspection PyProtectedMember
-                    version._setting._value = Version.coerce(
-                        version.value
-                    )  # pylint: disable=all
-                except ValueError:
-                    # TODO: Dnoble: incorporate this logic into FilePosition.__str__:
-                    # file, line = version.position.file, version.position.line
-                    # file = file[len(path.commonprefix((file, path.dirname(self.directory)))) + 1:]
-                    # position = FilePosition(file, line)
-                    SlimLogger.error(
-                        version.position, ": Expected version number, not ", version
-                    )
-                    # SPL-180633: making behaviour the same as in _manifest.py
-                    version._setting._value = Version.coerce("0.0.0")
+            _coerce_version(version, onerror)
             return group, name, version
 
+        def onerror(version):
+            # TODO: Dnoble: incorporate this logic into FilePosition.__str__:
+            # file, line = version.position.file, version.position.line
+            # file = file[len(path.commonprefix((file, path.dirname(self.directory)))) + 1:]
+            # position = FilePosition(file, line)
+            SlimLogger.error(
+                version.position, ": Expected version number, not ", version
+            )
+
         if self.manifest.info is None:
             SlimLogger.error("App manifest info is missing or incorrect")
             return
@@ -738,6 +979,37 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
                     encode_series((encode_string(task) for task in undefined_tasks)),
                 )
 
+    def _validate_using_cache(self, cache):
+        """Validates the current source package or restores the outcome of validating it from `cache`"""
+        key = self._get_validation_key()
+        value = cache.get(key)
+
+        if value is not None:
+            self._restore(value)
+            return
+
+        recording = SlimLogger.start_recording()
+
+        try:
+            loaded = self._load()
+        finally:
+            SlimLogger.stop_recording(recording)
+
+        if not loaded:
+            return  # do not try to validate a package that could not be extracted
+
+        # Dependency sources are validated and cached on their own; their messages are not part of our outcome
+        self._populate()
+        messages = recording
+        recording = SlimLogger.start_recording()
+
+        try:
+            self.validate()
+        finally:
+            SlimLogger.stop_recording(recording)
+
+        cache.put(key, self._snapshot(messages + recording))
+
     def _validate_deployments(self):
         schema_version = self.manifest.schemaVersion
         deployments = self.manifest.supportedDeployments
@@ -759,3 +1031,117 @@ class AppSource(with_metaclass(_AppSourceFactory, ObjectView)):
 
     # endregion
     pass  # pylint: disable=unnecessary-pass
+
+
+# region Protected
+
+
+def _coerce_app_versions(conf):
+    """Coerces the app versions in an `app` configuration file to versions in place, as validation does
+
+    Invalid versions are coerced to 0.0.0 without logging a message.
+
+    """
+    if conf is None:
+        return
+    _coerce_version(conf.get("launcher", "version"))
+    configuration_id = conf.get("id", ("group", "name", "version"))
+    if configuration_id is not None:
+        _coerce_version(configuration_id[2])
+
+
+def _coerce_version(version, onerror=None):
+    """Coerces the value of an app version setting to a version in place
+
+    An invalid version is reported by calling `onerror`, if it's not :const:`None`, and then coerced to 0.0.0. A
+    version that's already coerced is left as it is.
+
+    """
+    if version is None or isinstance(version.value, Version):
+        return
+    try:
+        value = Version.coerce(version.value)
+    except ValueError:
+        if onerror is not None:
+            onerror(version)
+        # SPL-180633: making behaviour the same as in _manifest.py
+        value = Version.coerce("0.0.0")
+    # noinspection PyProtectedMember
+    version._setting._set_value(value)  # pylint: disable=protected-access
+
+
+def _get_digest(values):
+    """Returns a digest of a sequence of values, each of which is converted to a string"""
+    object_id = sha1()
+    for value in values:
+        object_id.update(string(value).encode("utf-8") + b"\0")
+    return string(object_id.hexdigest())
+
+
+def _get_toolkit_version():
+    from .. import (
+        __build_number__,
+        __version__,
+    )  # nopep8, pylint: disable=import-outside-toplevel
+
+    return __version__ + "-" + __build_number__
+
+
+def _join_names(segments, names):
+    """Joins the segments of a string split by :func:`_split_names`, substituting each index with the name it selects
+
+    :param segments: Strings and indexes into `names`.
+    :type segments: tuple
+
+    :param names: Names to substitute.
+    :type names: tuple
+
+    :rtype: string
+
+    """
+    return "".join(
+        names[segment] if isinstance(segment, int) else segment for segment in segments
+    )
+
+
+def _split_names(text, names):
+    """Splits a string at each occurrence of the given names, replacing each occurrence with the index of its name
+
+    The longest name is matched first so that a name that contains another is not split.
+
+    :param text: String to split.
+    :type text: string
+
+    :param names: Names at which to split `text`. Names that are :const:`None` or empty are ignored.
+    :type names: tuple
+
+    :return: Strings and indexes into `names`, in order.
+    :rtype: tuple
+
+    """
+    segments = [text]
+    for index in sorted(
+        (i for i, name in enumerate(names) if name), key=lambda i: -len(names[i])
+    ):
+        name, split_segments = names[index], []
+        for segment in segments:
+            if isinstance(segment, int):
+                split_segments.append(segment)
+                continue
+            for i, part in enumerate(segment.split(name)):
+                if i > 0:
+                    split_segments.append(index)
+                if part:
+                    split_segments.append(part)
+        segments = split_segments
+    return tuple(segments)
+
+
+_system_data_names = ("common-information-models.json", "khulnasoft-releases.json")
+
+# Options that change the outcome of validating a source package. Content is digested separately; option values are
+# digested because messages may name them.
+_validation_options = ("configuration_spec_path", "system_config")
+
+
+# endregion
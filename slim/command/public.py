@@ -79,6 +79,26 @@ class SetQuietAction(Action):
         SlimLogger.set_level(logging.ERROR)
 
 
+class SetNoValidationCacheAction(Action):
+    def __init__(
+        self, option_strings, dest, help=None, metavar=None
+    ):  # pylint: disable=redefined-builtin
+        Action.__init__(
+            self,
+            option_strings,
+            dest,
+            const=True,
+            default=False,
+            help=help,
+            metavar=metavar,
+            nargs=0,
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, True)
+        slim_configuration.validation_cache = False
+
+
 class SetOutputDirAction(Action):
 
     # pylint: disable=redefined-builtin
@@ -146,6 +166,7 @@ class SlimArgumentParser(ArgumentParser):
 
         self.register("action", "set_debug", SetDebugAction)
         self.register("action", "set_quiet", SetQuietAction)
+        self.register("action", "set_no_validation_cache", SetNoValidationCacheAction)
         self.register("action", "set_output_dir", SetOutputDirAction)
         self.register("action", "set_repository", SetRepositoryAction)
 
@@ -167,10 +188,11 @@ class SlimArgumentParser(ArgumentParser):
             "-h", "--help", action="help", help="show this help message and exit"
         )
 
-    def add_app_source(self):
+    def add_app_source(self, required=True):
         return self._options.add_argument(
             "source",
             type=SlimSourceArgument(),
+            nargs=None if required else "?",
             help="location of an app source package or directory",
             metavar="<app-source>",
         )
@@ -195,6 +217,16 @@ class SlimArgumentParser(ArgumentParser):
             metavar="<filename>",
         )
 
+    def add_installation_snapshot(self):
+        return self._options.add_argument(
+            "--snapshot",
+            action="store_const",
+            const=True,
+            default=False,
+            help="save the updated installation graph as a binary snapshot (installation-update.snapshot) rather than "
+            "as JSON (installation-update.json)",
+        )
+
     def add_output_directory(self, description):
         return self._options.add_argument(
             "-o",
@@ -8,8 +8,9 @@ from collections import OrderedDict
 import sys
 
 from slim import program
+from slim.app import AppConfigurationSpecBundle
 from slim.command import SlimArgumentParser
-from slim.utils import SlimLogger, encode_series, slim_configuration
+from slim.utils import SlimLogger, encode_filename, encode_series, slim_configuration
 
 # Argument parser definition
 
@@ -54,6 +55,15 @@ parser.add_argument(
     metavar="<name> <value>",
 )
 
+parser.add_argument(
+    "--compile-specs",
+    action="store_true",
+    help="""
+        compile the conf-spec files on the configuration_spec_path into a bundle that is loaded in place of the text of
+        each spec file until the spec file changes
+    """,
+)
+
 parser.add_argument(
     "-u",
     "--unset",
@@ -111,6 +121,11 @@ def main(args):
 
         operation_count += 1
 
+    if args.compile_specs:
+        filename = AppConfigurationSpecBundle.compile()
+        SlimLogger.information("Compiled conf-spec bundle ", encode_filename(filename))
+        operation_count += 1
+
     if operation_count == 0:
         parser.prog = program + " config"
         parser.print_help()
@@ -28,6 +28,12 @@ def argument_parser():
     _parser.add_repository()
     _parser.add_output_file(description="output of this command")
 
+    _parser.add_argument(
+        "--app-only",
+        action="store_true",
+        help="describe the app, but not its dependency graph",
+    )
+
     return _parser
 
 
@@ -40,9 +46,11 @@ def main(args):
 
     with args.output as output:
         SlimLogger.step("Describing " + encode_filename(source) + "...")
-        app_source = AppSource(source)
+        app_source = AppSource(source, lazy_configuration=True)
         SlimLogger.exit_on_error()
         app_source.print_description(output)
+        if args.app_only:
+            return
         app_dependency_graph = AppDependencyGraph(app_source, args.repository)
         SlimLogger.exit_on_error()
         app_dependency_graph.print_description(output)
@@ -52,7 +60,7 @@ def main(args):
 def describe(source, app_only):
     # type: (string, string, bool) -> dict
 
-    app_source = AppSource(source)
+    app_source = AppSource(source, lazy_configuration=True)
     SlimLogger.exit_on_error()
 
     payload = slim_configuration.payload
@@ -25,6 +25,7 @@ parser = slim.command.SlimArgumentParser(
 parser.add_app_package()
 parser.add_argument_help()
 parser.add_installation()
+parser.add_installation_snapshot()
 parser.add_output_directory(description="deployment packages")
 parser.add_repository()
 parser.add_combine_search_head_indexer_workloads()
@@ -84,8 +85,15 @@ def main(args):
 
         # Save the resulting installation graph, even if there are no changes; when len(deployment_packages) == 0
 
-        filename = path.join(args.output_dir, "installation-update.json")
-        server_collection.save(filename)
+        filename = path.join(
+            args.output_dir,
+            (
+                "installation-update.snapshot"
+                if args.snapshot
+                else "installation-update.json"
+            ),
+        )
+        server_collection.save(filename, snapshot=args.snapshot)
 
         slim.utils.SlimLogger.information(
             "Saved updated installation graph to ", slim.utils.encode_filename(filename)
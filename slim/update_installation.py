@@ -35,6 +35,7 @@ Additional add and set parameters:
 
 parser.add_argument_help()
 parser.add_installation()
+parser.add_installation_snapshot()
 parser.add_output_directory(description="installation graph and deployment packages")
 parser.add_repository()
 parser.add_combine_search_head_indexer_workloads()
@@ -113,8 +114,11 @@ def main(args):
         args.disable_automatic_resolution,
     )
 
-    filename = path.join(args.output_dir, "installation-update.json")
-    server_collection.save(filename)
+    filename = path.join(
+        args.output_dir,
+        "installation-update.snapshot" if args.snapshot else "installation-update.json",
+    )
+    server_collection.save(filename, snapshot=args.snapshot)
     SlimLogger.exit_on_error()
     SlimLogger.information(
         "Saved updated installation graph to ", encode_filename(filename)
@@ -41,12 +41,20 @@ class SlimConfigurationManager(object):
     def __init__(self):
 
         self._cache = None
+        self._cache_directory_path = None
+        self._cache_max_entries = None
         self._configuration_spec_path = None
+        self._lean_parsing = None
         self._output_dir = None
+        self._parse_worker_count = None
         self._payload = None
+        self._release_spec_path = None
         self._repository_path = None
         self._settings = None
+        self._spec_registry_size = None
         self._temp_directory_path = None
+        self._validation_cache = None
+        self._validation_memo_size = None
         self._sanitized_paths = None
 
     # region Properties
@@ -72,6 +80,39 @@ class SlimConfigurationManager(object):
             value = self._cache = SlimCacheInfo(self.temp_directory_path)
         return value
 
+    @property
+    def cache_directory_path(self):
+        """Path to the directory where persistent caches are stored or :const:`None`, if caching is disabled"""
+        value = self._cache_directory_path
+        if value is None:
+            value = self._get_option("cache_directory_path").strip()
+            if len(value) > 0:
+                value = path.expanduser(path.normpath(value))
+            self._cache_directory_path = value
+        return value if len(value) > 0 else None
+
+    @cache_directory_path.setter
+    def cache_directory_path(self, value):
+        self._settings.set("option", "cache_directory_path", value)
+        self._cache_directory_path = None
+
+    @property
+    def cache_max_entries(self):
+        """Maximum number of entries in each persistent cache under `cache_directory_path`
+
+        The least recently used entries are removed when the limit is exceeded. A value less than one means that
+        persistent caches are unbounded.
+
+        """
+        return self._get_integer_option(
+            "_cache_max_entries", "cache_max_entries", 16384
+        )
+
+    @cache_max_entries.setter
+    def cache_max_entries(self, value):
+        self._settings.set("option", "cache_max_entries", str(value))
+        self._cache_max_entries = None
+
     @property
     def configuration_spec_path(self):
         return self._get_path_option(
@@ -87,6 +128,22 @@ class SlimConfigurationManager(object):
     def home(self):
         return self._slim_home
 
+    @property
+    def lean_parsing(self):
+        """:const:`True`, if conf and conf-spec files are parsed for read-only use
+
+        Lean parsing keeps no record of blank lines, comments, or the documentation in conf-spec files and so the
+        files it loads cannot be saved. It's off by default and turned on by the command-line tool, none of whose
+        commands save conf or conf-spec files. Specs and configurations loaded before this property changes are not
+        reloaded.
+
+        """
+        return self._lean_parsing
+
+    @lean_parsing.setter
+    def lean_parsing(self, value):
+        self._lean_parsing = value
+
     @property
     def output_dir(self):
         return self._output_dir
@@ -95,10 +152,45 @@ class SlimConfigurationManager(object):
     def output_dir(self, value):
         self._output_dir = value
 
+    @property
+    def parse_worker_count(self):
+        """Number of worker processes used to parse the conf files in an app
+
+        A value less than two means that conf files are parsed in the current process.
+
+        """
+        return self._get_integer_option("_parse_worker_count", "parse_worker_count", 0)
+
+    @parse_worker_count.setter
+    def parse_worker_count(self, value):
+        self._settings.set("option", "parse_worker_count", str(value))
+        self._parse_worker_count = None
+
     @property
     def payload(self):
         return self._payload
 
+    @property
+    def release_spec_path(self):
+        """Directory holding the conf-spec files of Khulnasoft releases, one subdirectory per release version
+
+        A release's subdirectory need only hold the conf-spec files that differ from those on the
+        `configuration_spec_path`. Unlike other path options, this directory is not created on first access.
+
+        """
+        value = self._release_spec_path
+        if value is None:
+            value = path.expanduser(
+                path.normpath(self._get_option("release_spec_path"))
+            )
+            self._release_spec_path = value
+        return value
+
+    @release_spec_path.setter
+    def release_spec_path(self, value):
+        self._settings.set("option", "release_spec_path", value)
+        self._release_spec_path = None
+
     @property
     def repository_path(self):
         return self._get_path_option("_repository_path", "repository_path")
@@ -120,6 +212,54 @@ class SlimConfigurationManager(object):
     def user_config(self):
         return SlimConfigurationManager._user_config
 
+    @property
+    def spec_registry_size(self):
+        """Maximum number of base configuration specs and, separately, of app-overlaid configuration specs held in
+        memory
+
+        Specs are shared by all apps validated in the current process. The least recently used spec is evicted when
+        the limit is reached. A value less than one means that specs are loaded each time they are used.
+
+        """
+        return self._get_integer_option(
+            "_spec_registry_size", "spec_registry_size", 256
+        )
+
+    @spec_registry_size.setter
+    def spec_registry_size(self, value):
+        self._settings.set("option", "spec_registry_size", str(value))
+        self._spec_registry_size = None
+
+    @property
+    def validation_cache(self):
+        """:const:`True`, if the outcome of validating app source packages is cached
+
+        Validation outcomes are stored in a persistent cache under `cache_directory_path` and so they're not cached,
+        if caching is disabled. Set this property to :const:`False` to validate each source package on every use.
+
+        """
+        return self._validation_cache
+
+    @validation_cache.setter
+    def validation_cache(self, value):
+        self._validation_cache = value
+
+    @property
+    def validation_memo_size(self):
+        """Maximum number of stanza names for which resolved stanza declarations and placements are memoized
+
+        The memo is shared by all conf files validated in the current process. A value less than one disables it.
+
+        """
+        return self._get_integer_option(
+            "_validation_memo_size", "validation_memo_size", 4096
+        )
+
+    @validation_memo_size.setter
+    def validation_memo_size(self, value):
+        self._settings.set("option", "validation_memo_size", str(value))
+        self._validation_memo_size = None
+
     # endregion
 
     # region Methods
@@ -189,10 +329,19 @@ class SlimConfigurationManager(object):
 
         self._cache = None
         self._output_dir = os.getcwd()
+        self._lean_parsing = False
         self._payload = SlimPayload()
-        self._configuration_spec_path = (
-            self._repository_path
-        ) = self._temp_directory_path = None  # set on first access
+        self._validation_cache = True
+        # set on first access
+        self._cache_directory_path = None
+        self._cache_max_entries = None
+        self._configuration_spec_path = None
+        self._parse_worker_count = None
+        self._release_spec_path = None
+        self._repository_path = None
+        self._spec_registry_size = None
+        self._temp_directory_path = None
+        self._validation_memo_size = None
         self._settings = SlimConfigurationManager._create_config_parser(
             SafeConfigParser, list(cls._files.values())
         )
@@ -328,6 +477,23 @@ class SlimConfigurationManager(object):
     def _get_option(self, option):
         return self._get("option", option)
 
+    def _get_integer_option(self, attr, name, default):
+
+        value = getattr(self, attr)
+
+        if value is None:
+            option = self._get_option(name).strip()
+            try:
+                value = int(option) if len(option) > 0 else default
+            except ValueError:
+                SlimLogger.warning(
+                    "Expected an integer value for option.", name, ", not ", option
+                )
+                value = default
+            setattr(self, attr, value)
+
+        return value
+
     def _get_path_option(self, attr, name):
 
         value = getattr(self, attr)
@@ -398,15 +564,27 @@ class SlimConfigurationManager(object):
                     "option",
                     OrderedDict(
                         (
+                            (
+                                "cache_directory_path",
+                                path.join(cls._user_config, "cache"),
+                            ),
+                            ("cache_max_entries", "16384"),
                             (
                                 "configuration_spec_path",
                                 path.join(cls._slim_config, "conf-specs"),
                             ),
+                            ("parse_worker_count", "0"),
+                            (
+                                "release_spec_path",
+                                path.join(cls._slim_config, "release-specs"),
+                            ),
                             (
                                 "repository_path",
                                 path.join(cls._user_config, "repository"),
                             ),
+                            ("spec_registry_size", "256"),
                             ("temp_directory_path", gettempdir()),
+                            ("validation_memo_size", "4096"),
                         )
                     ),
                 ),
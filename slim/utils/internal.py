@@ -9,6 +9,7 @@ from os import path
 from sys import getdefaultencoding, version_info
 
 import io
+import os
 
 if version_info.major >= 3:
     # noinspection PyShadowingBuiltins
@@ -68,3 +69,42 @@ def hash_object(filename, size=-1):
                     break
                 object_id.update(block[:length])
     return string(object_id.hexdigest())
+
+
+def get_file_signature(filename):
+    """
+    Gets a value that changes whenever a file is added, removed, or modified.
+
+    :param filename: Path to file.
+    :type filename: string
+    :return: The name, modification time, and size of the file or--if the file does not exist--its name alone.
+    :rtype: tuple
+
+    """
+    try:
+        status = os.stat(filename)
+    except OSError:
+        return (filename,)
+    return filename, status.st_mtime, status.st_size
+
+
+def replace_file(source, destination):
+    """
+    Renames a file, replacing any file at the destination.
+
+    The replacement is atomic, except on Windows under Python 2.7, which offers no atomic replace.
+
+    :param source: Path to the file to rename.
+    :type source: string
+    :param destination: Path to the file to replace.
+    :type destination: string
+
+    """
+    try:
+        replace = os.replace
+    except AttributeError:
+        # Python 2.7 offers no atomic replace on Windows; fall back to rename which is atomic on posix systems
+        if os.name == "nt" and path.exists(destination):
+            os.remove(destination)
+        replace = os.rename
+    replace(source, destination)
@@ -152,6 +152,10 @@ class SlimLogger(object):
     def is_debug_enabled(cls):
         return cls._debug is True
 
+    @classmethod
+    def get_level(cls):
+        return cls._default_level
+
     @classmethod
     def set_level(cls, value):
         cls._logger.setLevel(value)  # setLevel() handles both numeric and string levels
@@ -186,6 +190,41 @@ class SlimLogger(object):
 
     # endregion
 
+    # region Message recording
+
+    @classmethod
+    def start_recording(cls, hold=False):
+        """Starts recording messages as they are emitted
+
+        Recording is independent of the current logging level and handlers. Each message is recorded as a tuple of
+        the form `(level, args)` so that it can be replayed later using :meth:`SlimLogger.message`.
+
+        :param hold: :const:`True`, if messages should be held back until they're replayed. Held messages are neither
+        logged nor counted and they're not recorded by enclosing recordings. Fatal messages are never held.
+        :type hold: bool
+
+        :return: A list to which messages are appended until :meth:`SlimLogger.stop_recording` is called.
+        :rtype: list
+
+        """
+        recording = []
+        cls._recordings.append(recording)
+        if hold:
+            cls._holds.append(recording)
+        return recording
+
+    @classmethod
+    def stop_recording(cls, recording):
+        # recordings may be nested and equal lists compare equal; hence we remove this recording by identity
+        for recordings in cls._recordings, cls._holds:
+            for index in range(len(recordings) - 1, -1, -1):
+                if recordings[index] is recording:
+                    del recordings[index]
+                    break
+        return recording
+
+    # endregion
+
     # region Privates
 
     _debug = False  # turns on debug output which is different than turning on debug messages using, e.g., set_level
@@ -218,9 +257,17 @@ class SlimLogger(object):
     # noinspection PyShadowingNames
     @classmethod
     def _emit(cls, level, *args):
+        holds = cls._holds
+        for recording in reversed(cls._recordings):
+            recording.append((level, args))
+            if holds and level != logging.FATAL and any(r is recording for r in holds):
+                return
         cls._adapter.log(level, None, *args)
         cls._message_count[level] += 1
 
+    _holds = []
+    _recordings = []
+
     @staticmethod
     def _initialize_logging():
 
@@ -4,11 +4,23 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from builtins import object
+from collections import OrderedDict
+from itertools import chain
+from multiprocessing import Pool, cpu_count
+from os import path
+from time import sleep, time
+
+import io
+import json
+import logging
+import os
 import sys
 
 from slim.utils import *
 from slim.app import *
 from slim.command import *
+from slim.utils.internal import get_file_signature, string
 
 
 # Argument parser definition
@@ -18,17 +30,82 @@ parser = SlimArgumentParser(
     epilog="This command assumes the app.manifest file is located within the app source directory.",
 )
 
-parser.add_app_source()
+parser.add_app_source(required=False)
 parser.add_argument_help()
 parser.add_repository()
 parser.add_unreferenced_input_groups()
+parser.add_output_file(description="payload of each app validated by --batch")
+
+parser.add_argument(
+    "--batch",
+    help="""
+        validate each of the app sources in this directory or listed in this file, one per line, instead of
+        <app-source>
+    """,
+    metavar="<dir-or-list>",
+)
+parser.add_argument(
+    "-j",
+    "--jobs",
+    type=int,
+    help="number of worker processes used by --batch (default: number of CPUs)",
+    metavar="<count>",
+)
+
+parser.add_argument(
+    "--releases",
+    help="""
+        also validate the configuration of each app against the conf specs of these Khulnasoft releases, reporting the
+        stanzas and settings defined by some of them, but not others
+    """,
+    metavar="<version>[,<version>]...",
+)
+parser.add_argument(
+    "--watch",
+    action="store_true",
+    help="""
+        keep the app source directory in memory and validate it again each time it changes, reporting the warnings and
+        errors that are new or resolved until interrupted
+    """,
+)
 
 
 def main(args):
-    validate(args.source, args.repository, args.unreferenced_input_groups)
+    releases = None if args.releases is None else _get_releases(args.releases)
+    if args.batch is not None:
+        if args.source is not None or args.watch:
+            parser.error("--batch cannot be used with <app-source> or --watch")
+        sources = get_batch_sources(args.batch)
+        results = validate_many(
+            sources,
+            args.repository,
+            args.unreferenced_input_groups,
+            worker_count=args.jobs,
+            releases=releases,
+        )
+        _save_batch(results, args.output)
+        return
+    if args.output is not sys.stdout:
+        parser.error("--output can only be used with --batch")
+    if args.source is None:
+        parser.error("expected <app-source>")
+    if args.watch:
+        if releases is not None:
+            parser.error("--watch cannot be used with --releases")
+        watch(args.source, args.repository, args.unreferenced_input_groups)
+        return
+    validate(
+        args.source, args.repository, args.unreferenced_input_groups, releases=releases
+    )
 
 
-def validate(source, repository=None, unreferenced_input_groups="note", app_only=False):
+def validate(
+    source,
+    repository=None,
+    unreferenced_input_groups="note",
+    app_only=False,
+    releases=None,
+):  # pylint: disable=too-many-arguments
 
     SlimLogger.step("Validating app at " + encode_filename(source) + "...")
 
@@ -51,9 +128,578 @@ def validate(source, repository=None, unreferenced_input_groups="note", app_only
         app_dependency_graph.report_unreferenced_input_groups(unreferenced_input_groups)
         SlimLogger.exit_on_error()
 
+    # Compare the app's configuration against the specs of each of the given Khulnasoft releases
+    if releases:
+        _report_release_differences(app_source, releases)
+
     SlimLogger.information("App validation complete")
 
 
+def get_batch_sources(name):
+    """Returns the app sources in a directory or listed in a file
+
+    The app sources in a directory are its subdirectories and source packages in name order. A list file names one app
+    source per line. Blank lines and lines that start with '#' are ignored. Relative names are relative to the
+    directory containing the list file.
+
+    :param name: Name of a directory or list file.
+    :type name: string
+
+    :return: Names of app sources.
+    :rtype: list
+
+    """
+    if path.isdir(name):
+        sources = []
+        for filename in sorted(os.listdir(name)):
+            filename = path.join(name, filename)
+            try:
+                sources.append(SlimSourceArgument()(filename))
+            except SlimArgumentError:
+                continue
+        return sources
+
+    try:
+        with io.open(name, encoding="utf-8") as istream:
+            lines = [line.strip() for line in istream]
+    except IOError as error:
+        SlimLogger.fatal(
+            "Could not read app source list ",
+            encode_filename(name),
+            ": ",
+            error.strerror,
+        )
+
+    directory = path.dirname(name)
+    return [
+        path.join(directory, line)
+        for line in lines
+        if line and not line.startswith("#")
+    ]
+
+
+def validate_many(
+    sources,
+    repository=None,
+    unreferenced_input_groups="note",
+    app_only=False,
+    worker_count=None,
+    releases=None,
+):  # pylint: disable=too-many-arguments
+    """Validates many app sources using a pool of worker processes
+
+    Each app source is validated in a :func:`slim_transaction` as if by :func:`validate`. Base configuration specs are
+    loaded before workers are started so that workers share them. Workers record the messages they log. Here we replay
+    them, app by app, in the order given by `sources`.
+
+    :param sources: Names of app source packages or directories.
+    :type sources: list
+
+    :param worker_count: Number of worker processes. The default is the number of CPUs. A value less than two means
+    that app sources are validated in the current process.
+    :type worker_count: int
+
+    :return: A list of pairs, one for each app source in `sources` order: the name of an app source and the payload
+    produced by validating it.
+    :rtype: list
+
+    """
+    # Default repository is set on slim_configuration
+    if repository is None:
+        repository = slim_configuration.repository_path
+
+    if worker_count is None:
+        worker_count = cpu_count()
+
+    tasks = [
+        (source, repository, unreferenced_input_groups, app_only, releases)
+        for source in sources
+    ]
+    worker_count = min(worker_count, len(tasks))
+
+    if worker_count < 2:
+        # Messages are logged as they're emitted
+        return [_validate_batch_source(task)[:2] for task in tasks]
+
+    # Any message about the conf-spec bundle is logged once by the current process, not once by each worker
+    AppConfigurationSpecRegistry.instance().preload()
+
+    pool = Pool(worker_count, _initialize_batch_worker)
+    results = []
+
+    try:
+        for source, payload, messages in pool.imap(_validate_batch_source, tasks):
+            for level, args in messages:
+                try:
+                    SlimLogger.message(level, *args)
+                except SystemExit:
+                    pass  # fatal errors end the validation of an app source, not the batch
+            results.append((source, payload))
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+    return results
+
+
+def watch(
+    source,
+    repository=None,
+    unreferenced_input_groups="note",
+    app_only=False,
+    interval=0.5,
+):  # pylint: disable=too-many-arguments
+    """Validates an app source directory and then validates it again each time it changes, until interrupted
+
+    The app source, its configuration, and the specs it is validated against are kept in memory. Files are polled for
+    changes every `interval` seconds. Only the configuration files, manifest, and dependency packages that changed are
+    reloaded and validated again. After the first validation, only the warnings and errors that are new or resolved
+    are reported.
+
+    """
+    if not path.isdir(source):
+        SlimLogger.error(
+            "Expected an app source directory, not ", encode_filename(source)
+        )
+        SlimLogger.exit_on_error()
+
+    # Default repository is set on slim_configuration
+    if repository is None:
+        repository = slim_configuration.repository_path
+
+    SlimLogger.step("Validating app at " + encode_filename(source) + "...")
+
+    watcher = _AppSourceWatcher(source, repository, unreferenced_input_groups, app_only)
+    problems = _get_problems(watcher.update())
+
+    SlimLogger.information(
+        "App validation complete; watching for changes (press Ctrl-C to stop)"
+    )
+
+    try:
+        while True:
+            sleep(interval)
+            start = time()
+            level = SlimLogger.get_level()
+            SlimLogger.set_level(logging.CRITICAL + 1)  # messages are reported below
+            try:
+                messages = watcher.update()
+            finally:
+                SlimLogger.set_level(level)
+            if messages is None:
+                continue
+            problems = _report_changes(
+                problems, _get_problems(messages), time() - start
+            )
+    except KeyboardInterrupt:
+        pass
+
+
+# region Protected
+
+
+class _AppSourceWatcher(object):
+    """Holds an app source directory in memory and validates the parts of it that change
+
+    The messages logged while loading each configuration file are held by the configuration file. Messages logged
+    while validating the app source and its dependency graph are held here until the app source must be validated
+    again. The app source is loaded as :func:`validate` loads it and so the first update logs the same messages in the
+    same order.
+
+    """
+
+    def __init__(self, source, repository, unreferenced_input_groups, app_only):
+        self._source = source
+        self._repository = repository
+        self._unreferenced_input_groups = unreferenced_input_groups
+        self._app_only = app_only
+        self._app_source = None
+        self._signature = None
+        self._source_messages = self._graph_messages = []
+
+    # region Methods
+
+    def update(self):
+        """Reloads and validates the parts of the app source that changed since the last update
+
+        :return: The messages that apply to the app source as it is now or :const:`None`, if nothing changed.
+        :rtype: list
+
+        """
+        app_source = self._app_source
+
+        if app_source is None:
+            # We load the app source from scratch: either for the first time or after a fatal error
+            signature = _get_tree_signature(self._source)
+            if signature == self._signature:
+                return None
+            self._signature = signature
+            messages, app_source = _record(AppSource, self._source)
+            revalidate = app_source is not _failed
+            first_update = True
+        else:
+            revalidate, names = app_source.refresh()
+            if not (revalidate or names):
+                return None
+            messages = self._source_messages
+            first_update = False
+            if revalidate:
+                messages, value = _record(app_source.validate)
+                if value is _failed:
+                    app_source = _failed
+
+        if app_source is _failed:
+            self._source_messages = messages
+            self._app_source = None
+            self._graph_messages = []
+            return messages
+
+        self._app_source = app_source
+        configuration_messages, files = _record(
+            lambda: list(app_source.configuration.files())
+        )
+
+        if files is _failed:
+            self._source_messages = messages
+            self._app_source = None
+            return messages + configuration_messages
+
+        # Configuration files hold their own messages; we drop those logged while validating the app source, so that
+        # they're not reported after the configuration file that logged them is reloaded
+        file_messages = list(chain.from_iterable(f.messages for f in files))
+        file_message_ids = set(id(args) for level, args in file_messages)
+        self._source_messages = [
+            (level, args)
+            for level, args in messages
+            if id(args) not in file_message_ids
+        ]
+
+        if revalidate:
+            if self._app_only or any(
+                level >= logging.ERROR for level, args in messages
+            ):
+                self._graph_messages = []
+            else:
+                self._graph_messages, value = _record(self._validate_dependencies)
+                if value is _failed:
+                    self._app_source = None
+
+        if first_update:
+            # The messages logged while loading the configuration are in messages, in the order they were logged
+            return messages + self._graph_messages
+
+        return self._source_messages + file_messages + self._graph_messages
+
+    # endregion
+
+    # region Protected
+
+    def _validate_dependencies(self):
+        error_count = SlimLogger.error_count()
+        app_dependency_graph = AppDependencyGraph(self._app_source, self._repository)
+        if SlimLogger.error_count() == error_count:
+            app_dependency_graph.report_unreferenced_input_groups(
+                self._unreferenced_input_groups
+            )
+
+    # endregion
+    pass  # pylint: disable=unnecessary-pass
+
+
+_failed = object()  # value returned by _record when a function exits with a fatal error
+
+
+class _BatchWorkerHandler(logging.Handler):
+    """Formats log records without writing them anywhere
+
+    Workers record the messages they log for replay by the parent process; they do not write them to the console.
+    Records must still be formatted for the payload logging handler of a :func:`slim_transaction`.
+
+    """
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.setFormatter(SlimExternalFormatter("%(message)s"))
+
+    def emit(self, record):
+        self.format(record)
+
+
+def _initialize_batch_worker():
+    SlimLogger.use_external_handler(_BatchWorkerHandler())
+    # Workers are daemonic; they cannot start pools of their own
+    slim_configuration.parse_worker_count = 0
+
+
+def _get_problems(messages):
+    """Returns the warnings and errors in a list of recorded messages keyed by their text, without duplicates"""
+    problems = OrderedDict()
+    for level, args in messages:
+        if level >= logging.WARN:
+            key = level, "".join(string(arg) for arg in args)
+            problems.setdefault(key, args)
+    return problems
+
+
+def _get_releases(value):
+    """Parses the value of the --releases argument, reporting the versions that aren't Khulnasoft releases
+
+    A release that has no directory on the `release_spec_path` is validated against the specs on the
+    `configuration_spec_path`. We warn about each such release: it can differ from other releases only in the specs
+    they hold on the `release_spec_path`.
+
+    :return: Release versions in argument order, without duplicates.
+    :rtype: list
+
+    """
+    releases = list(
+        OrderedDict.fromkeys(
+            version.strip() for version in value.split(",") if version.strip()
+        )
+    )
+
+    if len(releases) == 0:
+        parser.error("expected one or more release versions, not " + repr(value))
+
+    release_info = AppKhulnasoftReleaseInfo.load()
+    known_releases = set(
+        string(version)
+        for versions in vars(release_info).values()
+        for version in versions
+    )
+
+    for release in releases:
+        if release not in known_releases:
+            SlimLogger.error("Unknown Khulnasoft release: ", release)
+        elif not path.isdir(path.join(slim_configuration.release_spec_path, release)):
+            SlimLogger.warning(
+                "Found no conf specs for Khulnasoft ",
+                release,
+                " in ",
+                encode_filename(slim_configuration.release_spec_path),
+                "; using those on configuration_spec_path instead",
+            )
+
+    SlimLogger.exit_on_error()
+    return releases
+
+
+def _get_tree_signature(directory):
+    return tuple(
+        get_file_signature(path.join(root, filename))
+        for root, directories, filenames in os.walk(directory)
+        for filename in sorted(filenames)
+    )
+
+
+def _validate_batch_source(task):
+    """Validates an app source in a :func:`slim_transaction`
+
+    :return: The name of the app source, the payload produced by validating it, and the messages logged, reduced to
+    strings.
+    :rtype: tuple
+
+    """
+    source, repository, unreferenced_input_groups, app_only, releases = task
+    recording = SlimLogger.start_recording()
+
+    # App source packages are cached by name; so each app source is validated as if by a separate run of validate
+    slim_configuration.cache.reset()
+
+    try:
+        with slim_transaction():
+            try:
+                validate(
+                    source, repository, unreferenced_input_groups, app_only, releases
+                )
+            except Exception:  # pylint: disable=broad-except
+                SlimLogger.fatal(exception_info=sys.exc_info())
+    finally:
+        SlimLogger.stop_recording(recording)
+
+    payload = slim_configuration.payload
+
+    # Fatal errors are not counted as errors; so the transaction does not fail the validation for them
+    if not payload.status and any(level == logging.FATAL for level, _ in recording):
+        payload.status = SlimStatus.STATUS_ERROR_GENERAL
+
+    messages = [
+        (level, tuple(string(arg) for arg in args)) for level, args in recording
+    ]
+    return source, payload.payload, messages
+
+
+def _report_release_differences(app_source, releases):
+    """Reports the stanzas and settings in an app's configuration that are defined by some releases, but not others
+
+    The configuration is traversed once. Each stanza is checked against the specs of every release. Each setting is
+    checked against the specs of the releases that define its stanza. Stanzas and settings defined by no release are
+    reported when the configuration is loaded and so they are not reported here.
+
+    """
+    configuration = app_source.configuration
+    app_root = configuration.app_root
+    difference_count = 0
+
+    for configuration_file in configuration.files():
+        name = configuration_file.name
+        validators = [
+            AppConfigurationValidator(name, app_root, release) for release in releases
+        ]
+        for section in configuration_file.sections():
+            for stanza in section.stanzas():
+                stanza_name = stanza.name.replace("\n", "\\n")
+                description = _describe_release_differences(
+                    releases, [v.is_defined(stanza.name) for v in validators]
+                )
+                if description is not None:
+                    SlimLogger.warning(
+                        stanza.position,
+                        ": Stanza [",
+                        stanza_name,
+                        "] in ",
+                        name,
+                        ".conf is ",
+                        description,
+                    )
+                    difference_count += 1
+                for setting in stanza.settings():
+                    description = _describe_release_differences(
+                        releases,
+                        [v.is_defined(stanza.name, setting) for v in validators],
+                    )
+                    if description is not None:
+                        SlimLogger.warning(
+                            setting.position,
+                            ": Setting in ",
+                            name,
+                            ".conf, stanza [",
+                            stanza_name,
+                            "] is ",
+                            description,
+                            ": ",
+                            setting.name,
+                        )
+                        difference_count += 1
+
+    SlimLogger.information(
+        "Compared app configuration against Khulnasoft ",
+        encode_series(releases),
+        ": ",
+        difference_count,
+        " stanzas and settings are defined by some of these releases, but not others",
+    )
+
+
+def _describe_release_differences(releases, outcomes):
+    """Describes the releases that define and don't define a stanza or setting or returns :const:`None`, if they agree
+
+    An outcome of :const:`None` means that a release has no say--it has no spec for the configuration or does not
+    define the stanza containing a setting--and so it's left out of the description.
+
+    """
+    undefined = [r for r, outcome in zip(releases, outcomes) if outcome is False]
+    defined = [r for r, outcome in zip(releases, outcomes) if outcome is True]
+    if len(undefined) == 0 or len(defined) == 0:
+        return None
+    return (
+        "undefined in "
+        + encode_series(undefined)
+        + "; defined in "
+        + encode_series(defined)
+    )
+
+
+def _record(function, *args, **kwargs):
+    """Calls a function, recording the messages it logs
+
+    :return: A pair: the messages logged and the value returned by the function or :data:`_failed`, if the function
+    exited with a fatal error.
+    :rtype: tuple
+
+    """
+    recording = SlimLogger.start_recording()
+    try:
+        value = function(*args, **kwargs)
+    except SystemExit:
+        value = _failed
+    finally:
+        SlimLogger.stop_recording(recording)
+    return recording, value
+
+
+def _save_batch(results, output):
+    """Reports the results of validating a batch of app sources, saving their payloads to `output`
+
+    The payloads are saved as a JSON object with a list of payloads, each of which names its app source, and a summary.
+    Exits with status one, if the validation of any app source failed.
+
+    """
+    payloads = []
+    failures = []
+
+    for source, payload in results:
+        value = OrderedDict((("source", source),))
+        value.update(payload)
+        payloads.append(value)
+        if payload["status"] != SlimStatus.STATUS_OK:
+            failures.append(source)
+
+    summary = OrderedDict(
+        (
+            ("count", len(payloads)),
+            ("passed", len(payloads) - len(failures)),
+            ("failed", len(failures)),
+        )
+    )
+
+    text = json.dumps(
+        OrderedDict((("payloads", payloads), ("summary", summary))),
+        indent=2,
+        separators=(",", ": "),
+    )
+
+    if isinstance(text, string):
+        text = text.encode("utf-8")
+
+    with output:
+        getattr(output, "buffer", output).write(text + b"\n")
+
+    SlimLogger.step(
+        "Validated %d apps: %d passed and %d failed"
+        % (summary["count"], summary["passed"], summary["failed"])
+    )
+
+    for source in failures:
+        SlimLogger.error("App validation failed: ", encode_filename(source))
+
+    if failures:
+        sys.exit(1)
+
+
+def _report_changes(previous, current, elapsed):
+
+    resolved = [key for key in previous if key not in current]
+    added = [key for key in current if key not in previous]
+
+    for level, text in resolved:
+        SlimLogger.information("Resolved ", logging.getLevelName(level), ": ", text)
+
+    for key in added:
+        SlimLogger.message(key[0], *current[key])
+
+    SlimLogger.step(
+        "Validated changes in %.2f seconds: %d new and %d resolved; %d warnings and errors remain"
+        % (elapsed, len(added), len(resolved), len(current))
+    )
+
+    return current
+
+
+# endregion
+
+
 if __name__ == "__main__":
     # noinspection PyBroadException
     try:
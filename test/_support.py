@@ -0,0 +1,415 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+""" support module
+
+Helpers shared by tests and benchmarks. Synthetic apps are a function of their size alone and so the same app is
+written each time.
+
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import Mapping, OrderedDict  # pylint: disable=no-name-in-module
+from contextlib import contextmanager
+from copy import deepcopy
+from os import path
+from types import GeneratorType
+import io
+import json
+import os
+import logging
+import re
+
+from slim.utils import SlimLogger, slim_configuration
+from slim.utils.internal import string
+
+
+def describe_configuration(app_root, lazy=False):
+    """Loads the configuration of an app and returns a list of lines that describe everything it holds
+
+    The list covers every section, stanza, and setting--with its value, placement, and line number--as well as the
+    JSON the configuration saves and the messages logged while loading it. Two loads that yield equal descriptions are
+    indistinguishable to the code that uses them.
+
+    """
+    from slim.app import AppConfiguration  # pylint: disable=import-outside-toplevel
+
+    recording = SlimLogger.start_recording(hold=True)
+    try:
+        configuration = AppConfiguration.load(app_root, lazy)
+        lines = []
+        for configuration_file in configuration.files():
+            lines.append("file " + configuration_file.name)
+            for section in configuration_file.sections():
+                lines.append(" section " + section.name)
+                for stanza in section.stanzas():
+                    lines.append(_describe_object(2, stanza))
+                    lines.extend(_describe_object(3, s) for s in stanza.settings())
+            for stanza in configuration_file.stanzas():
+                lines.append(_describe_object(1, stanza))
+                lines.extend(_describe_object(2, s) for s in stanza.settings())
+        ostream = io.StringIO()
+        configuration.save(ostream)
+        lines.append(ostream.getvalue())
+    finally:
+        SlimLogger.stop_recording(recording)
+
+    lines.extend(
+        "message " + str(level) + " " + "".join(str(arg) for arg in args)
+        for level, args in recording
+    )
+    return lines
+
+
+def describe_conversion(schema, document, interpreted=False):
+    """Converts a copy of a JSON document with a schema and returns a list of lines that describe the outcome
+
+    The list covers the errors reported, the converted value, and the copy of the document--which conversion updates
+    in place--both when errors are reported and when the first error raises an exception. An exception is described
+    as the result. Set `interpreted` to :const:`True` to convert by interpreting the schema definition, as
+    :meth:`JsonSchema.convert_from` did before definitions were compiled.
+
+    """
+    lines = []
+
+    for raising in False, True:
+        value = deepcopy(document)
+        errors = []
+
+        def onerror(*args):
+            errors.append("".join(string(arg) for arg in args))
+            if raising:
+                raise ValueError(errors[-1])
+
+        try:
+            if interpreted:
+                schema.definition.validate(schema.name, value, onerror)
+                result = schema.definition.convert_from(schema.name, value, onerror)
+            else:
+                result = schema.convert_from(value, onerror)
+        except Exception as error:  # pylint: disable=broad-except
+            result = error
+        lines.extend("error " + error for error in errors)
+        lines.append("result " + repr(_describe_json(result)))
+        lines.append("document " + repr(_describe_json(value)))
+
+    return lines
+
+
+def describe_spec(configuration_spec, probes=()):
+    """Returns a list of lines that describe everything a loaded conf-spec holds
+
+    The list covers the stanza and setting declarations of each spec file--with their placements, positions,
+    patterns, and documentation--the merged stanza and setting declarations, and the names of the stanza declarations
+    that match each of the given `probes`.
+
+    """
+    lines = []
+    for filename, section in configuration_spec.to_dict().items():
+        lines.append("file " + filename)
+        for stanza in section.stanza_declarations.values():
+            lines.append(_describe_declaration(1, stanza))
+            lines.extend(_describe_documentation(2, stanza))
+            for setting in stanza.setting_declarations.values():
+                lines.append(_describe_declaration(2, setting))
+                lines.extend(_describe_documentation(3, setting))
+    for stanza in configuration_spec.stanza_declarations():
+        lines.append(_describe_declaration(0, stanza))
+        lines.extend(
+            _describe_declaration(1, setting)
+            for setting in stanza.setting_declarations()
+        )
+    for probe in probes:
+        declarations = configuration_spec.match(probe)
+        lines.append(
+            "match "
+            + repr(probe)
+            + " "
+            + repr(None if declarations is None else [d.name for d in declarations])
+        )
+    return lines
+
+
+@contextmanager
+def options(**values):
+    """Sets `slim_configuration` options for the duration of a with statement"""
+    previous = [(name, getattr(slim_configuration, name)) for name in values]
+    try:
+        for name, value in values.items():
+            setattr(slim_configuration, name, value)
+        yield
+    finally:
+        for name, value in previous:
+            setattr(slim_configuration, name, "" if value is None else value)
+
+
+def get_messages(recording):
+    """Returns the `(level, text)` of each message in a `SlimLogger` recording"""
+    return [(level, "".join(string(arg) for arg in args)) for level, args in recording]
+
+
+def record(function, *args):
+    """Calls a function with the console silenced and returns the `(level, text)` of each message it logs and its value
+
+    A function that exits returns :const:`None`.
+
+    """
+    level = SlimLogger.get_level()
+    SlimLogger.set_level(logging.CRITICAL + 1)
+    # held messages aren't counted; hence we record without holding and silence the console instead
+    recording = SlimLogger.start_recording()
+    value = None
+    try:
+        value = function(*args)
+    except SystemExit:
+        pass
+    finally:
+        SlimLogger.stop_recording(recording)
+        SlimLogger.set_level(level)
+    return get_messages(recording), value
+
+
+def get_manifest():
+    """Returns an app manifest that holds a value for every field of the app manifest schema"""
+    text = """{
+        "schemaVersion": "2.0.0",
+        "info": {
+            "title": "Synthetic",
+            "id": {"group": "synthetic-group", "name": "synthetic", "version": "1.2.3"},
+            "author": [
+                {"name": "A. Author", "email": "author@example.com", "company": "Example"},
+                {"name": "B. Author"}
+            ],
+            "releaseDate": "2026-10-17",
+            "description": "A synthetic app",
+            "classification": {
+                "intendedAudience": "Administrators",
+                "categories": ["IT Operations", "Security"],
+                "developmentStatus": "Production/Stable"
+            },
+            "commonInformationModels": {"Authentication": ">=4.1.0", "Network_Traffic": "~4.0"},
+            "license": {"name": "Apache 2.0", "uri": "https://www.apache.org/licenses/LICENSE-2.0"},
+            "privacyPolicy": {"name": "Privacy", "uri": "https://example.com/privacy"},
+            "releaseNotes": {"name": "Release notes", "uri": "https://example.com/notes"}
+        },
+        "dependencies": {
+            "synthetic-group:first": {
+                "version": "~1.0",
+                "package": "synthetic-first-1.0.0.tar.gz",
+                "optional": false,
+                "targetOS": ["_linux_x86_64", "_windows"]
+            },
+            "synthetic-group:second": {"version": ">=2.0.0", "optional": true}
+        },
+        "tasks": ["first-task", "second-task"],
+        "inputGroups": {
+            "first-group": {
+                "requires": {"synthetic-group:first": ["first-group"]},
+                "inputs": ["monitor:///var/log/app0/*.log", "tcp://1025"],
+                "description": "The first input group"
+            },
+            "second-group": {"inputs": ["udp://1026"]}
+        },
+        "incompatibleApps": {"other-group:other": ">=1.0.0"},
+        "platformRequirements": {"khulnasoft": {"Enterprise": ">=6.5.0", "Light": "*"}},
+        "supportedDeployments": ["_standalone", "_distributed"],
+        "targetWorkloads": ["_search_heads", "_indexers"]
+    }"""
+    return json.loads(text, object_pairs_hook=OrderedDict)
+
+
+def get_stanza_names(stanza_count):
+    """Returns the names of the stanzas in the `inputs.conf` file of a synthetic app with `stanza_count` stanzas"""
+    return [_get_input(i)[0] for i in range(stanza_count)]
+
+
+def write_app(app_root, stanza_count):
+    """Writes a synthetic app with `stanza_count` stanzas in its `inputs.conf` and `props.conf` files
+
+    The app holds about six settings for each stanza in its `inputs.conf` file. Every 97th input stanza holds an
+    undefined setting and every 89th input stanza is of a kind that has no spec. Hence validating the app produces
+    warnings. Blank lines, comments, and continuation lines are sprinkled throughout.
+
+    :param app_root: App root directory name. It is created, if it does not exist.
+    :type app_root: string
+
+    :param stanza_count: Number of stanzas.
+    :type stanza_count: int
+
+    :return: Number of settings in the app.
+    :rtype: int
+
+    """
+    setting_count = 0
+
+    lines = [
+        "[launcher]",
+        "author = Synthetic",
+        "description = A synthetic app with " + str(stanza_count) + " stanzas",
+        "version = 1.0.0",
+        "",
+        "[package]",
+        "id = synthetic",
+        "",
+        "[ui]",
+        "is_visible = false",
+        "label = Synthetic",
+    ]
+    setting_count += 6
+    _write(path.join(app_root, "default", "app.conf"), lines)
+
+    lines = ["# inputs", "[default]", "host = synthetic", ""]
+    setting_count += 1
+
+    for i in range(stanza_count):
+        name, settings = _get_input(i)
+        if i % 13 == 0:
+            lines.append("# input " + str(i))
+        lines.append("[" + name + "]")
+        for setting in settings:
+            lines.append(setting)
+        lines.append("")
+        setting_count += len(settings)
+
+    _write(path.join(app_root, "default", "inputs.conf"), lines)
+
+    lines = []
+
+    for i in range(stanza_count):
+        if i % 2 == 0:
+            lines.append("[source::/var/log/app" + str(i) + "/*.log]")
+            lines.append("TRUNCATE = " + str(10000 + i))
+            lines.append("SHOULD_LINEMERGE = false")
+            setting_count += 2
+        else:
+            lines.append("[sourcetype" + str(i % 50) + "_" + str(i) + "]")
+            lines.append("TIME_FORMAT = %Y-%m-%d %H:%M:%S")
+            lines.append("LINE_BREAKER = ([\\r\\n]+) \\")
+            lines.append("  # continued")
+            lines.append("MAX_TIMESTAMP_LOOKAHEAD = 32")
+            setting_count += 3
+        lines.append("")
+
+    _write(path.join(app_root, "default", "props.conf"), lines)
+
+    lines = ["[monitor:///var/log/app0/*.log]", "disabled = true", ""]
+    setting_count += 1
+    _write(path.join(app_root, "local", "inputs.conf"), lines)
+
+    return setting_count
+
+
+# region Protected
+
+
+def _describe_json(value):
+    if isinstance(value, Mapping):
+        return type(value).__name__, [
+            (key, _describe_json(value[key])) for key in value
+        ]
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, [_describe_json(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return type(value).__name__, sorted(_describe_json(item) for item in value)
+    if isinstance(value, GeneratorType):
+        return type(value).__name__, [_describe_json(item) for item in value]
+    if type(value).__repr__ is object.__repr__ and hasattr(value, "__dict__"):
+        return type(value).__name__, sorted(
+            (k, _describe_json(v)) for k, v in vars(value).items()
+        )
+    # a string-like array is converted by its type: str(generator) for a JSON string, which we describe without its
+    # address and its name, as they differ from one conversion to the next
+    return type(value).__name__, _generator.sub("<generator object>", string(value))
+
+
+_generator = re.compile(r"<generator object .*? at 0x[0-9a-fA-F]+>")
+
+
+def _describe_declaration(indent, declaration):
+    text = " " * indent + declaration.name
+    for name in "data_type", "pattern_source":
+        if hasattr(declaration, name):
+            text += " " + repr(getattr(declaration, name))
+    text += " " + repr(declaration.placement)
+    # merged stanza declarations have no position
+    position = getattr(declaration, "position", None)
+    if position is not None:
+        text += " " + position.file + ":" + str(position.line)
+    return text
+
+
+def _describe_documentation(indent, declaration):
+    return [
+        " " * indent
+        + "documentation "
+        + repr(str(item))
+        + " "
+        + item.position.file
+        + ":"
+        + str(item.position.line)
+        for item in declaration.documentation
+    ]
+
+
+def _describe_object(indent, value):
+    text = " " * indent + value.name
+    if hasattr(value, "value"):
+        text += " = " + repr(value.value)
+    text += " " + repr(value.placement)
+    position = getattr(value, "position", None)  # merged stanzas have no position
+    if position is not None:
+        text += " " + position.file + ":" + str(position.line)
+    return text
+
+
+def _get_input(i):
+    kind = i % 5
+    if i % 89 == 88:
+        name = "synthetic_modular_input://instance" + str(i)
+        settings = ["interval = 60"]
+    elif kind == 0:
+        name = "monitor:///var/log/app" + str(i) + "/*.log"
+        settings = [
+            "index = main",
+            "sourcetype = sourcetype" + str(i % 50),
+            "disabled = false",
+            "crcSalt = <SOURCE>",
+        ]
+    elif kind == 1:
+        name = "script://./bin/script" + str(i) + ".sh"
+        settings = [
+            "interval = " + str(60 + i % 600),
+            "index = main",
+            "sourcetype = sourcetype" + str(i % 50),
+            "disabled = false",
+        ]
+    elif kind == 2:
+        name = "tcp://" + str(1024 + i % 60000)
+        settings = ["connection_host = ip", "index = main", "sourcetype = tcp"]
+    elif kind == 3:
+        name = "udp://" + str(1024 + i % 60000)
+        settings = ["connection_host = dns", "index = main", "sourcetype = udp"]
+    else:
+        name = "batch:///data/drop" + str(i)
+        settings = [
+            "move_policy = sinkhole",
+            "index = main",
+            "sourcetype = batch",
+            "crcSalt = <SOURCE>",
+            "disabled = false",
+        ]
+    if i % 97 == 96:
+        settings.append("undefined_setting_" + str(i) + " = value")
+    return name, settings
+
+
+def _write(filename, lines):
+    directory = path.dirname(filename)
+    if not path.isdir(directory):
+        os.makedirs(directory)
+    with io.open(filename, "w", encoding="utf-8", newline="\n") as ostream:
+        ostream.write("\n".join(lines) + "\n")
+
+
+# endregion
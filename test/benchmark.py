@@ -0,0 +1,433 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+""" benchmark module
+
+Measures the optimized paths of the toolkit against the reference paths they replace. Each benchmark checks that both
+paths produce the same output before it reports how long each takes. Run from the root of the source tree:
+
+    python -m test.benchmark [<name>...]
+
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from argparse import ArgumentParser
+from collections import OrderedDict
+from glob import glob
+from os import path
+from tempfile import mkdtemp
+import gc
+import io
+import json
+import logging
+import os
+import shutil
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None  # Python 2.7
+
+from slim.utils import SlimLogger
+
+from ._support import (
+    describe_configuration,
+    describe_conversion,
+    describe_spec,
+    get_manifest,
+    get_stanza_names,
+    options,
+    write_app,
+)
+
+benchmarks = OrderedDict()
+
+
+def benchmark(function):
+    benchmarks[function.__name__.replace("_", "-")] = function
+    return function
+
+
+# region Benchmarks
+
+
+@benchmark
+def configuration(directory, scale):
+    """Parses an app with 100k settings without the parse cache, into the parse cache, and from the parse cache, and
+    then measures the memory retained by it and by an app with 100k settings whose names and values repeat"""
+    from slim.app import AppConfiguration  # pylint: disable=import-outside-toplevel
+
+    app_root = path.join(directory, "configuration")
+    setting_count = write_app(app_root, int(16000 * scale))
+    cache_directory_path = path.join(directory, "cache")
+
+    with options(cache_directory_path=""):
+        expected = describe_configuration(app_root)
+        uncached = _time(lambda: AppConfiguration.load(app_root), repeat=1)
+        retained = _measure(lambda: AppConfiguration.load(app_root))
+
+    with options(cache_directory_path=cache_directory_path):
+        cold = describe_configuration(app_root)
+        warm = describe_configuration(app_root)
+        cached = _time(lambda: AppConfiguration.load(app_root), repeat=1)
+
+    _check(cold == expected and warm == expected, "parse cache output differs")
+    _report("settings", setting_count)
+    _report("parse", uncached, "s")
+    _report("load from parse cache", cached, "s")
+    _report("retained by configuration", retained, "MB")
+    if retained is not None:
+        _report("retained per setting", retained * 1e6 / setting_count, "bytes")
+
+    # names and values repeat from stanza to stanza in this app, which the configuration store interns
+    app_root = path.join(directory, "uniform")
+    stanza_count = int(1000 * scale)
+    for i in range(10):
+        filename = path.join(app_root, "default", "uniform" + str(i) + ".conf")
+        if not path.isdir(path.dirname(filename)):
+            os.makedirs(path.dirname(filename))
+        with io.open(filename, "w", encoding="utf-8", newline="\n") as ostream:
+            for j in range(stanza_count):
+                ostream.write("[stanza" + str(j) + "]\n")
+                ostream.write(
+                    "".join("setting%d = value%d\n" % (k, k) for k in range(10))
+                )
+
+    with options(cache_directory_path=""):
+        retained = _measure(lambda: AppConfiguration.load(app_root))
+
+    _report("uniform settings", 10 * stanza_count * 10)
+    _report("retained by uniform configuration", retained, "MB")
+
+
+@benchmark
+def stanza_match(directory, scale):
+    """Matches the stanza names in a 10k-stanza inputs.conf file by declaration scan and by stanza index, and then
+    validates the file with and without the memo of resolved stanza names"""
+    # pylint: disable=import-outside-toplevel
+    from slim.app import (
+        AppConfiguration,
+        AppConfigurationSpec,
+        AppConfigurationValidator,
+    )
+    from slim.utils import slim_configuration
+
+    stanza_count = int(10000 * scale)
+    app_root = path.join(directory, "stanza-match")
+    write_app(app_root, stanza_count)
+    stanzas = get_stanza_names(stanza_count)
+
+    configuration_spec = AppConfigurationSpec("inputs", app_root)
+    configuration_spec.load(
+        path.join(slim_configuration.configuration_spec_path, "inputs.conf.spec")
+    )
+    declarations = list(configuration_spec.stanza_declarations())
+
+    def scan():
+        return [
+            [d for d in declarations if d.pattern.match(stanza)] or None
+            for stanza in stanzas
+        ]
+
+    def match():
+        return [configuration_spec.match(stanza) for stanza in stanzas]
+
+    _check(match() == scan(), "stanza index output differs")
+    _report("stanzas", stanza_count)
+    _report("declarations", len(declarations))
+    _report("declaration scan", _time(scan), "s")
+    _report("stanza index", _time(match), "s")
+
+    memo = (
+        AppConfigurationValidator._get_stanza_memo()
+    )  # pylint: disable=protected-access
+    capacity = memo.capacity
+
+    with options(cache_directory_path=""):
+        memo.clear()
+        memo.capacity = 0
+        try:
+            expected = describe_configuration(app_root)
+            unmemoized = _time(lambda: AppConfiguration.load(app_root))
+        finally:
+            memo.capacity = capacity
+        _check(
+            describe_configuration(app_root) == expected, "resolve memo output differs"
+        )
+        memoized = _time(lambda: AppConfiguration.load(app_root))
+
+    _report("load without resolve memo", unmemoized, "s")
+    _report("load with resolve memo", memoized, "s")
+
+
+@benchmark
+def stanza_lookup(directory, scale):
+    """Looks up every setting of a 5k-setting stanza and of every stanza of an app by the scan of stanza rows that
+    stanzas did before they were indexed and by stanza name index"""
+    from slim.app import AppConfiguration  # pylint: disable=import-outside-toplevel
+
+    app_root = path.join(directory, "stanza-lookup")
+    write_app(app_root, int(2000 * scale))
+    setting_count = int(5000 * scale)
+    with io.open(
+        path.join(app_root, "default", "props.conf"), "a", encoding="utf-8"
+    ) as ostream:
+        ostream.write("[wide]\n")
+        for i in range(setting_count):
+            ostream.write("EXTRACT-field%d = (?<field%d>\\d+)\n" % (i, i))
+
+    with options(cache_directory_path=""):
+        configuration = AppConfiguration.load(app_root)
+
+    stanzas = [
+        (stanza, [s.name for s in stanza.settings()] + ["undefined_setting"])
+        for configuration_file in configuration.files()
+        for stanza in configuration_file.stanzas()
+    ]
+    wide = [(stanza, names) for stanza, names in stanzas if stanza.name == "wide"]
+    narrow = [(stanza, names) for stanza, names in stanzas if stanza.name != "wide"]
+
+    def look_up(get, lookups):
+        def run():
+            values = []
+            for stanza, names in lookups:
+                stanza._index = None  # pylint: disable=protected-access
+                for name in names:
+                    setting = get(stanza, name)
+                    values.append(None if setting is None else setting.value)
+            return values
+
+        return run
+
+    def build():
+        for stanza, names in stanzas:
+            stanza._index = None  # pylint: disable=protected-access
+            stanza.get(names[-1])
+
+    _check(len(wide[0][1]) == setting_count + 1, "wide stanza is incomplete")
+    _report("stanzas", len(stanzas))
+    _report("lookups", sum(len(names) for _, names in stanzas))
+
+    for name, lookups in (("wide stanza", wide), ("other stanzas", narrow)):
+        scan, index = look_up(_scan, lookups), look_up(_index, lookups)
+        _check(index() == scan(), name + " name index output differs")
+        _report(name + " row scan", _time(scan), "s")
+        _report(name + " name index", _time(index), "s")
+
+    _report("retained by name indexes", _measure(build), "MB")
+
+
+@benchmark
+def spec_parse(directory, scale):
+    """Loads every bundled conf-spec file with and without documentation, by parsing text and from a conf-spec
+    bundle"""
+    # pylint: disable=import-outside-toplevel
+    from slim.app import AppConfigurationSpec
+    from slim.app._configuration_spec_bundle import AppConfigurationSpecBundle
+    from slim.utils import slim_configuration
+
+    configuration_spec_path = path.join(directory, "conf-specs")
+    shutil.copytree(slim_configuration.configuration_spec_path, configuration_spec_path)
+    AppConfigurationSpecBundle.compile(configuration_spec_path)
+    bundle = AppConfigurationSpecBundle.get(configuration_spec_path)
+    filenames = [
+        (path.basename(filename)[: -len(".conf.spec")], filename)
+        for filename in sorted(glob(path.join(configuration_spec_path, "*.conf.spec")))
+    ]
+    app_root = path.join(directory, "app")
+    repeat = max(1, int(scale))
+
+    def parse(lean):
+        def load():
+            specs = []
+            for _ in range(repeat):
+                for name, filename in filenames:
+                    configuration_spec = AppConfigurationSpec(name, app_root)
+                    configuration_spec.load(filename, lean=lean)
+                    specs.append(configuration_spec)
+            return specs
+
+        return load
+
+    def load_bundle(lean):
+        def load():
+            specs = []
+            with options(lean_parsing=lean):
+                for _ in range(repeat):
+                    for name, filename in filenames:
+                        configuration_spec = AppConfigurationSpec(name, app_root)
+                        _check(
+                            bundle.load(configuration_spec, filename),
+                            "bundle is out of date",
+                        )
+                        specs.append(configuration_spec)
+            return specs
+
+        return load
+
+    def describe(load):
+        return [describe_spec(configuration_spec) for configuration_spec in load()]
+
+    expected, expected_lean = describe(parse(False)), describe(parse(True))
+    _check(describe(load_bundle(False)) == expected, "bundle output differs")
+    _check(describe(load_bundle(True)) == expected_lean, "lean bundle output differs")
+    _check(
+        [
+            [line for line in lines if not line.lstrip().startswith("documentation ")]
+            for lines in expected
+        ]
+        == expected_lean,
+        "lean parse output differs",
+    )
+
+    _report("spec files", len(filenames) * repeat)
+    for name, load in (
+        ("parse", parse(False)),
+        ("lean parse", parse(True)),
+        ("load from bundle", load_bundle(False)),
+        ("lean load from bundle", load_bundle(True)),
+    ):
+        _report(name, _time(load), "s")
+        _report(name + " retained", _measure(load), "MB")
+
+
+@benchmark
+def json_schema(directory, scale):
+    """Converts 5k app manifests by interpreting the manifest schema and by running its compiled conversion, which
+    checks and converts each manifest in a single walk"""
+    # pylint: disable=import-outside-toplevel
+    from slim.app import AppManifest
+    from slim.app._internal import ObjectView
+
+    schema = AppManifest.schema
+    text = json.dumps(get_manifest())
+    manifest = ObjectView._decode(text)  # pylint: disable=protected-access
+    document_count = int(5000 * scale)
+
+    _check(
+        describe_conversion(schema, manifest)
+        == describe_conversion(schema, manifest, interpreted=True),
+        "compiled schema output differs",
+    )
+
+    def interpret(value):
+        onerror = schema._onerror  # pylint: disable=protected-access
+        schema.definition.validate(schema.name, value, onerror)
+        return schema.definition.convert_from(schema.name, value, onerror)
+
+    _report("documents", document_count)
+    for name, convert in (
+        ("interpreted schema", interpret),
+        ("compiled schema", schema.convert_from),
+    ):
+        # conversion updates documents in place; hence each pass converts fresh copies
+        documents = [ObjectView._decode(text) for _ in range(document_count)]
+        _report(name, _time(lambda: [convert(d) for d in documents], repeat=1), "s")
+
+
+# endregion
+
+
+def main(argv):
+    parser = ArgumentParser(prog="python -m test.benchmark", description=__doc__)
+    parser.add_argument(
+        "names", nargs="*", help="benchmarks to run: " + ", ".join(benchmarks)
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiply the size of each input"
+    )
+    args = parser.parse_args(argv)
+
+    for name in args.names:
+        if name not in benchmarks:
+            parser.error("unknown benchmark: " + name)
+
+    # benchmarks log the same warnings over and over
+    SlimLogger.set_level(logging.ERROR)
+
+    directory = mkdtemp()
+
+    try:
+        for name in args.names or benchmarks:
+            print(name + ":")
+            benchmarks[name](path.join(directory, name), args.scale)
+    finally:
+        shutil.rmtree(directory)
+
+
+# region Protected
+
+
+def _check(condition, message):
+    if not condition:
+        raise AssertionError(message)
+
+
+def _index(stanza, name):
+    return stanza.get(name)
+
+
+def _measure(function):
+    """Returns the memory retained by the value `function` returns in MB or :const:`None` on Python 2.7"""
+    if tracemalloc is None:
+        return None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        value = function()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del value
+    return size / 1e6
+
+
+def _report(name, value, unit=""):
+    if value is None:
+        text = "n/a"
+    elif isinstance(value, float):
+        text = "%.3f" % value
+    else:
+        text = str(value)
+    print(
+        "  " + name + ": " + text + (" " + unit if unit and value is not None else "")
+    )
+
+
+def _scan(stanza, name):
+    """Looks up a setting as stanzas did before they were indexed: by a scan of their setting rows"""
+    # pylint: disable=import-outside-toplevel,protected-access
+    from slim.app._configuration import AppConfigurationSetting
+
+    if len(stanza._rows) > 0:
+        store = stanza._store
+        names = store.setting_names
+        for row in stanza._rows:
+            if names[row] == name:
+                return AppConfigurationSetting(
+                    AppConfigurationSetting.Section(store, row)
+                )
+    return None
+
+
+def _time(function, repeat=3):
+    """Returns the least time in seconds that `function` takes over `repeat` calls"""
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.time()
+        function()
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+# endregion
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
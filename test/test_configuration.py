@@ -0,0 +1,122 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from os import path
+from tempfile import mkdtemp
+import io
+import shutil
+import unittest
+
+from slim.app import AppConfiguration
+
+from ._support import describe_configuration, options, write_app
+
+
+class TestAppConfiguration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = mkdtemp()
+        cls.app_root = path.join(cls.directory, "app")
+        write_app(cls.app_root, 500)
+        with options(cache_directory_path=""):
+            cls.expected = describe_configuration(cls.app_root)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def test_description_covers_store(self):
+        # guards against a description that's vacuously equal
+        expected = self.expected
+        self.assertGreater(len(expected), 3000)
+        self.assertTrue(any(line.startswith("message ") for line in expected))
+
+    def test_parse_cache_reproduces_parse(self):
+        with options(cache_directory_path=path.join(self.directory, "cache")):
+            cold = describe_configuration(self.app_root)
+            warm = describe_configuration(self.app_root)
+        self.assertEqual(cold, self.expected)
+        self.assertEqual(warm, self.expected)
+
+    def test_lean_parse_reproduces_full_parse(self):
+        with options(cache_directory_path="", lean_parsing=True):
+            self.assertEqual(describe_configuration(self.app_root), self.expected)
+        with options(cache_directory_path=path.join(self.directory, "cache")):
+            with options(lean_parsing=True):
+                cold = describe_configuration(self.app_root)
+                warm = describe_configuration(self.app_root)
+        self.assertEqual(cold, self.expected)
+        self.assertEqual(warm, self.expected)
+
+    def test_lazy_load_reproduces_full_load(self):
+        with options(cache_directory_path=""):
+            self.assertEqual(
+                describe_configuration(self.app_root, lazy=True), self.expected
+            )
+
+    def test_lookups_agree_with_settings(self):
+        with options(cache_directory_path=""):
+            configuration = AppConfiguration.load(self.app_root)
+        for configuration_file in configuration.files():
+            for stanza in configuration_file.stanzas():
+                for setting in stanza.settings():
+                    self.assertEqual(stanza.get(setting.name).value, setting.value)
+                self.assertIsNone(stanza.get("undefined_setting"))
+            for section in configuration_file.sections():
+                for stanza in section.stanzas():
+                    for setting in stanza.settings():
+                        found = stanza.get(setting.name)
+                        self.assertEqual(
+                            (found.value, found.position),
+                            (setting.value, setting.position),
+                        )
+                    self.assertIsNone(stanza.get("undefined_setting"))
+
+        # the local stanza is added after the default stanza and so its setting is the last in
+        stanza = configuration.get("inputs", "monitor:///var/log/app0/*.log")
+        self.assertEqual(stanza.get_value("disabled"), "true")
+        self.assertEqual(stanza.get_value("index"), "main")
+
+    def test_parallel_load_reproduces_serial_load(self):
+        # more configuration files than workers, several of which log messages, so that replay order matters
+        app_root = path.join(self.directory, "parallel")
+        shutil.copytree(self.app_root, app_root)
+        for name, text in (
+            ("server", "[general]\nundefined_setting = value\n"),
+            ("transforms", "[synthetic]\nREGEX = (\nundefined_setting = value\n"),
+        ):
+            with io.open(
+                path.join(app_root, "default", name + ".conf"), "w", encoding="utf-8"
+            ) as ostream:
+                ostream.write(text)
+
+        load_parallel = AppConfiguration._load_parallel
+        calls = []
+
+        def counting_load_parallel(self, names, worker_count):
+            calls.append((list(names), worker_count))
+            return load_parallel(self, names, worker_count)
+
+        AppConfiguration._load_parallel = counting_load_parallel
+        try:
+            with options(cache_directory_path="", parse_worker_count=1):
+                expected = describe_configuration(app_root)
+            self.assertEqual(calls, [])
+            with options(cache_directory_path="", parse_worker_count=2):
+                actual = describe_configuration(app_root)
+        finally:
+            AppConfiguration._load_parallel = load_parallel
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][1], 2)
+        self.assertGreater(len(calls[0][0]), 2)
+        messages = [line for line in expected if line.startswith("message ")]
+        for name in "inputs.conf", "server.conf", "transforms.conf":
+            self.assertTrue(any(name in line for line in messages), name)
+        self.assertEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,215 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from glob import glob
+from os import path
+from tempfile import mkdtemp
+import io
+import os
+import re
+import shutil
+import unittest
+
+from slim.app import (
+    AppConfigurationSpec,
+    AppConfigurationSpecRegistry,
+    AppConfigurationValidator,
+)
+from slim.app._configuration_spec_bundle import AppConfigurationSpecBundle
+from slim.utils import slim_configuration
+
+from ._support import (
+    describe_configuration,
+    describe_spec,
+    get_stanza_names,
+    options,
+    write_app,
+)
+
+
+class TestAppConfigurationSpec(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = mkdtemp()
+        cls.app_root = path.join(cls.directory, "app")
+        write_app(cls.app_root, 300)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def test_match_agrees_with_declaration_scan(self):
+        # the stanza index must produce the same ordered list as trying every declaration's pattern in turn
+        filenames = get_spec_filenames()
+        self.assertGreater(len(filenames), 50)
+
+        for name, filename in filenames:
+            configuration_spec = AppConfigurationSpec(name, self.app_root)
+            configuration_spec.load(filename)
+            declarations = list(configuration_spec.stanza_declarations())
+            stanzas = get_probes(d.name for d in declarations) + get_stanza_names(300)
+            for stanza in stanzas:
+                expected = [d for d in declarations if d.pattern.match(stanza)]
+                self.assertEqual(
+                    configuration_spec.match(stanza),
+                    expected if len(expected) > 0 else None,
+                    name + ".conf.spec: " + repr(stanza),
+                )
+
+    def test_lean_parse_agrees_with_full_parse(self):
+        for name, filename in get_spec_filenames():
+            full = AppConfigurationSpec(name, self.app_root)
+            full.load(filename, lean=False)
+            lean = AppConfigurationSpec(name, self.app_root)
+            lean.load(filename, lean=True)
+            expected = describe_spec(
+                full, get_probes(d.name for d in full.stanza_declarations())
+            )
+            actual = describe_spec(
+                lean, get_probes(d.name for d in lean.stanza_declarations())
+            )
+            # lean parsing drops documentation and nothing else
+            self.assertEqual(
+                actual,
+                [
+                    line
+                    for line in expected
+                    if not line.lstrip().startswith("documentation ")
+                ],
+                name + ".conf.spec",
+            )
+            self.assertTrue(
+                all(not line.lstrip().startswith("documentation ") for line in actual)
+            )
+
+    def test_bundle_agrees_with_parse(self):
+        configuration_spec_path = path.join(self.directory, "conf-specs")
+        shutil.copytree(
+            slim_configuration.configuration_spec_path, configuration_spec_path
+        )
+        AppConfigurationSpecBundle.compile(configuration_spec_path)
+        bundle = AppConfigurationSpecBundle.get(configuration_spec_path)
+        self.assertIsNotNone(bundle)
+
+        for name, filename in get_spec_filenames(configuration_spec_path):
+            for lean in False, True:
+                parsed = AppConfigurationSpec(name, self.app_root)
+                parsed.load(filename, lean=lean)
+                loaded = AppConfigurationSpec(name, self.app_root)
+                with options(lean_parsing=lean):
+                    self.assertTrue(bundle.load(loaded, filename))
+                probes = get_probes(d.name for d in parsed.stanza_declarations())
+                self.assertEqual(
+                    describe_spec(loaded, probes),
+                    describe_spec(parsed, probes),
+                    name + ".conf.spec" + (" (lean)" if lean else ""),
+                )
+
+    def test_overlay_leaves_base_spec_unchanged(self):
+        registry = AppConfigurationSpecRegistry.instance()
+        base_spec = registry.get("inputs", self.app_root)
+        base_digest = base_spec.digest
+        expected = describe_spec(base_spec, ["monitor:///var/log", "synthetic://x"])
+
+        # extends a stanza and a setting of the base spec and adds a stanza
+        app_root = path.join(self.directory, "overlay")
+        os.makedirs(path.join(app_root, "README"))
+        with io.open(
+            path.join(app_root, "README", "inputs.conf.spec"), "w", encoding="utf-8"
+        ) as ostream:
+            ostream.write(
+                "[monitor://<path>]\n"
+                "host_segment = <integer>\n"
+                "* Overlaid documentation\n"
+                "overlay_setting = <string>\n"
+                "\n"
+                "[synthetic://<name>]\n"
+                "interval = <integer>\n"
+            )
+
+        overlaid_spec = registry.get("inputs", app_root)
+        self.assertIsNot(overlaid_spec, base_spec)
+        self.assertNotEqual(overlaid_spec.digest, base_digest)
+        self.assertIsNotNone(overlaid_spec.match("synthetic://x"))
+        self.assertIsNone(base_spec.match("synthetic://x"))
+
+        self.assertIs(registry.get("inputs", self.app_root), base_spec)
+        self.assertEqual(base_spec.digest, base_digest)
+        base_spec._digest = None  # computed again from the spec files
+        self.assertEqual(base_spec.digest, base_digest)
+        self.assertEqual(
+            describe_spec(base_spec, ["monitor:///var/log", "synthetic://x"]),
+            expected,
+        )
+
+    def test_resolve_memo_agrees_with_resolution(self):
+        memo = AppConfigurationValidator._get_stanza_memo()
+        stanzas = get_stanza_names(300) + ["default", "undeclared", ""]
+
+        with AppConfigurationValidator("inputs", self.app_root) as validator:
+            capacity = memo.capacity
+            memo.clear()
+            memo.capacity = 0
+            try:
+                expected = [validator._resolve(stanza) for stanza in stanzas]
+            finally:
+                memo.capacity = capacity
+            misses = [validator._resolve(stanza) for stanza in stanzas]
+            hits = [validator._resolve(stanza) for stanza in stanzas]
+
+        self.assertEqual(misses, expected)
+        self.assertEqual(hits, expected)
+
+    def test_resolve_memo_leaves_validation_unchanged(self):
+        memo = AppConfigurationValidator._get_stanza_memo()
+        capacity = memo.capacity
+
+        with options(cache_directory_path=""):
+            memo.clear()
+            memo.capacity = 0
+            try:
+                expected = describe_configuration(self.app_root)
+            finally:
+                memo.capacity = capacity
+            self.assertEqual(describe_configuration(self.app_root), expected)
+
+
+def get_spec_filenames(configuration_spec_path=None):
+    """Returns the configuration names and filenames of the conf-spec files on a configuration spec path"""
+    if configuration_spec_path is None:
+        configuration_spec_path = slim_configuration.configuration_spec_path
+    return [
+        (path.basename(filename)[: -len(".conf.spec")], filename)
+        for filename in sorted(glob(path.join(configuration_spec_path, "*.conf.spec")))
+    ]
+
+
+def get_probes(declaration_names):
+    """Returns stanza names that exercise the literal and prefix tables of a stanza index built from declarations"""
+    probes = set(["", " ", "default", "[", "<", "://", "::", "x"])
+    for name in declaration_names:
+        probes.add(name)
+        for text in name.split("|"):
+            filled = re.sub(r"<[^>]*>", "x", text)
+            prefix = text.split("<", 1)[0]
+            probes.update(
+                (
+                    text,
+                    filled,
+                    filled + "x",
+                    filled[:-1],
+                    prefix,
+                    prefix[:-1],
+                    prefix + "\n",
+                    " " + filled,
+                    filled.upper(),
+                    filled.replace("[", "").replace("]", ""),
+                )
+            )
+    return sorted(probes)
+
+
+if __name__ == "__main__":
+    unittest.main()
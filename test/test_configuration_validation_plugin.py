@@ -0,0 +1,67 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from os import path
+from tempfile import mkdtemp
+import os
+import shutil
+import unittest
+
+from slim.app import AppConfigurationValidationPlugin
+from slim.utils.internal import hash_object
+
+from ._support import write_app
+
+
+class TestAppConfigurationValidationPlugin(unittest.TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.app_root = path.join(self.directory, "app")
+        write_app(self.app_root, 0)
+        self.filename = path.join(self.app_root, "README", "inputs.py")
+        os.makedirs(path.dirname(self.filename))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_plugin_is_reloaded_when_its_file_changes(self):
+        get = AppConfigurationValidationPlugin.get
+
+        self._write_plugin("First", mtime=1000000000)
+        first = get("inputs", self.app_root)
+        self.assertEqual(type(first).__name__, "First")
+        self.assertIs(get("inputs", self.app_root), first)
+        self.assertEqual(first.digest, hash_object(self.filename))
+
+        # same modification time, different size
+        self._write_plugin("SecondPlugin", mtime=1000000000)
+        second = get("inputs", self.app_root)
+        self.assertEqual(type(second).__name__, "SecondPlugin")
+        self.assertIs(get("inputs", self.app_root), second)
+        second_digest = second.digest
+        self.assertEqual(second_digest, hash_object(self.filename))
+
+        # same size, different modification time
+        self._write_plugin("ThirdPlugin", mtime=1000000001)
+        third = get("inputs", self.app_root)
+        self.assertEqual(type(third).__name__, "ThirdPlugin")
+        self.assertEqual(third.digest, hash_object(self.filename))
+        self.assertNotEqual(third.digest, second_digest)
+
+    def _write_plugin(self, class_name, mtime):
+        with open(self.filename, "w") as ostream:
+            ostream.write(
+                "from __future__ import absolute_import\n"
+                "from slim.app import AppConfigurationValidationPlugin\n"
+                "\n"
+                "\n"
+                "class " + class_name + "(AppConfigurationValidationPlugin):\n"
+                "    pass\n"
+            )
+        os.utime(self.filename, (mtime, mtime))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from os import path
+from tempfile import mkdtemp
+import io
+import shutil
+import tarfile
+import unittest
+
+from slim.describe import main, parser
+from slim.utils import SlimLogger, slim_configuration
+
+from ._support import options, record, write_app
+
+
+class TestDescribe(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = directory = mkdtemp()
+        app_root = path.join(directory, "synthetic")
+        write_app(app_root, 20)
+        cls.package = path.join(directory, "synthetic-1.0.0.tar.gz")
+        with tarfile.open(cls.package, "w:gz") as package:
+            package.add(app_root, "synthetic")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        SlimLogger.reset_counts()
+        slim_configuration.cache.reset()
+
+    def tearDown(self):
+        SlimLogger.reset_counts()
+        slim_configuration.cache.reset()
+
+    def test_app_only_description_is_unchanged_by_validation_cache(self):
+        with options(cache_directory_path=path.join(self.directory, "cache")):
+            slim_configuration.validation_cache = False
+            try:
+                expected = self._describe("uncached")
+            finally:
+                slim_configuration.validation_cache = True
+            cold = self._describe("cold")
+            self.assertFalse(self._get_source()._restored)
+            warm = self._describe("warm")
+            app_source = self._get_source()
+
+        # the warm run restores the app source from the validation cache and so does not extract the package
+        self.assertTrue(app_source._restored)
+        self.assertIsNone(app_source._directory)
+        self.assertTrue(expected[0])
+        self.assertEqual(cold, expected)
+        self.assertEqual(warm, expected)
+
+    def _describe(self, name):
+        """Describes the app package and returns the description it writes and the messages it logs"""
+        slim_configuration.cache.reset()
+        filename = path.join(self.directory, name + ".txt")
+        args = parser.parse_args([self.package, "--app-only", "-o", filename])
+        messages, _ = record(main, args)
+        with io.open(filename, encoding="utf-8") as istream:
+            return istream.read(), messages
+
+    def _get_source(self):
+        return slim_configuration.cache.get_sources[path.basename(self.package)]
+
+
+if __name__ == "__main__":
+    unittest.main()
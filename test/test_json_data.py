@@ -0,0 +1,164 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import Mapping, OrderedDict  # pylint: disable=no-name-in-module
+from copy import deepcopy
+from os import path
+from random import Random
+import io
+import json
+import unittest
+
+from slim.app import (
+    AppCommonInformationModelInfo,
+    AppDeploymentSpecification,
+    AppKhulnasoftReleaseInfo,
+    AppManifest,
+)
+from slim.app._internal import ObjectView
+from slim.utils import slim_configuration
+
+from ._support import describe_conversion, get_manifest
+
+
+class TestJsonSchema(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.documents = [
+            (AppManifest.schema, get_manifest()),
+            (
+                AppDeploymentSpecification.schema,
+                OrderedDict(
+                    (
+                        ("name", "first"),
+                        ("workload", ["forwarder", "indexer"]),
+                        ("inputGroups", ["first-group", "second-group"]),
+                    )
+                ),
+            ),
+            (
+                AppKhulnasoftReleaseInfo.schema,
+                _load(
+                    path.join(
+                        slim_configuration.system_config, "khulnasoft-releases.json"
+                    )
+                ),
+            ),
+            (
+                AppCommonInformationModelInfo.schema,
+                _load(
+                    path.join(
+                        slim_configuration.system_config,
+                        "common-information-models.json",
+                    )
+                ),
+            ),
+        ]
+
+    def test_valid_documents_convert_as_interpreted(self):
+        for schema, document in self.documents:
+            # documents are loaded as object views; see AppManifest.load
+            value = ObjectView._decode(json.dumps(document))
+            expected = describe_conversion(schema, value, interpreted=True)
+            self.assertFalse(any(line.startswith("error ") for line in expected))
+            self.assertEqual(describe_conversion(schema, value), expected, schema.name)
+
+    def test_mutated_documents_convert_as_interpreted(self):
+        random = Random(21)
+        error_count = 0
+        for schema, document in self.documents:
+            for i in range(150):
+                text = json.dumps(mutate(random, document, random.randint(1, 3)))
+                value = ObjectView._decode(text) if i % 2 else json.loads(text)
+                expected = describe_conversion(schema, value, interpreted=True)
+                error_count += any(line.startswith("error ") for line in expected)
+                self.assertEqual(
+                    describe_conversion(schema, value),
+                    expected,
+                    schema.name + ": " + text,
+                )
+        # guards against mutations that are rarely--or always--errors
+        self.assertGreater(error_count, 300)
+        self.assertLess(error_count, 580)
+
+
+def mutate(random, document, count):
+    """Returns a copy of a JSON document with `count` values replaced, removed, added, wrapped, or unwrapped"""
+    document = deepcopy(document)
+    for _ in range(count):
+        parent, key = _choose(random, document)
+        if parent is None:
+            continue
+        mutation = random.randint(0, 4)
+        if mutation == 0:
+            parent[key] = random.choice(_replacements)
+        elif mutation == 1:
+            if isinstance(parent, Mapping):
+                del parent[key]
+            else:
+                parent.pop(key)
+        elif mutation == 2:
+            if isinstance(parent, Mapping):
+                parent["extra" + str(random.randint(0, 9))] = random.choice(
+                    _replacements
+                )
+            else:
+                parent.append(random.choice(_replacements))
+        elif mutation == 3:
+            parent[key] = [parent[key]]
+        elif isinstance(parent[key], list) and len(parent[key]) > 0:
+            parent[key] = parent[key][0]
+        else:
+            parent[key] = deepcopy(random.choice(_replacements))
+    return document
+
+
+# region Protected
+
+_replacements = [
+    None,
+    True,
+    0,
+    1.5,
+    "",
+    "x",
+    "1.0.0",
+    ">=1.0",
+    "*",
+    [],
+    ["x"],
+    {},
+    {"name": "x"},
+]
+
+
+def _choose(random, value):
+    """Chooses a value at random from a JSON document and returns its container and its key in that container"""
+    candidates = []
+
+    def walk(container):
+        keys = (
+            list(container) if isinstance(container, Mapping) else range(len(container))
+        )
+        for key in keys:
+            candidates.append((container, key))
+            item = container[key]
+            if isinstance(item, (Mapping, list)):
+                walk(item)
+
+    walk(value)
+    return random.choice(candidates) if candidates else (None, None)
+
+
+def _load(filename):
+    with io.open(filename, encoding="utf-8") as istream:
+        return json.load(istream, object_pairs_hook=OrderedDict)
+
+
+# endregion
+
+
+if __name__ == "__main__":
+    unittest.main()
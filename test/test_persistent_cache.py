@@ -0,0 +1,63 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from os import path
+from tempfile import mkdtemp
+import os
+import shutil
+import unittest
+
+from slim.app._internal import PersistentCache
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_put_prunes_least_recently_used_entries(self):
+        cache = PersistentCache(path.join(self.directory, "cache"), max_entries=10)
+
+        for i in range(10):
+            cache.put("key" + str(i), i)
+            # explicit modification times make the order of use independent of file system timestamp resolution
+            os.utime(cache._get_filename("key" + str(i)), (1000 + i, 1000 + i))
+
+        self.assertEqual(len(cache._list_entries()), 10)
+        # key0 becomes the most recently used entry
+        self.assertEqual(cache.get("key0"), 0)
+
+        cache.put("key10", 10)
+
+        self.assertEqual(len(cache._list_entries()), 9)
+        self.assertEqual(cache.get("key0"), 0)
+        self.assertEqual(cache.get("key10"), 10)
+        for i in range(1, 3):
+            self.assertIsNone(cache.get("key" + str(i)))
+        for i in range(3, 10):
+            self.assertEqual(cache.get("key" + str(i)), i)
+
+    def test_put_ignores_files_that_are_not_entries(self):
+        directory = path.join(self.directory, "cache")
+        cache = PersistentCache(directory, max_entries=2)
+        cache.put("key0", 0)
+        with open(path.join(directory, "tmp_in_progress"), "w"):
+            pass
+        for i in range(1, 4):
+            cache.put("key" + str(i), i)
+        self.assertTrue(path.exists(path.join(directory, "tmp_in_progress")))
+        self.assertLessEqual(len(cache._list_entries()), 2)
+
+    def test_unbounded_cache_is_not_pruned(self):
+        cache = PersistentCache(path.join(self.directory, "cache"))
+        for i in range(32):
+            cache.put("key" + str(i), i)
+        self.assertEqual(len(cache._list_entries()), 32)
+
+
+if __name__ == "__main__":
+    unittest.main()
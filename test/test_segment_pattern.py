@@ -0,0 +1,179 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from glob import glob
+from os import path
+from random import Random
+import re
+import time
+import unittest
+
+from slim.app import AppConfigurationSpec, AppConfigurationStanzaDeclaration
+from slim.app._internal import SegmentPattern
+from slim.utils import slim_configuration
+
+
+class TestSegmentPattern(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        sources = set()
+        for filename in sorted(
+            glob(path.join(slim_configuration.configuration_spec_path, "*.conf.spec"))
+        ):
+            configuration_spec = AppConfigurationSpec(
+                path.basename(filename)[: -len(".conf.spec")], path.dirname(filename)
+            )
+            configuration_spec.load(filename)
+            for stanza in configuration_spec.stanza_declarations():
+                sources.add(stanza.pattern_source)
+                sources.update(s.pattern_source for s in stanza.setting_declarations())
+        cls.spec_sources = sorted(
+            source for source in sources if SegmentPattern.compile(source) is not None
+        )
+
+    def test_spec_patterns_agree_with_re(self):
+        self.assertGreater(len(self.spec_sources), 1000)
+        random = Random(18)
+        for source in self.spec_sources:
+            pattern = SegmentPattern.compile(source)
+            for name in get_names(random, pattern, 8):
+                self.assertSameMatch(pattern, name)
+
+    def test_adversarial_patterns_agree_with_re(self):
+        random = Random(1018)
+        count = matches = 0
+        for _ in range(400):
+            spec_name = "".join(
+                random.choice(_spec_name_tokens) for _ in range(random.randint(1, 7))
+            )
+            source = AppConfigurationStanzaDeclaration(spec_name).pattern_source
+            pattern = SegmentPattern.compile(source)
+            if pattern is None:
+                continue  # an alternation or an optional replacement, which re matches
+            count += 1
+            for name in get_names(random, pattern, 40):
+                matches += self.assertSameMatch(pattern, name)
+        self.assertGreater(count, 300)
+        self.assertGreater(matches, 1000)  # guards against names that rarely match
+
+    def test_near_miss_names_agree_with_re(self):
+        for source, near_misses in _near_misses:
+            pattern = SegmentPattern.compile(source)
+            self.assertIsNotNone(pattern, source)
+            for n in range(0, 65, 7):
+                for name in near_misses(n):
+                    self.assertSameMatch(pattern, name)
+
+    def test_near_miss_names_take_linear_time(self):
+        # re takes seconds to reject each of these names; a segment pattern takes microseconds
+        for source, near_misses in _near_misses:
+            pattern = SegmentPattern.compile(source)
+            names = near_misses(20000)
+            start = time.time()
+            for _ in range(20):
+                for name in names:
+                    pattern.match(name)
+            self.assertLess(time.time() - start, 1.0, source)
+
+    def assertSameMatch(self, pattern, name):  # pylint: disable=invalid-name
+        """Asserts that a segment pattern matches a name as re does and returns :const:`True`, if it matches"""
+        expected = re.compile(pattern.pattern, re.M | re.U).match(name)
+        actual = pattern.match(name)
+        message = repr(pattern.pattern) + " " + repr(name)
+        if expected is None:
+            self.assertIsNone(actual, message)
+            return False
+        self.assertIsNotNone(actual, message)
+        self.assertEqual(actual.group(), expected.group(), message)
+        self.assertEqual(actual.groups(), expected.groups(), message)
+        self.assertEqual(actual.groupdict(), expected.groupdict(), message)
+        self.assertEqual(actual.lastindex, expected.lastindex, message)
+        for group in range(pattern.groups + 1):
+            self.assertEqual(actual.span(group), expected.span(group), message)
+        for group in pattern.groupindex:
+            self.assertEqual(actual.span(group), expected.span(group), message)
+        return True
+
+
+def get_names(random, pattern, count):
+    """Returns names built from the literals of a segment pattern, separators, line breaks, and NULs
+
+    Half the names are built to match, if nothing else gets in the way. The rest are random sequences of literals and
+    separators. All are then mutated at random: repeated, truncated, extended, or given a line break or a NUL.
+
+    """
+    literals = [literal for literal in pattern._literals if literal]
+    tokens = literals + _name_tokens
+    names = ["", "".join(pattern._literals)]
+
+    for i in range(count):
+        if i % 2 == 0:
+            parts = []
+            for literal in pattern._literals:
+                parts.append(literal)
+                parts.extend(random.choice(tokens) for _ in range(random.randint(0, 3)))
+            name = "".join(parts[: -1 if random.random() < 0.5 else len(parts)])
+        else:
+            name = "".join(random.choice(tokens) for _ in range(random.randint(0, 8)))
+        mutation = random.randint(0, 5)
+        if mutation == 0 and name:
+            index = random.randint(0, len(name))
+            name = name[:index] + random.choice("\n\0") + name[index:]
+        elif mutation == 1:
+            name = name * random.randint(2, 3)
+        elif mutation == 2 and name:
+            name = name[: random.randint(0, len(name) - 1)]
+        elif mutation == 3:
+            name += random.choice(tokens)
+        names.append(name)
+
+    return names
+
+
+# region Protected
+
+_name_tokens = ["", "a", "b", "x", ":", "::", ".", "/", "://", "\n", "\0", " "]
+
+_spec_name_tokens = [
+    "a",
+    "ab",
+    "aa",
+    "b",
+    ":",
+    "::",
+    ".",
+    "..",
+    "/",
+    "_",
+    "-",
+    "\0",
+    "<x>",
+    "<y>",
+    "<>",
+    "<name>",
+]
+
+_near_misses = [
+    (
+        AppConfigurationStanzaDeclaration(
+            "credential:<realm>:<username>:"
+        ).pattern_source,
+        lambda n: ["credential:" + ":" * n + "x", "credential:" + "::" * n],
+    ),
+    (
+        r"a(?P<x>.*?)\.(?P<y>.*?)\.(?P<z>.*?)b\Z",
+        lambda n: ["a" + "." * n, "a" + ".b" * n + ".", "a." + "ab" * n],
+    ),
+    (
+        r"ab(?P<x>.*?)ab(?P<y>.*?)ab(?P<z>.*?)ab\Z",
+        lambda n: ["ab" * n + "a", "ab" + "a" * n + "b" * n, "aba" * n],
+    ),
+]
+
+# endregion
+
+
+if __name__ == "__main__":
+    unittest.main()
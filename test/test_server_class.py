@@ -0,0 +1,258 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import OrderedDict
+from os import path
+from tempfile import mkdtemp
+import gc
+import io
+import json
+import logging
+import os
+import shutil
+import tarfile
+import unittest
+import weakref
+
+from slim.app import AppServerClassCollection
+from slim.app._internal import InstallationGraphSnapshot
+from slim.utils import SlimLogger
+
+from ._support import options, write_app
+
+
+class TestAppServerClassCollection(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = directory = mkdtemp()
+        app_root = path.join(directory, "synthetic")
+        write_app(app_root, 0)
+        cls.repository_path = path.join(directory, "repository")
+        os.makedirs(cls.repository_path)
+        with tarfile.open(
+            path.join(cls.repository_path, "synthetic-1.0.0.tar.gz"), "w:gz"
+        ) as package:
+            package.add(app_root, "synthetic")
+        cls.app = app = OrderedDict(
+            (
+                ("dependencies", []),
+                ("optional_dependencies", []),
+                ("dependents", []),
+                ("is_external", False),
+                ("is_root", True),
+                ("inputGroups", {}),
+                ("source", "synthetic-1.0.0.tar.gz"),
+                ("version", "1.0.0"),
+            )
+        )
+        cls.filename = path.join(directory, "installation-graph.json")
+        cls._save(cls.filename, get_graph(app))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        SlimLogger.reset_counts()
+        self.level = SlimLogger.get_level()
+        SlimLogger.set_level(logging.CRITICAL + 1)
+
+    def tearDown(self):
+        SlimLogger.set_level(self.level)
+        SlimLogger.reset_counts()
+
+    def test_interns_are_scoped_to_one_load(self):
+        with options(cache_directory_path=""):
+            collection = self._load()
+            first, second = collection["first"], collection["second"]
+            version = first.apps["synthetic"].version
+            self.assertIs(first.interns, collection.interns)
+            self.assertIs(second.interns, collection.interns)
+            self.assertIs(second.apps["synthetic"].version, version)
+
+            other = self._load()
+            self.assertIsNot(other.interns, collection.interns)
+            self.assertIsNot(other["first"].apps["synthetic"].version, version)
+            self.assertEqual(other["first"].apps["synthetic"].version, version)
+
+        # nothing but the collection holds its interns; hence they're released with it
+        reference = weakref.ref(version)
+        del collection, first, second, version
+        gc.collect()
+        self.assertIsNone(reference())
+        self.assertEqual(SlimLogger.error_count(), 0)
+
+    def test_materialized_graph_round_trips(self):
+        filename = path.join(self.directory, "round-trip.json")
+        with options(cache_directory_path=""):
+            collection = self._load()
+            for name in collection:
+                self.assertIn("synthetic", collection[name].apps)
+                self.assertTrue(collection[name].is_materialized)
+            collection.save(filename)
+            other = AppServerClassCollection.load(filename, self.repository_path)
+            for name in other:
+                self.assertIn("synthetic", other[name].apps)
+
+        def decode(graph):
+            return json.loads(json.dumps(graph), object_pairs_hook=OrderedDict)
+
+        expected = decode(get_graph(self.app))
+        for graph in collection, other:
+            self.assertEqual(
+                decode(OrderedDict((name, graph[name].to_dict()) for name in graph)),
+                expected,
+            )
+        self.assertEqual(SlimLogger.error_count(), 0)
+
+    def test_unchanged_server_classes_save_verbatim(self):
+        app = OrderedDict(self.app)
+        app["inputGroups"] = OrderedDict((("grüne Gruppe ✓", []),))
+        texts = OrderedDict(
+            (
+                ("first", json.dumps(get_graph(self.app)["first"])),
+                ("second", json.dumps(get_graph(app)["second"], indent=4)),
+                ("third", json.dumps(get_graph(app)["second"], ensure_ascii=False)),
+            )
+        )
+        filename = path.join(self.directory, "verbatim.json")
+        with io.open(filename, "wb") as ostream:
+            ostream.write(
+                (
+                    "{\n"
+                    + ",\n".join('"' + name + '": ' + texts[name] for name in texts)
+                    + "\n}"
+                ).encode("utf-8")
+            )
+
+        with options(cache_directory_path=""):
+            collection = AppServerClassCollection.load(filename, self.repository_path)
+            collection["first"].remove_app("synthetic")
+            collection.save(filename)
+            other = AppServerClassCollection.load(filename, self.repository_path)
+
+        with io.open(filename, "rb") as istream:
+            saved = istream.read()
+        for name in "second", "third":
+            self.assertFalse(collection[name].is_materialized)
+            self.assertIn(texts[name].encode("utf-8"), saved)
+            self.assertEqual(other[name].to_json(), texts[name])
+        self.assertNotIn("synthetic", other["first"].apps)
+        self.assertEqual(SlimLogger.error_count(), 0)
+
+    def test_snapshot_packages_match_json(self):
+        app = OrderedDict(self.app)
+        app["source"] = path.join("packages", "synthetic-1.0.0.tar.gz")
+        graph = get_graph(app)
+        filename = path.join(self.directory, "packages.json")
+        snapshot_filename = path.join(self.directory, "packages.snapshot")
+        self._save(filename, graph)
+        InstallationGraphSnapshot.save(snapshot_filename, graph.items())
+
+        collection = AppServerClassCollection.load(filename, self.repository_path)
+        snapshot = AppServerClassCollection.load(
+            snapshot_filename, self.repository_path
+        )
+        for name in graph:
+            self.assertFalse(snapshot[name].is_materialized)
+            self.assertEqual(
+                snapshot[name].get_packages(),
+                OrderedDict((("synthetic", "synthetic-1.0.0.tar.gz"),)),
+            )
+            self.assertEqual(
+                snapshot[name].get_packages(), collection[name].get_packages()
+            )
+        self.assertEqual(SlimLogger.error_count(), 0)
+
+    def test_snapshot_round_trips_json(self):
+        dependency = OrderedDict(self.app)
+        dependency.update(
+            (
+                ("dependents", ["synthetic"]),
+                ("is_root", False),
+                ("inputGroups", OrderedDict((("grüne Gruppe ✓", ["synthetic"]),))),
+                ("source", "dependency-2.0.0.tar.gz"),
+                ("version", "2.0.0"),
+            )
+        )
+        app = OrderedDict(self.app)
+        app["dependencies"] = ["dependency"]
+        app["optional_dependencies"] = ["dependency"]
+        # structured records and JSON text records: an extra key and keys in another order
+        text = json.dumps(
+            OrderedDict(
+                (
+                    (
+                        "first",
+                        OrderedDict(
+                            (
+                                ("workload", ["indexer", "forwarder"]),
+                                (
+                                    "apps",
+                                    OrderedDict(
+                                        (("synthetic", app), ("dependency", dependency))
+                                    ),
+                                ),
+                            )
+                        ),
+                    ),
+                    ("second", get_graph(self.app)["second"]),
+                    ("empty", OrderedDict((("workload", []), ("apps", {})))),
+                    ("extra", OrderedDict((("workload", []), ("apps", {}), ("x", 1)))),
+                    (
+                        "reordered",
+                        OrderedDict(
+                            (
+                                ("apps", {"synthetic": self.app}),
+                                ("workload", ["búsqueda"]),
+                            )
+                        ),
+                    ),
+                )
+            )
+        )
+        graph = json.loads(text, object_pairs_hook=OrderedDict)
+        filename = path.join(self.directory, "round-trip.snapshot")
+        InstallationGraphSnapshot.save(filename, graph.items())
+
+        snapshot = InstallationGraphSnapshot.open(filename)
+        self.assertEqual([record.name for record in snapshot], list(graph))
+        for record in snapshot:
+            value = graph[record.name]
+            self.assertEqual(record.get_value(), value)
+            self.assertEqual(
+                json.loads(record.to_json(), object_pairs_hook=OrderedDict), value
+            )
+        self.assertIsNotNone(list(snapshot)[0].get_packages())
+        self.assertIsNone(list(snapshot)[3].get_packages())
+
+        # and back to JSON by way of a collection that's never materialized
+        json_filename = path.join(self.directory, "round-trip.json")
+        with options(cache_directory_path=""):
+            collection = AppServerClassCollection.load(filename, self.repository_path)
+            collection.save(json_filename)
+        with io.open(json_filename, encoding="utf-8") as istream:
+            self.assertEqual(json.load(istream, object_pairs_hook=OrderedDict), graph)
+        self.assertEqual(SlimLogger.error_count(), 0)
+
+    def _load(self):
+        return AppServerClassCollection.load(self.filename, self.repository_path)
+
+    @staticmethod
+    def _save(filename, graph):
+        with io.open(filename, "wb") as ostream:
+            ostream.write(json.dumps(graph).encode("utf-8"))
+
+
+def get_graph(app):
+    """Returns an installation graph with two server classes on which `app` is installed"""
+    return OrderedDict(
+        (name, OrderedDict((("workload", ["indexer"]), ("apps", {"synthetic": app}))))
+        for name in ("first", "second")
+    )
+
+
+if __name__ == "__main__":
+    unittest.main()
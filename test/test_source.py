@@ -0,0 +1,132 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from os import path
+from tempfile import mkdtemp
+import io
+import os
+import shutil
+import tarfile
+import unittest
+
+from semantic_version import Version
+
+from slim.app import AppSource
+from slim.app._source import _join_names, _split_names
+from slim.utils import SlimLogger, slim_configuration
+from slim.utils._configuration import SlimConfigurationManager
+
+from ._support import options, record, write_app
+
+
+class TestAppSource(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = directory = mkdtemp()
+        app_root = path.join(directory, "synthetic")
+        write_app(app_root, 100)
+        cls.package = path.join(directory, "packages", "synthetic-1.0.0.tar.gz")
+        cls.copy = path.join(directory, "copies", "synthetic-copy-1.0.0.tar.gz")
+        os.makedirs(path.dirname(cls.package))
+        os.makedirs(path.dirname(cls.copy))
+        with tarfile.open(cls.package, "w:gz") as package:
+            package.add(app_root, "synthetic")
+        shutil.copy(cls.package, cls.copy)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        SlimLogger.reset_counts()
+        slim_configuration.cache.reset()
+
+    def tearDown(self):
+        SlimLogger.reset_counts()
+        slim_configuration.cache.reset()
+
+    def test_restore_names_current_package(self):
+        with options(cache_directory_path=path.join(self.directory, "cache")):
+            slim_configuration.validation_cache = False
+            try:
+                expected, _ = record(AppSource, self.copy)
+            finally:
+                slim_configuration.validation_cache = True
+            slim_configuration.cache.reset()
+            record(AppSource, self.package)
+            slim_configuration.cache.reset()
+            actual, app_source = record(AppSource, self.copy)
+
+        self.assertTrue(app_source._restored)
+        self.assertTrue(
+            any("synthetic-copy-1.0.0.source" in text for _, text in expected)
+        )
+        self.assertEqual(actual, expected)
+
+    def test_restored_configuration_matches_validated(self):
+        def get_version(package):
+            app_source = AppSource(package)
+            value = app_source.configuration.get_value("app", "launcher", "version")
+            return app_source, value
+
+        with options(cache_directory_path=path.join(self.directory, "cache")):
+            slim_configuration.validation_cache = False
+            try:
+                _, (_, expected) = record(get_version, self.package)
+            finally:
+                slim_configuration.validation_cache = True
+            record(AppSource, self.package)
+            slim_configuration.cache.reset()
+            _, (app_source, actual) = record(get_version, self.package)
+
+        self.assertTrue(app_source._restored)
+        self.assertIsInstance(expected, Version)
+        self.assertIsInstance(actual, Version)
+        self.assertEqual(actual, expected)
+
+    def test_validation_key_covers_system_data(self):
+        slim_config = SlimConfigurationManager._slim_config
+        system_config = path.join(self.directory, "config")
+        shutil.copytree(slim_config, system_config)
+
+        with options(cache_directory_path=path.join(self.directory, "cache")):
+            _, app_source = record(AppSource, self.package)
+            key = app_source._get_validation_key()
+            SlimConfigurationManager._slim_config = system_config
+            try:
+                self.assertNotEqual(app_source._get_validation_key(), key)
+                self.assertEqual(
+                    app_source._get_validation_key(),
+                    app_source._get_validation_key(),
+                )
+                with io.open(
+                    path.join(system_config, "khulnasoft-releases.json"), "ab"
+                ) as ostream:
+                    ostream.write(b"\n")
+                self.assertNotEqual(app_source._get_validation_key(), key)
+            finally:
+                SlimConfigurationManager._slim_config = slim_config
+
+    def test_split_names_round_trip(self):
+        names = "/packages/a.tgz", "/cache/a.source", "/cache/a.source/a"
+        for text in (
+            "",
+            "/packages/a.tgz",
+            "/packages/a.tgz: /cache/a.source/a/default/app.conf, line 1: /cache/a.sourcex",
+            "/cache/a.source/cache/a.source/a",
+        ):
+            segments = _split_names(text, names)
+            self.assertEqual(_join_names(segments, names), text)
+            self.assertEqual(
+                _join_names(segments, ("P", "C", "R")),
+                text.replace(names[2], "R")
+                .replace(names[1], "C")
+                .replace(names[0], "P"),
+            )
+        self.assertEqual(_split_names("a/x/a", ("a", None, "")), (0, "/x/", 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
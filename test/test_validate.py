@@ -0,0 +1,163 @@
+# coding=utf-8
+# Copyright © KhulnaSoft, Ltd. All Rights Reserved.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from os import path
+from tempfile import mkdtemp
+import io
+import json
+import logging
+import os
+import shutil
+import unittest
+
+from slim.validate import (
+    _AppSourceWatcher,
+    _get_releases,
+    _save_batch,
+    main,
+    parser,
+    validate,
+    validate_many,
+)
+from slim.utils import SlimLogger, slim_configuration
+
+from ._support import get_messages, options, record, write_app
+
+
+class TestValidate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = mkdtemp()
+        cls.app_root = path.join(cls.directory, "app")
+        write_app(cls.app_root, 100)
+        # a problem in a configuration file that validation of the app source does not load
+        with io.open(
+            path.join(cls.app_root, "default", "transforms.conf"), "w", encoding="utf-8"
+        ) as ostream:
+            ostream.write("[synthetic]\nREGEX = (\nundefined_setting = value\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        SlimLogger.reset_counts()
+
+    def tearDown(self):
+        SlimLogger.reset_counts()
+
+    def test_output_requires_batch(self):
+        for argv in (
+            [self.app_root, "-o", path.join(self.directory, "payloads.json")],
+            [
+                "--watch",
+                self.app_root,
+                "--output",
+                path.join(self.directory, "payloads.json"),
+            ],
+        ):
+            args = parser.parse_args(argv)
+
+            def run():
+                with self.assertRaises(SystemExit):
+                    main(args)
+
+            try:
+                messages, _ = record(run)
+            finally:
+                args.output.close()
+            self.assertEqual(messages[-1][1], "--output can only be used with --batch")
+
+    def test_first_watch_update_reports_in_validate_order(self):
+        with options(cache_directory_path=""):
+            messages, _ = record(validate, self.app_root)
+            expected = self._get_problems(messages)
+            watcher = _AppSourceWatcher(
+                self.app_root, slim_configuration.repository_path, "note", False
+            )
+            messages, update = record(watcher.update)
+            actual = self._get_problems(messages)
+        self.assertTrue(any("transforms.conf" in text for level, text in expected))
+        self.assertEqual(actual, expected)
+        self.assertEqual(self._get_problems(get_messages(update)), expected)
+
+    def test_release_without_specs_is_reported(self):
+        release_spec_path = path.join(self.directory, "release-specs")
+        os.makedirs(path.join(release_spec_path, "7.0.0"))
+        with options(release_spec_path=release_spec_path):
+            messages, releases = record(_get_releases, "6.5.0,7.0.0,6.5.0")
+        problems = self._get_problems(messages)
+        self.assertEqual(releases, ["6.5.0", "7.0.0"])
+        self.assertEqual(len(problems), 1)
+        self.assertEqual(problems[0][0], logging.WARN)
+        self.assertIn("Khulnasoft 6.5.0", problems[0][1])
+
+    def test_batch_reports_in_source_order(self):
+        outcomes = []
+        for worker_count in 1, 2:
+            # validation adds a manifest to each app source directory; hence each batch gets new app sources
+            root = path.join(self.directory, "batch-" + str(worker_count))
+            sources = [
+                path.join(root, "first", "synthetic"),
+                path.join(root, "missing"),
+                path.join(root, "broken-1.0.0.tar.gz"),
+                path.join(root, "second", "synthetic"),
+            ]
+            shutil.copytree(self.app_root, sources[0])
+            shutil.copytree(self.app_root, sources[3])
+            with io.open(sources[2], "wb") as ostream:
+                ostream.write(b"not an app source package")
+            filename = path.join(root, "payloads.json")
+
+            with options(cache_directory_path=""):
+                messages, results = record(
+                    validate_many, sources, None, "note", False, worker_count
+                )
+            problems = self._get_problems(messages)
+            self.assertEqual([source for source, _ in results], sources)
+            self.assertEqual(
+                [payload["status"] == 0 for _, payload in results],
+                [True, False, False, True],
+            )
+
+            def save():
+                with self.assertRaises(SystemExit) as context:
+                    _save_batch(results, io.open(filename, "wb"))
+                return context.exception.code
+
+            saved, status = record(save)
+            self.assertEqual(status, 1)
+            with io.open(filename, encoding="utf-8") as istream:
+                value = json.load(istream)
+            self.assertEqual(
+                [payload["source"] for payload in value["payloads"]], sources
+            )
+            self.assertEqual(value["summary"], {"count": 4, "passed": 2, "failed": 2})
+            self.assertEqual(
+                saved[-2:],
+                [
+                    (logging.ERROR, 'App validation failed: "' + sources[i] + '"')
+                    for i in (1, 2)
+                ],
+            )
+
+            outcomes.append(
+                [(level, text.replace(root, "<root>")) for level, text in problems]
+            )
+
+        # workers replay the messages they log in source order, as if they were logged by this process
+        self.assertEqual(outcomes[1], outcomes[0])
+        self.assertEqual(
+            [level for level, _ in outcomes[0] if level >= logging.ERROR],
+            [logging.ERROR, logging.FATAL],
+        )
+
+    @staticmethod
+    def _get_problems(messages):
+        return [(level, text) for level, text in messages if level >= logging.WARN]
+
+
+if __name__ == "__main__":
+    unittest.main()